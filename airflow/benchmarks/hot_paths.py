@@ -0,0 +1,237 @@
+"""
+크롤러의 주요 경로(hot path)를 녹화된 페이지(fixtures)로 오프라인에서 측정합니다.
+
+- list_page.parse: 뉴스 목록 페이지에서 기사 URL 추출 (scrap_urls_from_webpage)
+- article.parse.{engine}: Raw HTML → News (PARSE_ENGINES)
+- article.scrap_news: crawler.scrap_news.scrap_news (HTTP 응답은 fixture로 대체)
+- news.model_dump_json / news.model_validate_json: News 직렬화/역직렬화
+- postgres.news_to_record: insert_news/bulk_insert_news의 행(record) 생성
+
+사용법 (airflow 디렉토리에서):
+    python benchmarks/hot_paths.py [--repeat N] [--filter TEXT]
+        [--save-baseline PATH] [--baseline PATH] [--tolerance 0.2]
+
+측정값: p50/p95/p99 지연 시간(us), 처리량(ops/s), 1회 실행 중 최대 메모리 할당량(peak KiB)
+(peak KiB는 tracemalloc 기준이므로 lxml(libxml2) 내부의 C 메모리는 포함하지 않음)
+
+--baseline을 지정하면 p50 지연 시간 또는 최대 메모리 할당량이
+기준값보다 tolerance 이상 늘어난 항목을 회귀로 보고 종료 코드 1을 반환합니다.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import statistics
+import sys
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable
+from datetime import datetime
+from pathlib import Path
+
+import httpx
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "plugins"))
+
+from clients.postgres_client import _news_to_record
+from crawler.scrap_news import scrap_news
+from models.news import News
+from pipelines.raw.urls_scraper import _parse_urls_from_list_page
+from pipelines.transformed.raw_transformer import PARSE_ENGINES
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+CRAWLED_AT = datetime(2025, 1, 1)
+
+
+def _percentile(sorted_values: list[float], q: float) -> float:
+    # nearest-rank
+    index = max(0, min(len(sorted_values) - 1, round(q * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def _summarize(timings_ns: list[int], peak_bytes: int) -> dict:
+    timings_us = sorted(t / 1000 for t in timings_ns)
+    mean_us = statistics.fmean(timings_us)
+    return {
+        "p50_us": round(_percentile(timings_us, 0.50), 3),
+        "p95_us": round(_percentile(timings_us, 0.95), 3),
+        "p99_us": round(_percentile(timings_us, 0.99), 3),
+        "ops_per_s": round(1_000_000 / mean_us, 1),
+        "peak_kib": round(peak_bytes / 1024, 1),
+    }
+
+
+def _measure(func: Callable[[], object], repeat: int, warmup: int) -> dict:
+    for _ in range(warmup):
+        func()
+
+    timings_ns = []
+    for _ in range(repeat):
+        started_at = time.perf_counter_ns()
+        func()
+        timings_ns.append(time.perf_counter_ns() - started_at)
+
+    # 할당량은 tracemalloc 오버헤드가 시간 측정에 섞이지 않도록 따로 한 번 측정
+    tracemalloc.start()
+    try:
+        baseline_bytes, _ = tracemalloc.get_traced_memory()
+        func()
+        _, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return _summarize(timings_ns, peak_bytes - baseline_bytes)
+
+
+def _measure_async(
+    func: Callable[[], Awaitable[object]], repeat: int, warmup: int
+) -> dict:
+    # 이벤트 루프 생성 비용이 섞이지 않도록 하나의 루프에서 반복
+    loop = asyncio.new_event_loop()
+    try:
+        return _measure(lambda: loop.run_until_complete(func()), repeat, warmup)
+    finally:
+        loop.close()
+
+
+def _fixture_transport(pages: dict[str, bytes]) -> httpx.MockTransport:
+    def handler(request: httpx.Request) -> httpx.Response:
+        news_id = request.url.params.get("newsId", "")
+        return httpx.Response(
+            200,
+            content=pages[news_id],
+            headers={"Content-Type": "text/html; charset=utf-8"},
+        )
+
+    return httpx.MockTransport(handler)
+
+
+def _article_url(news_id: str) -> str:
+    return f"https://www.korea.kr/news/policyNewsView.do?newsId={news_id}"
+
+
+def build_benchmarks(fixtures_dir: Path) -> dict[str, tuple[bool, Callable]]:
+    """
+    벤치마크 이름 → (비동기 여부, 인자 없는 함수)
+    """
+    benchmarks: dict[str, tuple[bool, Callable]] = {}
+
+    for path in sorted((fixtures_dir / "list_pages").glob("*.html")):
+        content = path.read_bytes()
+        benchmarks[f"list_page.parse[{path.stem}]"] = (
+            False,
+            lambda content=content: _parse_urls_from_list_page(content),
+        )
+
+    article_paths = sorted((fixtures_dir / "articles").glob("*.html"))
+    pages = {path.stem: path.read_bytes() for path in article_paths}
+    client = httpx.AsyncClient(transport=_fixture_transport(pages))
+
+    for news_id, raw_html_content in pages.items():
+        url = _article_url(news_id)
+        for engine, parser in PARSE_ENGINES.items():
+            benchmarks[f"article.parse.{engine}[{news_id}]"] = (
+                False,
+                lambda parser=parser, raw=raw_html_content, url=url: parser(
+                    raw, url, CRAWLED_AT
+                ),
+            )
+        benchmarks[f"article.scrap_news[{news_id}]"] = (
+            True,
+            lambda url=url: scrap_news(url, client),
+        )
+
+        news = PARSE_ENGINES["bs4"](raw_html_content, url, CRAWLED_AT)
+        news_json = news.model_dump_json()
+        benchmarks[f"news.model_dump_json[{news_id}]"] = (
+            False,
+            news.model_dump_json,
+        )
+        benchmarks[f"news.model_validate_json[{news_id}]"] = (
+            False,
+            lambda news_json=news_json: News.model_validate_json(news_json),
+        )
+        benchmarks[f"postgres.news_to_record[{news_id}]"] = (
+            False,
+            lambda news=news: _news_to_record(news),
+        )
+
+    return benchmarks
+
+
+def compare_with_baseline(
+    results: dict[str, dict], baseline: dict[str, dict], tolerance: float
+) -> list[str]:
+    """
+    p50 지연 시간 또는 최대 할당량이 기준값보다 tolerance 이상 늘어난 항목을 반환합니다.
+    """
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        for metric in ("p50_us", "peak_kib"):
+            before, after = baseline[name][metric], result[metric]
+            if before > 0 and after > before * (1 + tolerance):
+                regressions.append(
+                    f"{name}: {metric} {before} -> {after} (+{(after / before - 1) * 100:.0f}%)"
+                )
+    return regressions
+
+
+def main() -> int:
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument("--fixtures", type=Path, default=FIXTURES_DIR)
+    arg_parser.add_argument("--repeat", type=int, default=200)
+    arg_parser.add_argument("--warmup", type=int, default=10)
+    arg_parser.add_argument("--filter", default="")
+    arg_parser.add_argument("--save-baseline", type=Path)
+    arg_parser.add_argument("--baseline", type=Path)
+    arg_parser.add_argument("--tolerance", type=float, default=0.2)
+    args = arg_parser.parse_args()
+
+    # 파서 내부의 기사 단위 로그는 측정에서 제외
+    logging.disable(logging.CRITICAL)
+
+    benchmarks = {
+        name: benchmark
+        for name, benchmark in build_benchmarks(args.fixtures).items()
+        if args.filter in name
+    }
+    if not benchmarks:
+        print(f"No benchmarks matched in {args.fixtures}")
+        return 1
+
+    results = {}
+    print(
+        f"{'benchmark':<44}{'p50 us':>11}{'p95 us':>11}{'p99 us':>11}"
+        f"{'ops/s':>11}{'peak KiB':>10}"
+    )
+    for name, (is_async, func) in benchmarks.items():
+        measure = _measure_async if is_async else _measure
+        result = measure(func, args.repeat, args.warmup)
+        results[name] = result
+        print(
+            f"{name:<44}{result['p50_us']:>11.1f}{result['p95_us']:>11.1f}"
+            f"{result['p99_us']:>11.1f}{result['ops_per_s']:>11.1f}"
+            f"{result['peak_kib']:>10.1f}"
+        )
+
+    if args.save_baseline:
+        args.save_baseline.write_text(json.dumps(results, indent=2) + "\n")
+        print(f"Saved baseline to {args.save_baseline}")
+
+    if args.baseline:
+        regressions = compare_with_baseline(
+            results, json.loads(args.baseline.read_text()), args.tolerance
+        )
+        if regressions:
+            print(f"{len(regressions)} regression(s) against {args.baseline}:")
+            for regression in regressions:
+                print(f"  {regression}")
+            return 1
+        print(f"No regressions against {args.baseline}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,94 @@
+"""
+PARSE_ENGINES의 각 엔진(lxml, partial)이 _parse_raw_html(bs4)과 같은 결과를 내는지(parity)와
+파싱 속도를 비교합니다.
+
+사용법 (airflow 디렉토리에서):
+    python benchmarks/parse_parity.py [--fixtures DIR] [--repeat N]
+
+fixtures 디렉토리의 {newsId}.html 파일을 기사 페이지로 사용합니다.
+결과가 하나라도 다르면 종료 코드 1을 반환합니다.
+"""
+
+import argparse
+import logging
+import statistics
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "plugins"))
+
+from pipelines.transformed.raw_transformer import PARSE_ENGINES
+
+DEFAULT_FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures" / "articles"
+CRAWLED_AT = datetime(2025, 1, 1)
+
+
+def _time_parser(parser, raw_html_content: bytes, url: str, repeat: int) -> list[float]:
+    timings = []
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        parser(raw_html_content, url, CRAWLED_AT)
+        timings.append((time.perf_counter() - started_at) * 1000)
+    return timings
+
+
+def main() -> int:
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument("--fixtures", type=Path, default=DEFAULT_FIXTURES_DIR)
+    arg_parser.add_argument("--repeat", type=int, default=50)
+    args = arg_parser.parse_args()
+
+    # 파서 내부의 기사 단위 로그는 측정에서 제외
+    logging.disable(logging.CRITICAL)
+
+    fixture_paths = sorted(args.fixtures.glob("*.html"))
+    if not fixture_paths:
+        print(f"No fixtures found in {args.fixtures}")
+        return 1
+
+    baseline = PARSE_ENGINES["bs4"]
+    engines = {name: parser for name, parser in PARSE_ENGINES.items() if name != "bs4"}
+
+    mismatches = 0
+    totals = dict.fromkeys(PARSE_ENGINES, 0.0)
+    header = f"{'fixture':<24}{'bs4 ms':>10}"
+    for name in engines:
+        header += f"{name + ' ms':>12}{'speedup':>9}{'parity':>8}"
+    print(header)
+    for path in fixture_paths:
+        raw_html_content = path.read_bytes()
+        url = f"https://www.korea.kr/news/policyNewsView.do?newsId={path.stem}"
+        expected = baseline(raw_html_content, url, CRAWLED_AT)
+
+        bs4_ms = statistics.median(
+            _time_parser(baseline, raw_html_content, url, args.repeat)
+        )
+        totals["bs4"] += bs4_ms
+        row = f"{path.name:<24}{bs4_ms:>10.3f}"
+        for name, parser in engines.items():
+            same = parser(raw_html_content, url, CRAWLED_AT) == expected
+            mismatches += not same
+            engine_ms = statistics.median(
+                _time_parser(parser, raw_html_content, url, args.repeat)
+            )
+            totals[name] += engine_ms
+            row += (
+                f"{engine_ms:>12.3f}{bs4_ms / engine_ms:>8.1f}x"
+                f"{'OK' if same else 'DIFF':>8}"
+            )
+        print(row)
+
+    row = f"{'total':<24}{totals['bs4']:>10.3f}"
+    for name in engines:
+        row += f"{totals[name]:>12.3f}{totals['bs4'] / totals[name]:>8.1f}x{'':>8}"
+    print(row)
+    if mismatches:
+        print(f"{mismatches} fixture/engine pair(s) produced different News objects.")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
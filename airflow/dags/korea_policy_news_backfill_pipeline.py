@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import asyncio
+import os
+from collections import Counter
+from datetime import timedelta
+
+import pendulum
+from airflow.decorators import dag, task
+from airflow.models.param import Param
+
+# plugins 폴더에서 파이프라인의 각 단계를 구성하는 함수들을 직접 import 합니다.
+from pipelines.backfill import run_backfill_partition, split_date_range
+from pipelines.dag_support import env_configs, sanitize_run_id, task_metrics
+
+# 동시에 실행되는 파티션 수의 상한 (이 DAG의 모든 실행을 합친 값)
+BACKFILL_MAX_ACTIVE_PARTITIONS = int(os.getenv("BACKFILL_MAX_ACTIVE_PARTITIONS", "4"))
+# 파티션 하나가 출처 서버에 보내는 최대 동시 요청 수
+BACKFILL_FETCH_CONCURRENCY = int(os.getenv("BACKFILL_FETCH_CONCURRENCY", "4"))
+
+
+@dag(
+    dag_id="korea_policy_news_backfill_pipeline",
+    start_date=pendulum.datetime(2024, 7, 16, tz="Asia/Seoul"),
+    schedule=None,
+    catchup=False,
+    max_active_runs=1,
+    params={
+        "start_date": Param(
+            pendulum.today("Asia/Seoul").subtract(days=30).to_date_string(),
+            type="string",
+            title="Backfill Start Date",
+        ),
+        "end_date": Param(
+            pendulum.today("Asia/Seoul").to_date_string(),
+            type="string",
+            title="Backfill End Date",
+        ),
+        "partition_days": Param(
+            7,
+            type="integer",
+            minimum=1,
+            title="Partition Days",
+            description="파티션 하나가 수집하는 기간(일)입니다.",
+        ),
+        "force_recrawl": Param(
+            False,
+            type="boolean",
+            title="Force Recrawl",
+            description="이미 적재되었거나 내용이 바뀌지 않은 기사도 체크포인트와 관계없이 다시 수집합니다.",
+        ),
+    },
+    doc_md=f"""
+    긴 기간의 뉴스 기사를 다시 수집하는 백필 파이프라인입니다.
+    기간을 partition_days 일 단위의 파티션으로 나누고 (dynamic task mapping),
+    파티션마다 수집 → MinIO 저장 → 변환 → PostgreSQL 적재를 스트리밍으로 실행합니다.
+    동시에 실행되는 파티션은 최대 {BACKFILL_MAX_ACTIVE_PARTITIONS}개
+    (BACKFILL_MAX_ACTIVE_PARTITIONS), 파티션별 동시 요청은 최대
+    {BACKFILL_FETCH_CONCURRENCY}개 (BACKFILL_FETCH_CONCURRENCY)입니다.
+    실패한 파티션은 같은 실행의 체크포인트부터 재시도됩니다.
+    """,
+)
+def korea_policy_news_backfill_dag():
+    @task
+    def get_configs(**context):
+        """
+        Airflow 파라미터와 환경 변수에서 설정을 가져옵니다.
+        """
+        return {
+            **env_configs(),
+            "force_recrawl": context["params"]["force_recrawl"],
+        }
+
+    @task
+    def plan_partitions(**context) -> list[dict]:
+        """백필 기간을 파티션 목록으로 나눕니다."""
+        params = context["params"]
+        partitions = split_date_range(
+            params["start_date"], params["end_date"], params["partition_days"]
+        )
+        print(f"Planned {len(partitions)} partitions.")
+        return partitions
+
+    @task(
+        max_active_tis_per_dag=BACKFILL_MAX_ACTIVE_PARTITIONS,
+        retries=2,
+        retry_delay=timedelta(minutes=5),
+    )
+    def crawl_partition(partition: dict, configs: dict, **context) -> dict:
+        """파티션 기간의 기사를 수집하여 MinIO와 PostgreSQL에 적재합니다."""
+        with task_metrics(configs, context):
+            return asyncio.run(
+                run_backfill_partition(
+                    configs,
+                    partition,
+                    run_id=sanitize_run_id(context["run_id"]),
+                    force_recrawl=configs["force_recrawl"],
+                    fetch_concurrency=BACKFILL_FETCH_CONCURRENCY,
+                )
+            )
+
+    @task(trigger_rule="all_done")
+    def summarize(results: list[dict]) -> dict:
+        """파티션별 처리 건수를 합산합니다. (실패한 파티션은 결과가 없음)"""
+        totals: Counter = Counter()
+        completed = 0
+        for result in results:
+            if result is None:
+                continue
+            completed += 1
+            totals.update(result["counts"])
+        print(f"{completed} partitions completed: {dict(totals)}")
+        return {"partitions": completed, "counts": dict(totals)}
+
+    configs = get_configs()
+    results = crawl_partition.partial(configs=configs).expand(
+        partition=plan_partitions()
+    )
+    summarize(results)
+
+
+korea_policy_news_backfill_dag()
@@ -1,21 +1,28 @@
 from __future__ import annotations
 
 import asyncio
-import os
 from datetime import datetime
 
 import pendulum
+from airflow.decorators import dag, task, task_group
+from airflow.models.param import Param
 
 # plugins 폴더에서 파이프라인의 각 단계를 구성하는 함수들을 직접 import 합니다.
-from pipelines.raw.minio_loader import load_raws_to_minio
-from pipelines.raw.raw_scraper import scrap_raw_html_batch
+from pipelines.checkpoint import DONE_STAGE, load_checkpoint, save_checkpoint
+from pipelines.dag_support import env_configs, sanitize_run_id, task_metrics
+from pipelines.raw.content_index import record_loaded_hashes
+from pipelines.raw.incremental import SeenNewsIndex, filter_unseen_urls
+from pipelines.raw.minio_loader import scrap_and_load_raws_to_minio
 from pipelines.raw.urls_scraper import scrap_urls_from_webpage
-from pipelines.transformed.minio_extractor import extract_raws_from_minio
+from pipelines.transformed.elasticsearch_loader import (
+    load_transforms_to_elasticsearch,
+)
 from pipelines.transformed.postgres_loader import load_transforms_to_postgres
-from pipelines.transformed.raw_transformer import transform_raws
-
-from airflow.decorators import dag, task, task_group
-from airflow.models.param import Param
+from pipelines.transformed.transformed_store import (
+    extract_transforms_from_minio,
+    transform_raws_in_minio,
+)
+from utils.http_cache import HttpCache
 
 
 @dag(
@@ -35,6 +42,12 @@ from airflow.models.param import Param
             type="string",
             title="Crawling End Date",
         ),
+        "force_recrawl": Param(
+            False,
+            type="boolean",
+            title="Force Recrawl",
+            description="이미 적재된 기사도 다시 수집합니다.",
+        ),
     },
     doc_md="""
     대한민국 정책 브리핑(https://www.korea.kr/)의 뉴스 기사를 
@@ -50,63 +63,91 @@ def korea_policy_news_crawling_dag():
         (실제 운영 환경에서는 Airflow Variable과 Connection 사용을 권장합니다.)
         """
         return {
-            "korea_kr_base_url": os.getenv("KOREA_KR_BASE_URL"),
-            "korea_kr_list_path": os.getenv("KOREA_KR_LIST_PATH"),
+            **env_configs(),
             "crawling_start_date": context["params"]["start_date"],
             "crawling_end_date": context["params"]["end_date"],
-            "minio_endpoint": os.getenv("MINIO_ENDPOINT", "minio:9000"),
-            "minio_raw_news_bucket": os.getenv("MINIO_RAW_NEWS_BUCKET", "raw-news"),
-            "minio_access_key": os.getenv("MINIO_ACCESS_KEY", "myuser"),
-            "minio_secret_key": os.getenv("MINIO_SECRET_KEY", "mypassword"),
-            "pg_host": os.getenv("POSTGRES_HOST", "postgresql"),
-            "pg_port": os.getenv("POSTGRES_PORT", "5432"),
-            "pg_user": os.getenv("POSTGRES_USER", "myuser"),
-            "pg_password": os.getenv("POSTGRES_PASSWORD", "mypassword"),
-            "pg_dbname": os.getenv("POSTGRES_DBNAME", "mydatabase"),
+            "force_recrawl": context["params"]["force_recrawl"],
         }
 
     @task_group(group_id="data_lake_pipeline")  # type: ignore[arg-type]
     def data_lake_pipeline_group(configs: dict):
         """
         뉴스 URL을 추출하고, Raw HTML을 스크랩하여 MinIO (Data Lake)에 적재하는 그룹입니다.
+        태스크 사이에는 기사 본문이 아닌 MinIO 객체 정보(manifest)만 XCom으로 전달합니다.
         """
 
         @task
-        def extract_news_urls(configs: dict) -> list[str]:
-            """웹페이지에서 뉴스 기사 URL 목록을 추출합니다."""
-            urls = scrap_urls_from_webpage(
-                url=f"{configs['korea_kr_base_url']}{configs['korea_kr_list_path']}",
-                start_date=configs["crawling_start_date"],
-                end_date=configs["crawling_end_date"],
-            )
-            return urls
+        def extract_news_urls(configs: dict, **context) -> list[str]:
+            """웹페이지에서 뉴스 기사 URL 목록을 추출하고, 이미 적재된 기사는 제외합니다."""
+            with task_metrics(configs, context):
+                urls = scrap_urls_from_webpage(
+                    url=f"{configs['korea_kr_base_url']}{configs['korea_kr_list_path']}",
+                    start_date=configs["crawling_start_date"],
+                    end_date=configs["crawling_end_date"],
+                )
+                if configs["force_recrawl"] or not urls:
+                    return urls
 
-        @task
-        def scrap_raw_html(news_urls: list[str]) -> list:
-            """URL 목록을 받아 Raw HTML을 스크랩합니다."""
-            if not news_urls:
-                return []
-            return asyncio.run(scrap_raw_html_batch(news_urls))
+                seen_index = asyncio.run(
+                    SeenNewsIndex.load_from_postgres(
+                        pg_host=configs["pg_host"],
+                        pg_port=configs["pg_port"],
+                        pg_user=configs["pg_user"],
+                        pg_password=configs["pg_password"],
+                        pg_dbname=configs["pg_dbname"],
+                        start_date=configs["crawling_start_date"],
+                        end_date=configs["crawling_end_date"],
+                        search_index=configs["pg_search_index"],
+                        partitioned=configs["pg_partitioned"],
+                    )
+                )
+                return filter_unseen_urls(urls, seen_index)
 
         @task
-        def load_raw_to_minio(scraped_data: list, configs: dict) -> list:
-            """스크랩한 Raw HTML를 MinIO에 업로드합니다."""
-            if not scraped_data:
-                return []
-            uploaded_objects = asyncio.run(
-                load_raws_to_minio(
-                    minio_endpoint=configs["minio_endpoint"],
-                    minio_access_key=configs["minio_access_key"],
-                    minio_secret_key=configs["minio_secret_key"],
-                    minio_bucket_name=configs["minio_raw_news_bucket"],
-                    scraped_raw_data=scraped_data,
+        def scrap_raw_html_to_minio(
+            news_urls: list[str], configs: dict, **context
+        ) -> list:
+            """
+            URL 목록을 받아 Raw HTML을 스크랩하고 곧바로 MinIO에 업로드합니다.
+            같은 DAG Run을 재시도하면 체크포인트에 저장된 기사는 다시 스크랩하지 않습니다.
+            (force_recrawl이면 체크포인트를 무시하고 모두 다시 스크랩)
+            """
+            with task_metrics(configs, context):
+                if not news_urls:
+                    return []
+                checkpoint = (
+                    asyncio.run(
+                        load_checkpoint(
+                            minio_endpoint=configs["minio_endpoint"],
+                            minio_bucket_name=configs["minio_raw_news_bucket"],
+                            minio_access_key=configs["minio_access_key"],
+                            minio_secret_key=configs["minio_secret_key"],
+                            run_key=sanitize_run_id(context["run_id"]),
+                            fresh=configs["force_recrawl"],
+                        )
+                    )
+                    if configs["pipeline_checkpoint"]
+                    else None
+                )
+                return asyncio.run(
+                    scrap_and_load_raws_to_minio(
+                        page_urls=news_urls,
+                        minio_endpoint=configs["minio_endpoint"],
+                        minio_access_key=configs["minio_access_key"],
+                        minio_secret_key=configs["minio_secret_key"],
+                        minio_bucket_name=configs["minio_raw_news_bucket"],
+                        http_cache=HttpCache.from_env(),
+                        skip_unchanged=configs["http_cache_skip_unchanged"],
+                        codec=configs["minio_raw_codec"],
+                        layout=configs["minio_raw_layout"],
+                        dedup_content=configs["minio_raw_dedup"]
+                        and not configs["force_recrawl"],
+                        checkpoint=checkpoint,
+                    )
                 )
-            )
-            return uploaded_objects
 
         urls = extract_news_urls(configs)
-        scraped_data = scrap_raw_html(urls)  # type: ignore[arg-type]
-        minio_objects = load_raw_to_minio(scraped_data, configs)  # type: ignore[arg-type]
+        minio_objects = scrap_raw_html_to_minio(urls, configs)  # type: ignore[arg-type]
         return minio_objects  # Return the output for the next stage
 
     @task_group(group_id="data_warehouse_pipeline")
@@ -114,54 +155,106 @@ def korea_policy_news_crawling_dag():
         """MinIO에서 데이터를 추출, 변환하고 PostgreSQL (Data Warehouse)에 적재하는 그룹입니다."""
 
         @task
-        def extract_raw_from_minio(objects_to_extract: list, configs: dict) -> list:
-            """MinIO에서 원시 데이터를 추출합니다."""
-            if not objects_to_extract:
-                return []
-            return asyncio.run(
-                extract_raws_from_minio(
-                    minio_endpoint=configs["minio_endpoint"],
-                    minio_access_key=configs["minio_access_key"],
-                    minio_secret_key=configs["minio_secret_key"],
-                    minio_bucket_name=configs["minio_raw_news_bucket"],
-                    minio_objects_to_extract=objects_to_extract,
+        def transform_raw_from_minio(
+            objects_to_transform: list, configs: dict, **context
+        ) -> dict:
+            """MinIO의 원시 데이터를 변환하여 결과를 MinIO에 저장합니다."""
+            with task_metrics(configs, context):
+                if not objects_to_transform:
+                    return {"minio_path": None, "news_ids": [], "count": 0}
+                run_id = sanitize_run_id(context["run_id"])
+                return asyncio.run(
+                    transform_raws_in_minio(
+                        minio_endpoint=configs["minio_endpoint"],
+                        minio_access_key=configs["minio_access_key"],
+                        minio_secret_key=configs["minio_secret_key"],
+                        minio_raw_bucket_name=configs["minio_raw_news_bucket"],
+                        minio_transformed_bucket_name=configs[
+                            "minio_transformed_news_bucket"
+                        ],
+                        minio_objects_to_transform=objects_to_transform,
+                        transformed_object_name=f"{run_id}.ndjson",
+                        transform_max_workers=configs["transform_max_workers"],
+                        transform_engine=configs["transform_engine"],
+                    )
                 )
-            )
 
         @task
-        def transform_raw_data(raw_data: list) -> list:
-            """원시 데이터를 구조화된 데이터로 변환합니다."""
-            if not raw_data:
-                return []
-            return asyncio.run(transform_raws(raw_data))
+        def load_to_postgres(
+            transformed_manifest: dict, minio_objects: list, configs: dict, **context
+        ):
+            """
+            MinIO에 저장된 변환 데이터를 PostgreSQL에 적재합니다.
+            (ELASTICSEARCH_BULK_ENABLED=true이면 적재된 기사를 Elasticsearch에도 색인)
+            MINIO_RAW_DEDUP=true이면 적재된 기사의 Raw HTML 해시를 기록합니다.
+            """
+            with task_metrics(configs, context):
+                if not transformed_manifest["count"]:
+                    print("No transformed data to load.")
+                    return
 
-        @task
-        def load_to_postgres(transformed_data: list, configs: dict):
-            """변환된 데이터를 PostgreSQL에 적재합니다."""
-            if not transformed_data:
-                print("No transformed data to load.")
-                return
-            asyncio.run(
-                load_transforms_to_postgres(
-                    news_items=transformed_data,
-                    pg_host=configs["pg_host"],
-                    pg_port=configs["pg_port"],
-                    pg_user=configs["pg_user"],
-                    pg_password=configs["pg_password"],
-                    pg_dbname=configs["pg_dbname"],
-                )
-            )
+                async def _load():
+                    transformed_data = await extract_transforms_from_minio(
+                        minio_endpoint=configs["minio_endpoint"],
+                        minio_access_key=configs["minio_access_key"],
+                        minio_secret_key=configs["minio_secret_key"],
+                        minio_transformed_bucket_name=configs[
+                            "minio_transformed_news_bucket"
+                        ],
+                        transformed_manifest=transformed_manifest,
+                    )
+                    loaded_news_ids = await load_transforms_to_postgres(
+                        news_items=transformed_data,
+                        pg_host=configs["pg_host"],
+                        pg_port=configs["pg_port"],
+                        pg_user=configs["pg_user"],
+                        pg_password=configs["pg_password"],
+                        pg_dbname=configs["pg_dbname"],
+                        search_index=configs["pg_search_index"],
+                        partitioned=configs["pg_partitioned"],
+                    )
+                    if configs["es_bulk_enabled"] and loaded_news_ids:
+                        # 적재된 기사를 Elasticsearch에 바로 색인
+                        await load_transforms_to_elasticsearch(
+                            news_items=transformed_data,
+                            es_host=configs["es_host"],
+                            news_ids=loaded_news_ids,
+                            index_prefix=configs["es_index_prefix"],
+                            max_concurrency=configs["es_bulk_concurrency"],
+                        )
+                    minio_configs = {
+                        "minio_endpoint": configs["minio_endpoint"],
+                        "minio_bucket_name": configs["minio_raw_news_bucket"],
+                        "minio_access_key": configs["minio_access_key"],
+                        "minio_secret_key": configs["minio_secret_key"],
+                    }
+                    if configs["minio_raw_dedup"]:
+                        await record_loaded_hashes(
+                            **minio_configs,
+                            minio_objects=minio_objects,
+                            loaded_news_ids=loaded_news_ids,
+                        )
+                    if not configs["pipeline_checkpoint"]:
+                        return
+                    # 적재된 기사를 완료로 기록 (모두 완료되면 체크포인트 삭제)
+                    checkpoint = await load_checkpoint(
+                        **minio_configs, run_key=sanitize_run_id(context["run_id"])
+                    )
+                    for news_id in loaded_news_ids:
+                        checkpoint.mark(news_id, DONE_STAGE)
+                    await save_checkpoint(checkpoint, **minio_configs)
+
+                asyncio.run(_load())
 
         # Task Group 내의 데이터 흐름을 정의합니다.
-        raw_data = extract_raw_from_minio(minio_objects, configs)
-        transformed_data = transform_raw_data(raw_data)  # type: ignore[arg-type]
-        load_to_postgres(transformed_data, configs)  # type: ignore[arg-type]
+        transformed_manifest = transform_raw_from_minio(minio_objects, configs)  # type: ignore[arg-type]
+        load_to_postgres(transformed_manifest, minio_objects, configs)  # type: ignore[arg-type]
 
     # === DAG의 전체 워크플로우를 정의합니다 ===
     configs = get_configs()
     minio_objects_from_lake = data_lake_pipeline_group(configs)  # type: ignore[arg-type]
 
-    # load_raw_to_minio 태스크가 성공적으로 끝나면 transform_and_load_group을 실행합니다.
+    # scrap_raw_html_to_minio 태스크가 성공적으로 끝나면 transform_and_load_group을 실행합니다.
     data_warehouse_pipeline_group(minio_objects_from_lake, configs)  # type: ignore[arg-type]
 
 
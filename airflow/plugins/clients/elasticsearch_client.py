@@ -0,0 +1,51 @@
+import logging
+
+import httpx
+from utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+
+class ElasticsearchClient:
+    def __init__(
+        self,
+        host: str,
+        max_concurrency: int = 4,
+        timeout: float = 60.0,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        """
+        Elasticsearch REST API를 호출하는 비동기 클라이언트
+        동시 요청 수만큼 커넥션을 재사용하며,
+        transport를 지정하면 실제 서버 대신 다른 전송 계층(테스트용 stand-in 등)을 사용합니다.
+        """
+        self.host = host.rstrip("/")
+        self.client = httpx.AsyncClient(
+            base_url=self.host,
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_concurrency,
+                max_keepalive_connections=max_concurrency,
+            ),
+            transport=transport,
+        )
+
+    async def bulk(self, body: bytes) -> dict:
+        """
+        _bulk API로 NDJSON 본문을 전송하고 응답(JSON)을 반환합니다.
+        요청 전체가 실패하면 httpx.HTTPStatusError를 발생시키며,
+        문서별 결과는 응답의 items에서 확인합니다.
+        """
+        with metrics.timer("es_bulk"):
+            response = await self.client.post(
+                "/_bulk",
+                content=body,
+                headers={"Content-Type": "application/x-ndjson"},
+            )
+        response.raise_for_status()
+        metrics.add_bytes("es_bulk", len(body))
+        logger.debug("Sent %s bytes to Elasticsearch _bulk API.", len(body))
+        return response.json()
+
+    async def close(self) -> None:
+        await self.client.aclose()
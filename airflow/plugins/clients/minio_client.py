@@ -1,10 +1,20 @@
+import asyncio
+import functools
 import io
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 
+import urllib3
 from minio import Minio, S3Error
+from minio.error import MinioException
+from utils.metrics import metrics
 
 logger = logging.getLogger(__name__)
 
+# MinIO 요청이 실패할 때 발생하는 예외 (S3 오류 응답, 비정상 응답, 연결/재시도 실패)
+MINIO_ERRORS = (MinioException, urllib3.exceptions.HTTPError, OSError)
+
 
 class MinioClient:
     def __init__(
@@ -13,13 +23,80 @@ class MinioClient:
         access_key,
         secret_key,
         secure=False,
+        max_concurrency: int = 32,
     ):
+        """
+        blocking SDK(minio.Minio) 호출을 제한된 크기의 스레드 풀에서 실행하여
+        이벤트 루프를 막지 않고 최대 max_concurrency 개의 요청을 동시에 처리합니다.
+        """
+        self.max_concurrency = max_concurrency
+        # 동시 요청 수만큼 커넥션을 재사용할 수 있도록 풀 크기를 맞춤
+        self._http = urllib3.PoolManager(
+            timeout=urllib3.Timeout(connect=300, read=300),
+            maxsize=max_concurrency,
+            cert_reqs="CERT_REQUIRED",
+            ca_certs=os.environ.get("SSL_CERT_FILE"),
+            retries=urllib3.Retry(
+                total=5,
+                backoff_factor=0.2,
+                status_forcelist=[500, 502, 503, 504],
+            ),
+        )
         self.client = Minio(
             endpoint,
             access_key=access_key,
             secret_key=secret_key,
             secure=secure,
+            http_client=self._http,
         )
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency,
+            thread_name_prefix="minio",
+        )
+        # 클라이언트 수명 동안 존재가 확인된 버킷
+        self._checked_buckets: set[str] = set()
+        self._bucket_lock = asyncio.Lock()
+
+    async def _run(self, func, *args, **kwargs):
+        """
+        blocking 함수를 스레드 풀에서 실행하고 결과를 기다립니다.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(func, *args, **kwargs)
+        )
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+        self._http.clear()
+
+    async def ensure_bucket(self, bucket_name: str) -> None:
+        """
+        버킷이 없을 경우 생성합니다.
+        한 번 확인된 버킷은 캐시되어 이후 호출 시 요청을 보내지 않습니다.
+        """
+        if bucket_name in self._checked_buckets:
+            return
+
+        async with self._bucket_lock:
+            if bucket_name in self._checked_buckets:
+                return
+            try:
+                await self._run(self._ensure_bucket_sync, bucket_name)
+            except S3Error as e:
+                logger.error(f"S3 Error during MinIO bucket check: {e}")
+                raise
+            self._checked_buckets.add(bucket_name)
+
+    def _ensure_bucket_sync(self, bucket_name: str) -> None:
+        if not self.client.bucket_exists(bucket_name):
+            try:
+                self.client.make_bucket(bucket_name)
+                logger.info(f"Bucket '{bucket_name}' created.")
+            except S3Error as e:
+                # 다른 워커가 먼저 생성한 경우
+                if e.code not in ("BucketAlreadyOwnedByYou", "BucketAlreadyExists"):
+                    raise
 
     async def upload_file(
         self,
@@ -30,20 +107,22 @@ class MinioClient:
         content_type: str = "application/octet-stream",
     ) -> None:
         try:
-            # 버킷이 없을 경우 생성
-            if not self.client.bucket_exists(bucket_name):
-                self.client.make_bucket(bucket_name)
-
-            self.client.put_object(
-                bucket_name=bucket_name,
-                object_name=object_name,
-                data=io.BytesIO(data),
-                metadata=metadata,
-                length=len(data),
-                content_type=content_type,
-            )
-            logger.info(
-                f"File '{object_name}' uploaded to bucket '{bucket_name}' successfully."
+            await self.ensure_bucket(bucket_name)
+            with metrics.timer("minio_put"):
+                await self._run(
+                    self._upload_file_sync,
+                    bucket_name,
+                    object_name,
+                    data,
+                    metadata,
+                    content_type,
+                )
+            metrics.inc("minio_put")
+            metrics.add_bytes("minio_put", len(data))
+            logger.debug(
+                "File '%s' uploaded to bucket '%s' successfully.",
+                object_name,
+                bucket_name,
             )
         except S3Error as e:
             logger.error(f"S3 Error during MinIO upload: {e}")
@@ -52,24 +131,44 @@ class MinioClient:
             logger.error(f"An unexpected error occurred during MinIO upload: {e}")
             raise
 
+    def _upload_file_sync(
+        self,
+        bucket_name: str,
+        object_name: str,
+        data: bytes,
+        metadata: dict,
+        content_type: str,
+    ) -> None:
+        self.client.put_object(
+            bucket_name=bucket_name,
+            object_name=object_name,
+            data=io.BytesIO(data),
+            metadata=metadata,
+            length=len(data),
+            content_type=content_type,
+        )
+
     async def download_file(
         self,
         bucket_name: str,
         object_name: str,
+        offset: int = 0,
+        length: int = 0,
     ) -> tuple[bytes, dict]:
+        """
+        객체를 다운로드합니다. length를 지정하면 offset부터 length 바이트만 요청합니다. (ranged GET)
+        """
         try:
-            res = self.client.get_object(bucket_name, object_name)
-            content = res.read()
-            # 사용자 정의 메타데이터 재정의
-            retrieved_metadata = {}
-            for key, value in res.headers.items():
-                if key.lower().startswith("x-amz-meta-"):
-                    original_key = key[len("x-amz-meta-") :]
-                    retrieved_metadata[original_key] = value
-            res.close()
-            res.release_conn()
-            logger.info(
-                f"File '{object_name}' downloaded from bucket '{bucket_name}' successfully."
+            with metrics.timer("minio_get"):
+                content, retrieved_metadata = await self._run(
+                    self._download_file_sync, bucket_name, object_name, offset, length
+                )
+            metrics.inc("minio_get")
+            metrics.add_bytes("minio_get", len(content))
+            logger.debug(
+                "File '%s' downloaded from bucket '%s' successfully.",
+                object_name,
+                bucket_name,
             )
             return content, retrieved_metadata
         except S3Error as e:
@@ -78,3 +177,39 @@ class MinioClient:
         except Exception as e:
             logger.error(f"An unexpected error occurred during MinIO download: {e}")
             raise
+
+    async def delete_file(self, bucket_name: str, object_name: str) -> None:
+        try:
+            await self._run(self.client.remove_object, bucket_name, object_name)
+            logger.debug(
+                "File '%s' deleted from bucket '%s' successfully.",
+                object_name,
+                bucket_name,
+            )
+        except S3Error as e:
+            logger.error(f"S3 Error during MinIO delete: {e}")
+            raise
+
+    def _download_file_sync(
+        self,
+        bucket_name: str,
+        object_name: str,
+        offset: int = 0,
+        length: int = 0,
+    ) -> tuple[bytes, dict]:
+        res = self.client.get_object(
+            bucket_name, object_name, offset=offset, length=length
+        )
+        try:
+            content = res.read()
+            # 사용자 정의 메타데이터 재정의
+            # (서버가 헤더 이름의 대소문자를 바꿔 돌려주므로 소문자로 통일)
+            retrieved_metadata = {}
+            for key, value in res.headers.items():
+                if key.lower().startswith("x-amz-meta-"):
+                    original_key = key[len("x-amz-meta-") :].lower()
+                    retrieved_metadata[original_key] = value
+        finally:
+            res.close()
+            res.release_conn()
+        return content, retrieved_metadata
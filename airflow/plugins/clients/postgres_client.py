@@ -1,12 +1,155 @@
+import hashlib
 import json
 import logging
+import re
+from datetime import datetime
 
 import asyncpg
-
 from models.news import News
+from utils.metrics import metrics
 
 logger = logging.getLogger(__name__)
 
+NEWS_COLUMNS = (
+    "id",
+    "title",
+    "subtitles",
+    "publisher",
+    "contents",
+    "images",
+    "url",
+    "published_at",
+    "crawled_at",
+    "content_fingerprint",
+)
+
+# 행이 추가/변경될 때마다 증가하는 변경 순번 (같은 트랜잭션 안의 변경 순서)
+# 증분 내보내기의 watermark는 행을 마지막으로 바꾼 트랜잭션 ID(change_txid)
+NEWS_CHANGE_SEQUENCE = "news_change_seq"
+
+# 월 단위 파티션의 경계를 정하는 시간대 (기사 게시일 기준)
+NEWS_PARTITION_TIMEZONE = "Asia/Seoul"
+# 동시에 실행되는 적재 작업의 news 테이블/파티션 생성을 직렬화하는 advisory lock 키
+_NEWS_PARTITION_LOCK_KEY = "news_partitions"
+
+_NEWS_TABLE_COLUMNS = f"""
+    id BIGINT NOT NULL,
+    title TEXT NOT NULL,
+    subtitles TEXT[],
+    publisher TEXT,
+    contents TEXT NOT NULL,
+    images JSONB[],
+    url TEXT NOT NULL,
+    published_at TIMESTAMP WITH TIME ZONE NOT NULL,
+    crawled_at TIMESTAMP WITH TIME ZONE NOT NULL,
+    content_fingerprint TEXT,
+    updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+    change_seq BIGINT NOT NULL DEFAULT nextval('{NEWS_CHANGE_SEQUENCE}'),
+    change_txid BIGINT NOT NULL DEFAULT txid_current()
+"""
+
+# 테이블이 처음 만들어진 뒤 추가된 컬럼 (기존 테이블에 없을 때만 추가)
+_NEWS_ADDED_COLUMNS = {
+    "content_fingerprint": "TEXT",
+    "updated_at": "TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now()",
+    "change_seq": f"BIGINT NOT NULL DEFAULT nextval('{NEWS_CHANGE_SEQUENCE}')",
+    "change_txid": "BIGINT NOT NULL DEFAULT txid_current()",
+}
+
+# ON CONFLICT 발생 시 갱신할 컬럼 (변경 시각, 변경 순번, 변경한 트랜잭션 ID도 함께 갱신)
+_NEWS_UPSERT_SET = ",\n".join(
+    [f"{column} = EXCLUDED.{column}" for column in NEWS_COLUMNS if column != "id"]
+    + [
+        "updated_at = now()",
+        f"change_seq = nextval('{NEWS_CHANGE_SEQUENCE}')",
+        "change_txid = txid_current()",
+    ]
+)
+# 내용이 바뀐 행만 갱신 (같은 기사를 다시 적재해도 행을 새로 쓰지 않음)
+_NEWS_UPSERT_WHERE = (
+    "news.content_fingerprint IS DISTINCT FROM EXCLUDED.content_fingerprint"
+)
+
+
+# 검색용 tsvector 설정: 형태소 분석기 없이 어절 + 한글 bigram으로 색인
+NEWS_SEARCH_CONFIG = "simple"
+# news.search_vector 생성에 사용하는 IMMUTABLE 함수 (생성 컬럼에는 IMMUTABLE 함수만 사용 가능)
+_NEWS_SEARCH_FUNCTIONS = r"""
+CREATE OR REPLACE FUNCTION news_array_to_text(items TEXT[])
+RETURNS TEXT
+LANGUAGE sql IMMUTABLE PARALLEL SAFE
+AS $$ SELECT array_to_string(items, ' ') $$;
+
+CREATE OR REPLACE FUNCTION news_search_document(document TEXT)
+RETURNS TEXT
+LANGUAGE sql IMMUTABLE PARALLEL SAFE
+AS $$
+    SELECT coalesce(document, '') || ' ' || coalesce(string_agg(
+        substr(run, i, 2), ' ' ORDER BY n, i
+    ), '')
+    FROM regexp_split_to_table(coalesce(document, ''), '[^가-힣]+')
+        WITH ORDINALITY AS runs(run, n),
+        generate_series(1, greatest(length(run) - 1, 1)) AS i
+    WHERE run <> ''
+$$;
+"""
+# 제목(A) > 부제목(B) > 본문(C) 가중치
+_NEWS_SEARCH_VECTOR = f"""
+    setweight(to_tsvector('{NEWS_SEARCH_CONFIG}',
+        news_search_document(title)), 'A')
+    || setweight(to_tsvector('{NEWS_SEARCH_CONFIG}',
+        news_search_document(news_array_to_text(subtitles))), 'B')
+    || setweight(to_tsvector('{NEWS_SEARCH_CONFIG}',
+        news_search_document(contents)), 'C')
+"""
+_SEARCH_TOKEN = re.compile(r"[가-힣]+|[0-9A-Za-z]+")
+_HANGUL_TOKEN = re.compile(r"[가-힣]+")
+
+
+def news_search_tsquery(query: str) -> str | None:
+    """
+    검색어를 news.search_vector에 사용할 tsquery 문자열로 변환합니다.
+    두 글자 이상의 한글은 bigram이 연속으로(<->) 나타나야 하므로 어절 중간도 찾을 수 있고,
+    그 외 토큰은 접두사로 찾습니다. 모든 토큰을 AND로 묶으며, 토큰이 없으면 None
+    """
+    terms = []
+    for token in _SEARCH_TOKEN.findall(query):
+        if _HANGUL_TOKEN.fullmatch(token) and len(token) > 1:
+            bigrams = [token[i : i + 2] for i in range(len(token) - 1)]
+            terms.append(f"({' <-> '.join(bigrams)})")
+        else:
+            terms.append(f"{token.lower()}:*")
+    return " & ".join(terms) or None
+
+
+def content_fingerprint(news_item: News) -> str:
+    """
+    crawled_at을 제외한 기사 내용의 sha256
+    """
+    content = news_item.model_dump(mode="json", exclude={"crawled_at"})
+    return hashlib.sha256(
+        json.dumps(content, ensure_ascii=False, sort_keys=True).encode("utf-8")
+    ).hexdigest()
+
+
+def _news_to_record(news_item: News) -> tuple:
+    """
+    News 객체를 NEWS_COLUMNS 순서의 레코드로 변환
+    """
+    images_jsonb = [json.dumps(img.model_dump()) for img in news_item.images]
+    return (
+        news_item.id,
+        news_item.title,
+        news_item.subtitles,
+        news_item.publisher,
+        news_item.contents,
+        images_jsonb,  # JSONB[] 타입으로 전달
+        news_item.url,
+        news_item.published_at,
+        news_item.crawled_at,
+        content_fingerprint(news_item),
+    )
+
 
 class PostgresClient:
     def __init__(
@@ -19,6 +162,10 @@ class PostgresClient:
     ):
         self.conn_string = f"postgresql://{user}:{password}@{host}:{port}/{dbname}"
         self.pool = None
+        # news 테이블이 파티션 테이블인지 여부 (create_news_table에서 확인)
+        self._news_partitioned: bool | None = None
+        # 이 클라이언트에서 존재를 확인한 파티션
+        self._news_partitions: set[str] = set()
 
     async def connect(self):
         try:
@@ -33,69 +180,569 @@ class PostgresClient:
             await self.pool.close()
             logger.info("PostgreSQL connection pool closed.")
 
-    async def create_news_table(self):
+    async def create_news_table(
+        self,
+        search_index: bool = False,
+        partitioned: bool = False,
+    ):
         """
         테이블이 없을 경우 생성
+        search_index=True이면 전문 검색용 컬럼과 인덱스도 생성합니다.
+        partitioned=True이면 published_at 기준 월 단위 range 파티션 테이블로 만들고,
+        기존 일반 테이블은 파티션 테이블로 옮깁니다. (파티션 테이블은 일반 테이블로 되돌리지 않음)
         """
         if not self.pool:
             logger.error("Connection pool is not initialized.")
             raise
 
         async with self.pool.acquire() as conn:
-            await conn.execute("""
-                CREATE TABLE IF NOT EXISTS news (
-                    id BIGINT PRIMARY KEY,
-                    title TEXT NOT NULL,
-                    subtitles TEXT[],
-                    publisher TEXT,
-                    contents TEXT NOT NULL,
-                    images JSONB[],
-                    url TEXT NOT NULL,
-                    published_at TIMESTAMP WITH TIME ZONE NOT NULL,
-                    crawled_at TIMESTAMP WITH TIME ZONE NOT NULL
+            await conn.execute(f"CREATE SEQUENCE IF NOT EXISTS {NEWS_CHANGE_SEQUENCE};")
+            async with conn.transaction():
+                # 동시에 실행되는 태스크가 테이블을 함께 만들거나 옮기지 않도록 직렬화
+                await conn.execute(
+                    "SELECT pg_advisory_xact_lock(hashtext($1));",
+                    _NEWS_PARTITION_LOCK_KEY,
+                )
+                layout = await self._news_table_layout(conn)
+                if layout is None:
+                    await self._create_news_table(conn, partitioned)
+                else:
+                    # 이전 스키마의 테이블은 컬럼을 먼저 추가한 뒤 옮김
+                    await self._add_missing_news_columns(conn)
+                    if partitioned and layout == "plain":
+                        await self._migrate_news_to_partitioned(conn)
+                self._news_partitioned = (
+                    await self._news_table_layout(conn) == "partitioned"
+                )
+                await self._create_missing_news_indexes(conn, self._news_partitioned)
+            logger.info("News table created or already exists.")
+
+        if search_index:
+            await self.create_news_search_index()
+
+    @staticmethod
+    async def _news_table_layout(conn: asyncpg.Connection) -> str | None:
+        """
+        news 테이블의 형태: None (없음) | plain | partitioned
+        """
+        is_partitioned = await conn.fetchval(
+            "SELECT relkind = 'p' FROM pg_class WHERE oid = to_regclass('news');"
+        )
+        if is_partitioned is None:
+            return None
+        return "partitioned" if is_partitioned else "plain"
+
+    @staticmethod
+    async def _news_columns(conn: asyncpg.Connection) -> set[str]:
+        """
+        news 테이블의 컬럼 이름 (카탈로그 조회이므로 테이블을 잠그지 않음)
+        """
+        rows = await conn.fetch("""
+            SELECT column_name FROM information_schema.columns
+            WHERE table_schema = current_schema() AND table_name = 'news';
+        """)
+        return {row["column_name"] for row in rows}
+
+    async def _add_missing_news_columns(self, conn: asyncpg.Connection):
+        """
+        컬럼이 추가되기 전에 만들어진 테이블에 빠진 컬럼만 추가합니다. (기존 행은 다음 적재 시 한 번 갱신됨)
+        ALTER TABLE은 ACCESS EXCLUSIVE 잠금을 잡으므로 빠진 컬럼이 있을 때만 실행합니다.
+        """
+        existing_columns = await self._news_columns(conn)
+        missing_columns = [
+            column for column in _NEWS_ADDED_COLUMNS if column not in existing_columns
+        ]
+        if not missing_columns:
+            return
+        await conn.execute(
+            "ALTER TABLE news "
+            + ", ".join(
+                f"ADD COLUMN IF NOT EXISTS {column} {_NEWS_ADDED_COLUMNS[column]}"
+                for column in missing_columns
+            )
+            + ";"
+        )
+        logger.info(f"Added columns to news table: {', '.join(missing_columns)}")
+
+    @staticmethod
+    async def _create_missing_news_indexes(conn: asyncpg.Connection, partitioned: bool):
+        """
+        변경 추적/조회용 인덱스 중 없는 것만 생성합니다.
+        CREATE INDEX는 IF NOT EXISTS여도 테이블에 SHARE 잠금을 잡으므로 카탈로그에서 먼저 확인합니다.
+        """
+        # 파티션 테이블의 unique 인덱스는 파티션 키를 포함해야 하므로
+        # change_seq는 일반 인덱스 (순번은 시퀀스가 보장)
+        change_seq_unique = "" if partitioned else "UNIQUE"
+        indexes = {
+            "news_change_seq_idx": f"""
+                CREATE {change_seq_unique} INDEX news_change_seq_idx
+                ON news (change_seq);
+            """,
+            "news_updated_at_idx": """
+                CREATE INDEX news_updated_at_idx
+                ON news (updated_at);
+            """,
+            "news_change_txid_idx": """
+                CREATE INDEX news_change_txid_idx
+                ON news (change_txid, change_seq);
+            """,
+        }
+        if partitioned:
+            # 기본 키가 (id, published_at)이므로 id만으로 찾는 조회용
+            indexes["news_id_idx"] = """
+                CREATE INDEX news_id_idx
+                ON news (id);
+            """
+
+        rows = await conn.fetch("""
+            SELECT indexname FROM pg_indexes
+            WHERE schemaname = current_schema() AND tablename = 'news';
+        """)
+        existing_indexes = {row["indexname"] for row in rows}
+        for index_name, create_index in indexes.items():
+            if index_name in existing_indexes:
+                continue
+            await conn.execute(create_index)
+            logger.info(f"Created index {index_name} on news table.")
+
+    @staticmethod
+    async def _create_news_table(conn: asyncpg.Connection, partitioned: bool):
+        if partitioned:
+            await conn.execute(f"""
+                CREATE TABLE news (
+                    {_NEWS_TABLE_COLUMNS},
+                    PRIMARY KEY (id, published_at)
+                ) PARTITION BY RANGE (published_at);
+            """)
+        else:
+            await conn.execute(f"""
+                CREATE TABLE news (
+                    {_NEWS_TABLE_COLUMNS},
+                    PRIMARY KEY (id)
                 );
             """)
-            logger.info("News table created or already exists.")
 
-    async def insert_news(self, news_item: News):
+    async def _migrate_news_to_partitioned(self, conn: asyncpg.Connection):
+        """
+        일반 news 테이블을 이름을 바꿔 두고, 같은 이름의 파티션 테이블을 만든 뒤
+        필요한 파티션을 만들어 모든 행(updated_at, change_seq, change_txid 포함)을 복사하고 기존 테이블을 삭제합니다.
+        호출한 트랜잭션 안에서 실행되므로 실패하면 기존 테이블이 그대로 남습니다.
+        (검색용 컬럼은 복사하지 않으며 create_news_search_index에서 다시 생성됨)
+        """
+        logger.info("Migrating news table to monthly partitions...")
+        await conn.execute("LOCK TABLE news IN ACCESS EXCLUSIVE MODE;")
+        await conn.execute("ALTER TABLE news RENAME TO news_unpartitioned;")
+        # 새 테이블이 같은 이름의 인덱스를 만들 수 있도록 기존 인덱스 이름 변경
+        index_names = await conn.fetch("""
+            SELECT indexrelid::regclass::text AS name FROM pg_index
+            WHERE indrelid = 'news_unpartitioned'::regclass;
+        """)
+        for row in index_names:
+            await conn.execute(
+                f'ALTER INDEX "{row["name"]}" RENAME TO "{row["name"]}_unpartitioned";'
+            )
+        await self._create_news_table(conn, partitioned=True)
+
+        # 기존 행의 게시월 (NEWS_PARTITION_TIMEZONE 기준 월의 시작 시각)
+        month_starts = await conn.fetchval(
+            """
+            SELECT coalesce(array_agg(DISTINCT
+                date_trunc('month', published_at AT TIME ZONE $1) AT TIME ZONE $1
+            ), '{}')
+            FROM news_unpartitioned;
+            """,
+            NEWS_PARTITION_TIMEZONE,
+        )
+        await self._create_news_partitions(conn, month_starts)
+
+        columns = ", ".join((*NEWS_COLUMNS, "updated_at", "change_seq", "change_txid"))
+        copied = await conn.execute(f"""
+            INSERT INTO news ({columns})
+            SELECT {columns} FROM news_unpartitioned;
+        """)
+        await conn.execute("DROP TABLE news_unpartitioned;")
+        logger.info(f"Migrated news table to monthly partitions: {copied}")
+
+    async def _create_news_partitions(
+        self,
+        conn: asyncpg.Connection,
+        published_ats: list[datetime],
+    ):
+        """
+        published_ats가 속한 월의 파티션(news_YYYY_MM)이 없으면 생성합니다.
+        월 경계는 NEWS_PARTITION_TIMEZONE 기준이며, 경계 계산은 적재와 같은 방식으로 DB에서 수행합니다.
+        """
+        months = await conn.fetch(
+            """
+            SELECT to_char(month, 'YYYY_MM') AS suffix,
+                   (month AT TIME ZONE $2)::text AS lower_bound,
+                   ((month + interval '1 month') AT TIME ZONE $2)::text AS upper_bound
+            FROM (
+                SELECT DISTINCT date_trunc('month', published_at AT TIME ZONE $2)
+                    AS month
+                FROM unnest($1::timestamptz[]) AS published_at
+            ) AS months;
+            """,
+            published_ats,
+            NEWS_PARTITION_TIMEZONE,
+        )
+        for month in months:
+            partition_name = f"news_{month['suffix']}"
+            if partition_name in self._news_partitions:
+                continue
+            await conn.execute(f"""
+                CREATE TABLE IF NOT EXISTS {partition_name}
+                PARTITION OF news
+                FOR VALUES FROM ('{month["lower_bound"]}') TO ('{month["upper_bound"]}');
+            """)
+            self._news_partitions.add(partition_name)
+            logger.debug("News partition %s is ready.", partition_name)
+
+    async def ensure_news_partitions(
+        self,
+        conn: asyncpg.Connection,
+        published_ats: list[datetime],
+    ):
+        """
+        파티션 테이블이면 적재할 기사의 게시월 파티션을 미리 만듭니다.
+        파티션 생성은 상위 테이블을 잠그므로 적재 트랜잭션과 분리된 짧은 트랜잭션에서 실행합니다.
+        """
+        if self._news_partitioned is None:
+            self._news_partitioned = (
+                await self._news_table_layout(conn) == "partitioned"
+            )
+        if not self._news_partitioned:
+            return
+        async with conn.transaction():
+            await conn.execute(
+                "SELECT pg_advisory_xact_lock(hashtext($1));",
+                _NEWS_PARTITION_LOCK_KEY,
+            )
+            await self._create_news_partitions(conn, published_ats)
+
+    @property
+    def news_conflict_columns(self) -> tuple[str, ...]:
+        """
+        upsert의 ON CONFLICT 대상 (파티션 테이블은 기본 키에 파티션 키가 포함됨)
+        """
+        return ("id", "published_at") if self._news_partitioned else ("id",)
+
+    async def create_news_search_index(self):
+        """
+        search_news에 사용할 검색용 생성 컬럼(search_vector)과 GIN 인덱스를 생성합니다.
+        기존 테이블에 컬럼을 추가하면 테이블 전체를 한 번 다시 씁니다.
+        동시에 실행되는 태스크와 직렬화하며, search_vector가 이미 있으면 아무것도 하지 않습니다.
+        """
+        if not self.pool:
+            logger.error("Connection pool is not initialized.")
+            raise RuntimeError("Connection pool is not initialized.")
+
+        async with self.pool.acquire() as conn:
+            async with conn.transaction():
+                await conn.execute(
+                    "SELECT pg_advisory_xact_lock(hashtext($1));",
+                    _NEWS_PARTITION_LOCK_KEY,
+                )
+                if "search_vector" in await self._news_columns(conn):
+                    logger.info("News search index already exists.")
+                    return
+                await conn.execute(_NEWS_SEARCH_FUNCTIONS)
+                await conn.execute(f"""
+                    ALTER TABLE news
+                        ADD COLUMN search_vector TSVECTOR
+                            GENERATED ALWAYS AS ({_NEWS_SEARCH_VECTOR}) STORED;
+                """)
+                await conn.execute("""
+                    CREATE INDEX IF NOT EXISTS news_search_vector_idx
+                    ON news USING GIN (search_vector);
+                """)
+                await conn.execute("""
+                    CREATE INDEX IF NOT EXISTS news_published_at_idx
+                    ON news (published_at);
+                """)
+            logger.info("News search index created.")
+
+    async def insert_news(self, news_item: News) -> str:
+        """
+        News 객체 한 건을 적재합니다. 내용(content_fingerprint)이 같으면 갱신하지 않습니다.
+        파티션 테이블이면 필요한 월 파티션을 먼저 만듭니다.
+        반환값: inserted | updated | unchanged
+        """
         if not self.pool:
             logger.error("Connection pool is not initialized.")
             raise
 
+        placeholders = ", ".join(f"${i}" for i in range(1, len(NEWS_COLUMNS) + 1))
+        existing_match = " AND ".join(
+            f"{column} = ${NEWS_COLUMNS.index(column) + 1}"
+            for column in self.news_conflict_columns
+        )
         async with self.pool.acquire() as conn:
-            images_jsonb = [json.dumps(img.model_dump()) for img in news_item.images]
             try:
-                await conn.execute(
-                    """
-                    INSERT INTO news (
-                        id, title, subtitles, publisher, contents, images, url, published_at, crawled_at
-                    )
-                    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
-                    ON CONFLICT (id) DO UPDATE SET
-                        title = EXCLUDED.title,
-                        subtitles = EXCLUDED.subtitles,
-                        publisher = EXCLUDED.publisher,
-                        contents = EXCLUDED.contents,
-                        images = EXCLUDED.images,
-                        url = EXCLUDED.url,
-                        published_at = EXCLUDED.published_at,
-                        crawled_at = EXCLUDED.crawled_at;
-                """,
-                    news_item.id,
-                    news_item.title,
-                    news_item.subtitles,
-                    news_item.publisher,
-                    news_item.contents,
-                    images_jsonb,  # JSONB[] 타입으로 전달
-                    news_item.url,
-                    news_item.published_at,
-                    news_item.crawled_at,
+                await self.ensure_news_partitions(conn, [news_item.published_at])
+                with metrics.timer("postgres_load"):
+                    async with conn.transaction():
+                        moved = False
+                        if self._news_partitioned:
+                            # 게시일이 바뀐 기사는 이전 파티션의 행을 지우고 새로 추가
+                            moved = (
+                                await conn.fetchval(
+                                    """
+                                    DELETE FROM news
+                                    WHERE id = $1 AND published_at <> $2
+                                    RETURNING id;
+                                    """,
+                                    news_item.id,
+                                    news_item.published_at,
+                                )
+                                is not None
+                            )
+                        # existing: 적재 전에 있던 행 (INSERT와 같은 snapshot에서 조회)
+                        row = await conn.fetchrow(
+                            f"""
+                            WITH existing AS (
+                                SELECT id FROM news
+                                WHERE {existing_match}
+                            ),
+                            upserted AS (
+                                INSERT INTO news ({", ".join(NEWS_COLUMNS)})
+                                VALUES ({placeholders})
+                                ON CONFLICT ({", ".join(self.news_conflict_columns)})
+                                DO UPDATE SET
+                                    {_NEWS_UPSERT_SET}
+                                WHERE {_NEWS_UPSERT_WHERE}
+                                RETURNING id
+                            )
+                            SELECT NOT EXISTS (SELECT 1 FROM existing) AS inserted
+                            FROM upserted;
+                        """,
+                            *_news_to_record(news_item),
+                        )
+                if row is None:
+                    status = "unchanged"
+                elif row["inserted"] and not moved:
+                    status = "inserted"
+                else:
+                    # 다른 파티션으로 옮겨진 행도 기존 기사의 갱신
+                    status = "updated"
+                metrics.inc("postgres_load")
+                metrics.inc(f"postgres_{status}")
+                logger.debug("News ID %s %s in PostgreSQL.", news_item.id, status)
+                return status
+            except Exception as e:
+                logger.error(
+                    f"Failed to insert/update news ID {news_item.id} into PostgreSQL: {e}"
                 )
+                raise
+
+    async def bulk_insert_news(self, news_items: list[News]) -> dict[str, int]:
+        """
+        News 객체 목록을 한 트랜잭션으로 적재합니다.
+        임시 staging 테이블에 binary COPY로 적재한 뒤
+        INSERT ... ON CONFLICT 한 번으로 news 테이블에 병합하며,
+        내용(content_fingerprint)이 바뀌지 않은 행은 갱신하지 않습니다.
+        파티션 테이블이면 필요한 월 파티션을 먼저 만듭니다.
+        반환값: {"inserted": n, "updated": n, "unchanged": n} (배치 안의 중복 ID는 한 건)
+        """
+        if not self.pool:
+            logger.error("Connection pool is not initialized.")
+            raise RuntimeError("Connection pool is not initialized.")
+
+        if not news_items:
+            return {"inserted": 0, "updated": 0, "unchanged": 0}
+
+        records = [_news_to_record(news_item) for news_item in news_items]
+        columns = ", ".join(NEWS_COLUMNS)
+        existing_match = " AND ".join(
+            f"news.{column} = latest.{column}" for column in self.news_conflict_columns
+        )
+
+        async with self.pool.acquire() as conn:
+            try:
+                await self.ensure_news_partitions(
+                    conn, [news_item.published_at for news_item in news_items]
+                )
+                with metrics.timer("postgres_load"):
+                    async with conn.transaction():
+                        # 적재할 컬럼만 가진 staging 테이블
+                        # (change_seq 기본값이 COPY 단계에서 순번을 소비하지 않도록 함)
+                        await conn.execute(f"""
+                            CREATE TEMP TABLE news_staging
+                            ON COMMIT DROP
+                            AS SELECT {columns} FROM news WITH NO DATA;
+                        """)
+                        await conn.copy_records_to_table(
+                            "news_staging",
+                            records=records,
+                            columns=NEWS_COLUMNS,
+                        )
+                        # 같은 배치 안의 중복 ID는 가장 최근에 크롤링된 행만 사용
+                        latest = f"""
+                            SELECT DISTINCT ON (id) {columns}
+                            FROM news_staging
+                            ORDER BY id, crawled_at DESC
+                        """
+                        moved_ids: set[int] = set()
+                        if self._news_partitioned:
+                            # 게시일이 바뀐 기사는 이전 파티션의 행을 지우고 새로 추가
+                            moved_rows = await conn.fetch(f"""
+                                DELETE FROM news
+                                USING ({latest}) AS latest
+                                WHERE news.id = latest.id
+                                  AND news.published_at <> latest.published_at
+                                RETURNING news.id;
+                            """)
+                            moved_ids = {row["id"] for row in moved_rows}
+                        # existing: 병합 전에 있던 행 (INSERT와 같은 snapshot에서 조회)
+                        rows = await conn.fetch(f"""
+                            WITH latest AS ({latest}),
+                            existing AS (
+                                SELECT news.id FROM news
+                                JOIN latest ON {existing_match}
+                            ),
+                            upserted AS (
+                                INSERT INTO news ({columns})
+                                SELECT {columns} FROM latest
+                                ON CONFLICT ({", ".join(self.news_conflict_columns)})
+                                DO UPDATE SET
+                                    {_NEWS_UPSERT_SET}
+                                WHERE {_NEWS_UPSERT_WHERE}
+                                RETURNING id
+                            )
+                            SELECT id, existing.id IS NULL AS inserted
+                            FROM upserted LEFT JOIN existing USING (id);
+                        """)
+                # 다른 파티션으로 옮겨진 행은 기존 기사의 갱신으로 집계
+                inserted = sum(
+                    1 for row in rows if row["inserted"] and row["id"] not in moved_ids
+                )
+                result = {
+                    "inserted": inserted,
+                    "updated": len(rows) - inserted,
+                    "unchanged": len({record[0] for record in records}) - len(rows),
+                }
+                metrics.inc("postgres_load", len(records))
+                for status, count in result.items():
+                    metrics.inc(f"postgres_{status}", count)
                 logger.info(
-                    f"News ID {news_item.id} inserted/updated successfully in PostgreSQL."
+                    f"{len(records)} news items merged into PostgreSQL: {result}"
                 )
             except Exception as e:
                 logger.error(
-                    f"Failed to insert/update news ID {news_item.id} into PostgreSQL: {e}"
+                    f"Failed to bulk insert/update {len(records)} news items into PostgreSQL: {e}"
                 )
                 raise
+
+        return result
+
+    async def fetch_news_ids_published_between(
+        self,
+        start: datetime,
+        end: datetime,
+    ) -> list[int]:
+        """
+        published_at이 [start, end) 구간인 뉴스 ID를 오름차순으로 반환합니다.
+        """
+        if not self.pool:
+            logger.error("Connection pool is not initialized.")
+            raise RuntimeError("Connection pool is not initialized.")
+
+        async with self.pool.acquire() as conn:
+            rows = await conn.fetch(
+                """
+                SELECT id FROM news
+                WHERE published_at >= $1 AND published_at < $2
+                ORDER BY id;
+                """,
+                start,
+                end,
+            )
+        return [row["id"] for row in rows]
+
+    async def fetch_news_changed_since(
+        self,
+        after_change_txid: int,
+        limit: int,
+    ) -> list[asyncpg.Record]:
+        """
+        change_txid가 after_change_txid보다 큰 행을 (change_txid, change_seq) 순으로 반환합니다.
+        (news_change_txid_idx를 따라 읽는 keyset pagination)
+        현재 snapshot의 xmin보다 작은 트랜잭션 ID는 모두 끝났으므로 그 앞의 행만 반환하여,
+        아직 커밋되지 않은 트랜잭션의 행을 watermark가 건너뛰지 않도록 합니다.
+        같은 트랜잭션의 행은 나누어 반환하지 않으므로 limit 건보다 많을 수 있습니다.
+        """
+        if not self.pool:
+            logger.error("Connection pool is not initialized.")
+            raise RuntimeError("Connection pool is not initialized.")
+
+        async with self.pool.acquire() as conn:
+            return await conn.fetch(
+                f"""
+                WITH page AS (
+                    SELECT max(change_txid) AS change_txid
+                    FROM (
+                        SELECT change_txid FROM news
+                        WHERE change_txid > $1
+                          AND change_txid < txid_snapshot_xmin(txid_current_snapshot())
+                        ORDER BY change_txid
+                        LIMIT $2
+                    ) AS page_rows
+                )
+                SELECT {", ".join(f"news.{column}" for column in NEWS_COLUMNS)},
+                       news.updated_at, news.change_seq, news.change_txid
+                FROM news, page
+                WHERE news.change_txid > $1
+                  AND news.change_txid <= page.change_txid
+                ORDER BY news.change_txid, news.change_seq;
+                """,
+                after_change_txid,
+                limit,
+            )
+
+    async def search_news(
+        self,
+        query: str,
+        published_from: datetime | None = None,
+        published_to: datetime | None = None,
+        limit: int = 20,
+        after: tuple[float, int] | None = None,
+    ) -> list[asyncpg.Record]:
+        """
+        검색어와 일치하는 기사를 관련도(rank) 순으로 최대 limit 건 반환합니다.
+        (create_news_search_index로 만든 search_vector GIN 인덱스 사용)
+        published_from/published_to: published_at이 [published_from, published_to)인 기사만
+        after: 이전 페이지 마지막 행의 (rank, id) — 다음 페이지를 keyset pagination으로 요청
+        """
+        if not self.pool:
+            logger.error("Connection pool is not initialized.")
+            raise RuntimeError("Connection pool is not initialized.")
+
+        tsquery = news_search_tsquery(query)
+        if tsquery is None:
+            return []
+        after_rank, after_id = after if after is not None else (None, None)
+
+        async with self.pool.acquire() as conn:
+            with metrics.timer("postgres_search"):
+                return await conn.fetch(
+                    f"""
+                    SELECT id, title, subtitles, publisher, url, published_at, rank
+                    FROM (
+                        SELECT news.*,
+                               ts_rank_cd(news.search_vector, query, 1) AS rank
+                        FROM news, to_tsquery('{NEWS_SEARCH_CONFIG}', $1) AS query
+                        WHERE news.search_vector @@ query
+                          AND ($2::timestamptz IS NULL OR news.published_at >= $2)
+                          AND ($3::timestamptz IS NULL OR news.published_at < $3)
+                    ) AS matched
+                    WHERE $4::real IS NULL OR (rank, id) < ($4::real, $5::bigint)
+                    ORDER BY rank DESC, id DESC
+                    LIMIT $6;
+                    """,
+                    tsquery,
+                    published_from,
+                    published_to,
+                    after_rank,
+                    after_id,
+                    limit,
+                )
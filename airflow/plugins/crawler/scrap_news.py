@@ -5,17 +5,18 @@ from urllib.parse import parse_qs, urlparse
 
 import httpx
 from bs4 import BeautifulSoup
-
 from models.news import Image, News
+from utils.log_events import get_event_logger
 
 logger = logging.getLogger(__name__)
+events = get_event_logger(__name__)
 
 
 async def scrap_news(url: str, client: httpx.AsyncClient) -> News:
     try:
         res = await client.get(url)
         res.raise_for_status()
-        logger.info(f"{url} - {res.status_code}")
+        logger.debug("%s - %s", url, res.status_code)
     except httpx.HTTPStatusError as e:
         logger.error(f"{url} - {e.response.status_code}")
         raise
@@ -28,7 +29,7 @@ async def scrap_news(url: str, client: httpx.AsyncClient) -> News:
     # news id
     if news_id_qs := parse_qs(urlparse(url).query).get("newsId"):
         news_id = int(news_id_qs[0])
-        logger.info(f"{news_id} - Get news_id successfully")
+        logger.debug("%s - Get news_id successfully", news_id)
     else:
         logger.error("No news_id")
         raise
@@ -36,7 +37,7 @@ async def scrap_news(url: str, client: httpx.AsyncClient) -> News:
     # title
     if title_tag := soup.select_one("div.view_title > h1"):
         title = title_tag.get_text().strip()
-        logger.info(f"{title} - Get title successfully")
+        logger.debug("%s - Get title successfully", title)
     else:
         logger.error("No title")
         raise
@@ -47,7 +48,7 @@ async def scrap_news(url: str, client: httpx.AsyncClient) -> News:
             el.get_text() for el in subtitles_tag.contents if el.get_text() != ""
         ]
 
-        logger.info(f"{subtitles} - Get subtitles successfully")
+        logger.debug("%s - Get subtitles successfully", subtitles)
     else:
         logger.error("No subtitles")
         raise
@@ -57,7 +58,7 @@ async def scrap_news(url: str, client: httpx.AsyncClient) -> News:
         for i in publisher_tag.select("i"):
             i.decompose()
         publisher = publisher_tag.get_text().strip()
-        logger.info(f"{publisher} - Get publisher successfully")
+        logger.debug("%s - Get publisher successfully", publisher)
     else:
         logger.error("No publisher")
         raise
@@ -65,7 +66,9 @@ async def scrap_news(url: str, client: httpx.AsyncClient) -> News:
     # contents
     if contents_tag := soup.select_one("div.view_cont"):
         contents: str = contents_tag.get_text().replace("\xa0", "").strip()
-        logger.info(f"{contents[:15]}...{contents[-15:]} - Get contents successfully")
+        logger.debug(
+            "%s...%s - Get contents successfully", contents[:15], contents[-15:]
+        )
     else:
         logger.error("No contents")
         raise
@@ -78,29 +81,29 @@ async def scrap_news(url: str, client: httpx.AsyncClient) -> News:
             image_comments = str(tag["alt"])
             image = Image(url=image_url, comments=image_comments)
             images.append(image)
-        logger.info(f"{images} - Get images successfully")
+        logger.debug("%s - Get images successfully", images)
     else:
-        logger.warning("No images")
+        logger.debug("No images")
 
     # get json data
     if json_tag := soup.select_one('script[type="application/ld+json"]'):
         json_data = json.loads(json_tag.get_text())
-        logger.info(f"{json_data} - Get json_data successfully")
+        logger.debug("%s - Get json_data successfully", json_data)
     else:
         logger.warning("No json_data")
         raise
 
     # tags
     tags = json_data["keyword"].split(",")
-    logger.info(f"{tags} - Get tags successfully")
+    logger.debug("%s - Get tags successfully", tags)
 
     # published_at
     published_at = datetime.fromisoformat(json_data["datePublished"])
-    logger.info(f"Published at: {published_at} - Successfully extracted.")
+    logger.debug("Published at: %s - Successfully extracted.", published_at)
 
     # crawled_at
     crawled_at = datetime.now()
-    logger.info(f"Crawled at: {crawled_at} - Successfully extracted.")
+    logger.debug("Crawled at: %s - Successfully extracted.", crawled_at)
 
     news = News(
         id=news_id,
@@ -113,5 +116,14 @@ async def scrap_news(url: str, client: httpx.AsyncClient) -> News:
         published_at=published_at,
         crawled_at=crawled_at,
     )
+    events.info(
+        "news_scraped",
+        news_id=news_id,
+        status=res.status_code,
+        subtitles=len(subtitles),
+        images=len(images),
+        contents_chars=len(contents),
+        published_at=published_at.isoformat(),
+    )
 
     return news
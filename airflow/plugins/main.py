@@ -5,12 +5,29 @@ from datetime import datetime
 from pathlib import Path
 
 from dotenv import load_dotenv
+from pipelines.checkpoint import (
+    DONE_STAGE,
+    CheckpointManifest,
+    load_checkpoint,
+    save_checkpoint,
+    split_urls_by_checkpoint,
+)
+from pipelines.raw.content_index import record_loaded_hashes
+from pipelines.raw.incremental import SeenNewsIndex, filter_unseen_urls
 from pipelines.raw.minio_loader import load_raws_to_minio
 from pipelines.raw.raw_scraper import scrap_raw_html_batch
-from pipelines.raw.urls_scraper import scrap_urls_from_webpage
+from pipelines.raw.urls_scraper import scrap_urls_from_webpage_async
+from pipelines.run_report import publish_metrics_report
+from pipelines.streaming import run_streaming_pipeline
+from pipelines.transformed.elasticsearch_loader import (
+    index_prefix_from_pattern,
+    load_transforms_to_elasticsearch,
+)
 from pipelines.transformed.minio_extractor import extract_raws_from_minio
 from pipelines.transformed.postgres_loader import load_transforms_to_postgres
 from pipelines.transformed.raw_transformer import transform_raws
+from utils.http_cache import HttpCache
+from utils.metrics import metrics
 
 logger = logging.getLogger(__name__)
 
@@ -30,9 +47,22 @@ async def main_async():
         "CRAWLING_END_DATE",
         datetime.today().strftime("%Y-%m-%d"),
     )
+    # 이미 적재된 기사도 다시 수집할지 여부
+    crawling_force_recrawl = (
+        os.getenv("CRAWLING_FORCE_RECRAWL", "false").lower() == "true"
+    )
+    # __HTTP Cache (HTTP_CACHE_DIR이 설정된 경우에만 사용)
+    http_cache = HttpCache.from_env()
+    skip_unchanged = os.getenv("HTTP_CACHE_SKIP_UNCHANGED", "false").lower() == "true"
     # __Minio
     minio_endpoint = os.getenv("MINIO_ENDPOINT", "minio:9000")
     minio_raw_news_bucket = os.getenv("MINIO_RAW_NEWS_BUCKET", "raw-news")
+    # Raw HTML 압축 방식 (identity | gzip | zstd)
+    minio_raw_codec = os.getenv("MINIO_RAW_CODEC", "identity")
+    # Raw HTML 저장 방식 (object: 기사별 객체 | shard: 샤드 객체 + 인덱스)
+    minio_raw_layout = os.getenv("MINIO_RAW_LAYOUT", "object")
+    # 마지막으로 적재된 내용(sha256)과 같은 기사는 다시 저장하지 않음 (강제 재수집 시 제외)
+    minio_raw_dedup = os.getenv("MINIO_RAW_DEDUP", "false").lower() == "true"
     minio_access_key = os.getenv("MINIO_ACCESS_KEY", "myuser")
     minio_secret_key = os.getenv("MINIO_SECRET_KEY", "mypassword")
     # __Postgres
@@ -41,7 +71,120 @@ async def main_async():
     pg_user = os.getenv("POSTGRES_USER", "myuser")
     pg_password = os.getenv("POSTGRES_PASSWORD", "mypassword")
     pg_dbname = os.getenv("POSTGRES_DBNAME", "mydatabase")
+    # 전문 검색용 컬럼과 GIN 인덱스 생성 (PostgresClient.search_news)
+    pg_search_index = os.getenv("POSTGRES_SEARCH_INDEX", "false").lower() == "true"
+    # news 테이블을 게시월 단위 파티션 테이블로 사용 (기존 테이블은 첫 적재 시 옮김)
+    pg_partitioned = os.getenv("POSTGRES_NEWS_PARTITIONED", "false").lower() == "true"
+    # __Elasticsearch
+    # 적재된 기사를 Logstash 대신 _bulk API로 바로 색인
+    es_bulk_enabled = os.getenv("ELASTICSEARCH_BULK_ENABLED", "false").lower() == "true"
+    es_bulk_concurrency = int(os.getenv("ELASTICSEARCH_BULK_CONCURRENCY", "4"))
+    es_host = os.getenv("ELASTICSEARCH_HOST", "http://elasticsearch:9200")
+    es_index_prefix = index_prefix_from_pattern(
+        os.getenv("ELASTICSEARCH_INDEX", "korea-policy-news-*")
+    )
+    # __Pipeline
+    # batch: 단계별로 순차 실행 / streaming: 단계를 큐로 연결하여 동시에 실행
+    pipeline_mode = os.getenv("PIPELINE_MODE", "batch")
+    pipeline_queue_size = int(os.getenv("PIPELINE_QUEUE_SIZE", "100"))
+    # 변환(HTML 파싱)에 사용할 프로세스 수
+    transform_max_workers = int(
+        os.getenv("TRANSFORM_MAX_WORKERS", str(os.cpu_count() or 1))
+    )
+    # HTML 파싱 엔진 (bs4 | lxml | partial)
+    transform_engine = os.getenv("TRANSFORM_ENGINE", "bs4")
+    # 기사별 진행 단계를 기록하여 같은 실행을 다시 실행하면 끝나지 않은 기사부터 처리
+    pipeline_checkpoint = os.getenv("PIPELINE_CHECKPOINT", "true").lower() == "true"
+    # 체크포인트를 구분하는 실행 식별자 (기본값: 실행한 날짜)
+    pipeline_run_id = os.getenv("PIPELINE_RUN_ID") or (
+        datetime.now().astimezone().strftime("%Y-%m-%d")
+    )
+
+    async def load_seen_index() -> SeenNewsIndex | None:
+        if crawling_force_recrawl:
+            return None
+        return await SeenNewsIndex.load_from_postgres(
+            pg_host=pg_host,
+            pg_port=pg_port,
+            pg_user=pg_user,
+            pg_password=pg_password,
+            pg_dbname=pg_dbname,
+            start_date=crawling_start_date,
+            end_date=crawling_end_date,
+            search_index=pg_search_index,
+            partitioned=pg_partitioned,
+        )
+
+    async def load_run_checkpoint() -> CheckpointManifest | None:
+        if not pipeline_checkpoint:
+            return None
+        return await load_checkpoint(
+            minio_endpoint=minio_endpoint,
+            minio_bucket_name=minio_raw_news_bucket,
+            minio_access_key=minio_access_key,
+            minio_secret_key=minio_secret_key,
+            run_key=f"{pipeline_run_id}/{crawling_start_date}_{crawling_end_date}",
+            fresh=crawling_force_recrawl,
+        )
+
+    async def publish_report(extra: dict | None = None) -> None:
+        # 실행 단위 metrics 리포트: _reports/YYYY/MM/DD/HHMMSS_{mode}.json
+        await publish_metrics_report(
+            minio_endpoint=minio_endpoint,
+            minio_bucket_name=minio_raw_news_bucket,
+            minio_access_key=minio_access_key,
+            minio_secret_key=minio_secret_key,
+            run_name=f"{metrics.started_at:%Y/%m/%d/%H%M%S}_{pipeline_mode}",
+            extra={
+                "mode": pipeline_mode,
+                "start_date": crawling_start_date,
+                "end_date": crawling_end_date,
+                **(extra or {}),
+            },
+        )
+
+    metrics.reset()
+
+    if pipeline_mode == "streaming":
+        counts = {}
+        try:
+            logger.info("Starting streaming pipeline...")
+            counts = await run_streaming_pipeline(
+                list_url=f"{korea_kr_base_url}{korea_kr_list_path}",
+                start_date=crawling_start_date,
+                end_date=crawling_end_date,
+                minio_endpoint=minio_endpoint,
+                minio_bucket_name=minio_raw_news_bucket,
+                minio_access_key=minio_access_key,
+                minio_secret_key=minio_secret_key,
+                pg_host=pg_host,
+                pg_port=pg_port,
+                pg_user=pg_user,
+                pg_password=pg_password,
+                pg_dbname=pg_dbname,
+                queue_size=pipeline_queue_size,
+                transform_workers=transform_max_workers,
+                transform_engine=transform_engine,
+                seen_index=await load_seen_index(),
+                http_cache=http_cache,
+                skip_unchanged=skip_unchanged,
+                raw_codec=minio_raw_codec,
+                raw_layout=minio_raw_layout,
+                dedup_content=minio_raw_dedup and not crawling_force_recrawl,
+                checkpoint=await load_run_checkpoint(),
+                es_host=es_host if es_bulk_enabled else None,
+                es_index_prefix=es_index_prefix,
+                es_concurrency=es_bulk_concurrency,
+                search_index=pg_search_index,
+                partitioned=pg_partitioned,
+            )
+            logger.info("Finished streaming pipeline.")
+        except Exception:
+            logger.exception("An unexpected error occurred in the pipeline.")
+        await publish_report({"counts": counts})
+        return
 
+    checkpoint = None
     try:
         # ==========================
         # ======= MAIN LOGIC =======
@@ -49,7 +192,7 @@ async def main_async():
 
         # 1. 뉴스 URL 리스트 크롤링 (Extract URLs)
         logger.info("Starting news list scraping...")
-        urls = scrap_urls_from_webpage(
+        urls = await scrap_urls_from_webpage_async(
             url=f"{korea_kr_base_url}{korea_kr_list_path}",
             start_date=crawling_start_date,
             end_date=crawling_end_date,
@@ -57,20 +200,37 @@ async def main_async():
         logger.debug(f"Found {len(urls)} news URLs.")
         logger.info("Finished news list scraping.")
 
+        # 이미 적재된 기사 제외 (Incremental Crawling)
+        if seen_index := await load_seen_index():
+            urls = filter_unseen_urls(urls, seen_index)
+
+        # 이전 실행에서 저장까지 끝난 기사는 다시 스크랩하지 않음
+        resumed_objects = []
+        checkpoint = await load_run_checkpoint()
+        if checkpoint is not None:
+            urls, resumed_objects = split_urls_by_checkpoint(urls, checkpoint)
+
         # 2. Raw HTML 스크랩 (Extract Raw HTML)
         scraped_raw_data = []
         if not urls:
             logger.warning("No news URLs to process, skipping raw HTML scraping.")
         else:
             logger.info("Starting raw HTML scraping...")
-            scraped_raw_data = await scrap_raw_html_batch(urls)
+            scraped_raw_data = await scrap_raw_html_batch(
+                urls,
+                http_cache=http_cache,
+                skip_unchanged=skip_unchanged,
+            )
             logger.info(
                 f"Finished raw HTML scraping of {len(scraped_raw_data)} articles."
             )
+            if checkpoint is not None:
+                for _, _, news_id in scraped_raw_data:
+                    checkpoint.mark(news_id, "fetched")
 
         # 3. Raw HTML을 MinIO에 저장 (Load Raw Data to Data Lake)
         minio_uploaded_objects = []
-        if not scraped_raw_data:
+        if scraped_raw_data:
             logger.info("Starting uploading raw HTML to MinIO...")
             minio_uploaded_objects = await load_raws_to_minio(
                 minio_endpoint=minio_endpoint,
@@ -78,12 +238,17 @@ async def main_async():
                 minio_secret_key=minio_secret_key,
                 minio_bucket_name=minio_raw_news_bucket,
                 scraped_raw_data=scraped_raw_data,
+                codec=minio_raw_codec,
+                layout=minio_raw_layout,
+                dedup_content=minio_raw_dedup and not crawling_force_recrawl,
+                checkpoint=checkpoint,
             )
             logger.info(
                 f"Finished uploading {len(minio_uploaded_objects)} raw HTML files to MinIO."
             )
         else:
             logger.warning("No raw HTML data to upload to MinIO.")
+        minio_uploaded_objects += resumed_objects
 
         # 4. MinIO에서 데이터 추출 (Extract Raw Data from Data Lake)
         extracted_raw_data = []
@@ -108,6 +273,8 @@ async def main_async():
             logger.info("Starting transforming raw data...")
             transformed_data = await transform_raws(
                 raw_data=extracted_raw_data,
+                max_workers=transform_max_workers,
+                engine=transform_engine,
             )
             logger.info(
                 f"Finished transforming raw data of {len(transformed_data)} news articles."
@@ -118,21 +285,57 @@ async def main_async():
         # 6. 변환된 데이터 PostgreSQL에 적재 (Load to Data Warehouse)
         if transformed_data:
             logger.info("Starting loading transformed data to PostgreSQL...")
-            await load_transforms_to_postgres(
+            loaded_news_ids = await load_transforms_to_postgres(
                 news_items=transformed_data,
                 pg_host=pg_host,
                 pg_port=pg_port,
                 pg_user=pg_user,
                 pg_password=pg_password,
                 pg_dbname=pg_dbname,
+                search_index=pg_search_index,
+                partitioned=pg_partitioned,
             )
+            if checkpoint is not None:
+                for news_id in loaded_news_ids:
+                    checkpoint.mark(news_id, DONE_STAGE)
+            if minio_raw_dedup:
+                await record_loaded_hashes(
+                    minio_endpoint=minio_endpoint,
+                    minio_bucket_name=minio_raw_news_bucket,
+                    minio_access_key=minio_access_key,
+                    minio_secret_key=minio_secret_key,
+                    minio_objects=minio_uploaded_objects,
+                    loaded_news_ids=loaded_news_ids,
+                )
             logger.info("Finished loading transformed data to PostgreSQL.")
+
+            # 7. 적재된 데이터 Elasticsearch에 색인 (Index to Search Engine)
+            if es_bulk_enabled and loaded_news_ids:
+                logger.info("Starting indexing loaded data to Elasticsearch...")
+                await load_transforms_to_elasticsearch(
+                    news_items=transformed_data,
+                    es_host=es_host,
+                    news_ids=loaded_news_ids,
+                    index_prefix=es_index_prefix,
+                    max_concurrency=es_bulk_concurrency,
+                )
+                logger.info("Finished indexing loaded data to Elasticsearch.")
         else:
             logger.warning("No transformed news items to load to PostgreSQL.")
 
     except Exception as e:
         logger.exception(f"An unexpected error occurred in the pipeline: {e}")
 
+    if checkpoint is not None:
+        await save_checkpoint(
+            checkpoint,
+            minio_endpoint=minio_endpoint,
+            minio_bucket_name=minio_raw_news_bucket,
+            minio_access_key=minio_access_key,
+            minio_secret_key=minio_secret_key,
+        )
+    await publish_report()
+
 
 def main():
     asyncio.run(main_async())
@@ -0,0 +1,111 @@
+import logging
+from datetime import date, timedelta
+
+from pipelines.checkpoint import load_checkpoint
+from pipelines.raw.incremental import SeenNewsIndex
+from pipelines.streaming import run_streaming_pipeline
+from utils.http_cache import HttpCache
+
+logger = logging.getLogger(__name__)
+
+# 백필 체크포인트는 실행(run_id)과 파티션(기간)마다 따로 저장
+BACKFILL_CHECKPOINT_PREFIX = "backfill"
+
+
+def split_date_range(
+    start_date: str,
+    end_date: str,
+    partition_days: int,
+) -> list[dict[str, str]]:
+    """
+    [start_date, end_date] 기간(양 끝 포함)을 partition_days 일 단위의 파티션으로 나눕니다.
+    반환값: [{"start_date": "YYYY-MM-DD", "end_date": "YYYY-MM-DD"}, ...] (기간 순)
+    """
+    if partition_days < 1:
+        raise ValueError(f"partition_days must be at least 1: {partition_days}")
+    start, end = date.fromisoformat(start_date), date.fromisoformat(end_date)
+    if start > end:
+        raise ValueError(f"start_date {start_date} is after end_date {end_date}")
+
+    partitions = []
+    while start <= end:
+        partition_end = min(start + timedelta(days=partition_days - 1), end)
+        partitions.append(
+            {"start_date": start.isoformat(), "end_date": partition_end.isoformat()}
+        )
+        start = partition_end + timedelta(days=1)
+    return partitions
+
+
+async def run_backfill_partition(
+    configs: dict,
+    partition: dict[str, str],
+    run_id: str,
+    force_recrawl: bool = False,
+    fetch_concurrency: int = 4,
+) -> dict:
+    """
+    파티션 하나의 기간을 스트리밍 파이프라인으로 수집하여 적재합니다.
+    체크포인트는 실행(run_id)과 파티션 기간으로 저장되므로 같은 실행의 재시도는 이어서 처리합니다.
+    force_recrawl=True이면 이미 적재된 기사도 제외하지 않고,
+    내용 중복 확인(MINIO_RAW_DEDUP)과 체크포인트도 사용하지 않고 모두 다시 수집합니다.
+    출처 서버에 대한 동시 요청 수는 (동시에 실행되는 파티션 수) x fetch_concurrency 를 넘지 않습니다.
+    반환값: 단계별 처리/실패 건수
+    """
+    start_date, end_date = partition["start_date"], partition["end_date"]
+    minio_configs = {
+        "minio_endpoint": configs["minio_endpoint"],
+        "minio_bucket_name": configs["minio_raw_news_bucket"],
+        "minio_access_key": configs["minio_access_key"],
+        "minio_secret_key": configs["minio_secret_key"],
+    }
+    pg_configs = {
+        "pg_host": configs["pg_host"],
+        "pg_port": configs["pg_port"],
+        "pg_user": configs["pg_user"],
+        "pg_password": configs["pg_password"],
+        "pg_dbname": configs["pg_dbname"],
+    }
+
+    seen_index = None
+    if not force_recrawl:
+        seen_index = await SeenNewsIndex.load_from_postgres(
+            **pg_configs,
+            start_date=start_date,
+            end_date=end_date,
+            search_index=configs["pg_search_index"],
+            partitioned=configs["pg_partitioned"],
+        )
+    checkpoint = None
+    if configs["pipeline_checkpoint"]:
+        checkpoint = await load_checkpoint(
+            **minio_configs,
+            run_key=f"{BACKFILL_CHECKPOINT_PREFIX}/{run_id}/{start_date}_{end_date}",
+            fresh=force_recrawl,
+        )
+
+    logger.info(f"Starting backfill partition {start_date} ~ {end_date}.")
+    counts = await run_streaming_pipeline(
+        list_url=f"{configs['korea_kr_base_url']}{configs['korea_kr_list_path']}",
+        start_date=start_date,
+        end_date=end_date,
+        **minio_configs,
+        **pg_configs,
+        fetch_concurrency=fetch_concurrency,
+        transform_workers=configs["transform_max_workers"],
+        transform_engine=configs["transform_engine"],
+        seen_index=seen_index,
+        http_cache=HttpCache.from_env(),
+        skip_unchanged=configs["http_cache_skip_unchanged"],
+        raw_codec=configs["minio_raw_codec"],
+        raw_layout=configs["minio_raw_layout"],
+        dedup_content=configs["minio_raw_dedup"] and not force_recrawl,
+        checkpoint=checkpoint,
+        es_host=configs["es_host"] if configs["es_bulk_enabled"] else None,
+        es_index_prefix=configs["es_index_prefix"],
+        es_concurrency=configs["es_bulk_concurrency"],
+        search_index=configs["pg_search_index"],
+        partitioned=configs["pg_partitioned"],
+    )
+    logger.info(f"Finished backfill partition {start_date} ~ {end_date}: {counts}")
+    return {**partition, "counts": counts}
@@ -0,0 +1,107 @@
+import asyncio
+import json
+import logging
+from collections.abc import AsyncIterator
+
+import asyncpg
+from clients.postgres_client import PostgresClient
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAGE_SIZE = 1000
+
+
+def _row_to_document(row: asyncpg.Record) -> dict:
+    """
+    news 행을 JSON으로 직렬화할 수 있는 dict로 변환
+    """
+    document = dict(row)
+    document["images"] = [json.loads(image) for image in row["images"] or []]
+    for column in ("published_at", "crawled_at", "updated_at"):
+        document[column] = row[column].isoformat()
+    return document
+
+
+def _ndjson_line(document: dict) -> str:
+    return json.dumps(document, ensure_ascii=False) + "\n"
+
+
+async def iter_news_changes(
+    pg_client: PostgresClient,
+    since: int = 0,
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> AsyncIterator[dict]:
+    """
+    change_txid가 since(watermark)보다 큰 행을 (change_txid, change_seq) 순으로 반환합니다.
+    page_size 건씩 마지막 change_txid 이후를 요청하는 keyset pagination이므로
+    페이지가 뒤로 가도 비용이 늘지 않습니다.
+    각 문서의 change_txid가 다음 호출에 사용할 watermark입니다.
+    (아직 끝나지 않은 트랜잭션이 있으면 그 트랜잭션 ID 앞에서 멈춤)
+    """
+    while True:
+        rows = await pg_client.fetch_news_changed_since(since, page_size)
+        for row in rows:
+            yield _row_to_document(row)
+        if len(rows) < page_size:
+            return
+        since = rows[-1]["change_txid"]
+
+
+async def iter_news_changes_ndjson(
+    pg_client: PostgresClient,
+    since: int = 0,
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> AsyncIterator[bytes]:
+    """
+    iter_news_changes의 각 문서를 NDJSON 한 줄(bytes)로 반환합니다.
+    """
+    async for document in iter_news_changes(pg_client, since, page_size):
+        yield _ndjson_line(document).encode("utf-8")
+
+
+async def export_news_changes(
+    pg_host: str,
+    pg_port: str,
+    pg_user: str,
+    pg_password: str,
+    pg_dbname: str,
+    output_path: str,
+    since: int = 0,
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> dict:
+    """
+    watermark(since) 이후 변경된 기사를 output_path에 NDJSON으로 저장합니다.
+    반환값: {"count": 내보낸 건수, "watermark": 다음 실행에 사용할 since}
+    """
+    pg_client = PostgresClient(
+        host=pg_host,
+        port=pg_port,
+        user=pg_user,
+        password=pg_password,
+        dbname=pg_dbname,
+    )
+    await pg_client.connect()
+
+    count, watermark = 0, since
+    lines: list[str] = []
+    try:
+        # 파일 I/O는 이벤트 루프 밖(스레드)에서 한 페이지 분량씩 기록
+        f = await asyncio.to_thread(open, output_path, "w", encoding="utf-8")
+        try:
+            async for document in iter_news_changes(pg_client, since, page_size):
+                lines.append(_ndjson_line(document))
+                count += 1
+                watermark = document["change_txid"]
+                if len(lines) >= page_size:
+                    await asyncio.to_thread(f.writelines, lines)
+                    lines = []
+            await asyncio.to_thread(f.writelines, lines)
+        finally:
+            await asyncio.to_thread(f.close)
+    finally:
+        await pg_client.close()
+
+    logger.info(
+        f"Exported {count} changed news articles (change_txid {since} -> {watermark})."
+    )
+    return {"count": count, "watermark": watermark}
@@ -0,0 +1,215 @@
+import json
+import logging
+from collections import Counter
+
+from clients.minio_client import MINIO_ERRORS, MinioClient
+from minio import S3Error
+from pipelines.raw.incremental import parse_news_id
+from utils.compression import compress, decompress
+
+logger = logging.getLogger(__name__)
+
+# 체크포인트는 Raw 버킷의 이 경로 아래에 실행 단위로 저장
+CHECKPOINT_PREFIX = "_checkpoints"
+
+# 기사 단위 처리 단계 (순서대로 진행)
+STAGES = ("fetched", "stored", "transformed", "loaded")
+DONE_STAGE = STAGES[-1]
+
+
+class CheckpointManifest:
+    """
+    news_id → 마지막으로 끝난 단계와 MinIO에 저장된 Raw HTML 객체 정보
+    실패한 실행을 같은 run_key로 다시 실행하면 끝나지 않은 기사만 처리할 수 있도록 합니다.
+    - stored 이후의 기사는 다시 스크랩하지 않고 MinIO에 저장된 Raw HTML부터 처리
+    - loaded(완료)된 기사는 건너뜀
+    fetched/transformed는 결과가 메모리에만 있으므로 진행 상황 기록용이며,
+    재실행 시에는 각각 스크랩/저장된 Raw HTML부터 다시 처리합니다.
+    """
+
+    def __init__(self, run_key: str, entries: dict[int, dict] | None = None):
+        self.run_key = run_key
+        self._entries = entries or {}
+        self._dirty = False
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def object_name(self) -> str:
+        return f"{CHECKPOINT_PREFIX}/{self.run_key}.json.gz"
+
+    def reached(self, news_id: int | None, stage: str) -> bool:
+        if news_id is None:
+            return False
+        entry = self._entries.get(news_id)
+        return entry is not None and STAGES.index(entry["stage"]) >= STAGES.index(stage)
+
+    def stored_object(self, news_id: int | None) -> dict | None:
+        """
+        저장된 Raw HTML 객체 정보 (아직 적재되지 않은 기사만)
+        """
+        if news_id is None:
+            return None
+        entry = self._entries.get(news_id)
+        if entry is None or entry["stage"] == DONE_STAGE:
+            return None
+        return entry.get("object")
+
+    def mark(self, news_id: int, stage: str, obj: dict | None = None) -> None:
+        """
+        기사의 단계를 기록합니다. 이미 더 뒤의 단계까지 끝난 기사는 되돌리지 않습니다.
+        """
+        entry = self._entries.get(news_id)
+        if entry is not None and STAGES.index(entry["stage"]) >= STAGES.index(stage):
+            return
+        entry = {**(entry or {}), "stage": stage}
+        if obj is not None:
+            entry["object"] = obj
+        self._entries[news_id] = entry
+        self._dirty = True
+
+    def discard(self, news_id: int) -> None:
+        """
+        이번 실행에서 더 처리하지 않는 기사 (내용이 바뀌지 않음)를 체크포인트에서 제외합니다.
+        완료로 기록하지 않으므로 재실행 시 다시 스크랩하여 확인합니다.
+        """
+        if self._entries.pop(news_id, None) is not None:
+            self._dirty = True
+
+    def is_complete(self) -> bool:
+        return all(entry["stage"] == DONE_STAGE for entry in self._entries.values())
+
+    def summary(self) -> dict[str, int]:
+        return dict(Counter(entry["stage"] for entry in self._entries.values()))
+
+    @classmethod
+    async def load(
+        cls,
+        minio_client: MinioClient,
+        minio_bucket_name: str,
+        run_key: str,
+    ) -> "CheckpointManifest":
+        """
+        MinIO에서 체크포인트를 읽어옵니다. (없으면 빈 체크포인트)
+        """
+        checkpoint = cls(run_key)
+        try:
+            data, metadata = await minio_client.download_file(
+                minio_bucket_name, checkpoint.object_name
+            )
+        except S3Error as e:
+            if e.code in ("NoSuchKey", "NoSuchBucket"):
+                logger.info(f"No checkpoint found for '{run_key}'. Starting fresh.")
+                return checkpoint
+            raise
+
+        entries = json.loads(decompress(data, metadata.get("codec")))
+        checkpoint._entries = {
+            int(news_id): entry for news_id, entry in entries.items()
+        }
+        logger.info(f"Resuming '{run_key}' from checkpoint: {checkpoint.summary()}")
+        return checkpoint
+
+    async def save(self, minio_client: MinioClient, minio_bucket_name: str) -> None:
+        """
+        변경된 내용이 있을 때만 체크포인트를 MinIO에 저장합니다.
+        모든 기사가 완료되면 다음 실행이 처음부터 시작하도록 체크포인트를 삭제합니다.
+        """
+        if not self._dirty:
+            return
+        if self.is_complete():
+            await minio_client.delete_file(minio_bucket_name, self.object_name)
+            logger.info(f"All {len(self)} articles of '{self.run_key}' completed.")
+        else:
+            data = json.dumps(self._entries, separators=(",", ":")).encode("utf-8")
+            await minio_client.upload_file(
+                bucket_name=minio_bucket_name,
+                object_name=self.object_name,
+                data=compress(data, "gzip"),
+                metadata={"codec": "gzip"},
+                content_type="application/gzip",
+            )
+            logger.info(f"Saved checkpoint '{self.run_key}': {self.summary()}")
+        self._dirty = False
+
+
+def split_urls_by_checkpoint(
+    urls: list[str], checkpoint: CheckpointManifest
+) -> tuple[list[str], list[dict]]:
+    """
+    URL을 다시 스크랩할 URL과 이미 저장된 Raw HTML 객체 정보로 나눕니다.
+    (완료된 기사는 둘 다에서 제외)
+    """
+    urls_to_fetch, stored_objects = [], []
+    for url in urls:
+        news_id = parse_news_id(url)
+        if checkpoint.reached(news_id, DONE_STAGE):
+            continue
+        if obj := checkpoint.stored_object(news_id):
+            stored_objects.append(obj)
+        else:
+            urls_to_fetch.append(url)
+    if skipped_count := len(urls) - len(urls_to_fetch):
+        logger.info(
+            f"Checkpoint: skipping scrap of {skipped_count} articles "
+            f"({len(stored_objects)} resumed from MinIO)."
+        )
+    return urls_to_fetch, stored_objects
+
+
+async def load_checkpoint(
+    minio_endpoint: str,
+    minio_bucket_name: str,
+    minio_access_key: str,
+    minio_secret_key: str,
+    run_key: str,
+    fresh: bool = False,
+) -> CheckpointManifest:
+    """
+    run_key의 체크포인트를 읽어옵니다.
+    fresh=True(강제 재수집)이면 이전 체크포인트를 무시하고 빈 체크포인트로 시작합니다.
+    """
+    if fresh:
+        logger.info(f"Ignoring previous checkpoint for '{run_key}'. Starting fresh.")
+        checkpoint = CheckpointManifest(run_key)
+        # 기록된 기사가 없어도 저장 시 이전 체크포인트를 덮어쓰거나 지우도록 표시
+        checkpoint._dirty = True
+        return checkpoint
+    minio_client = MinioClient(
+        endpoint=minio_endpoint,
+        access_key=minio_access_key,
+        secret_key=minio_secret_key,
+        secure=False,
+        max_concurrency=2,
+    )
+    try:
+        return await CheckpointManifest.load(minio_client, minio_bucket_name, run_key)
+    finally:
+        minio_client.close()
+
+
+async def save_checkpoint(
+    checkpoint: CheckpointManifest,
+    minio_endpoint: str,
+    minio_bucket_name: str,
+    minio_access_key: str,
+    minio_secret_key: str,
+) -> None:
+    """
+    체크포인트를 저장합니다. 저장 실패는 파이프라인 실패로 취급하지 않습니다.
+    (다음 실행은 마지막으로 저장된 체크포인트부터 다시 처리)
+    """
+    minio_client = MinioClient(
+        endpoint=minio_endpoint,
+        access_key=minio_access_key,
+        secret_key=minio_secret_key,
+        secure=False,
+        max_concurrency=2,
+    )
+    try:
+        await checkpoint.save(minio_client, minio_bucket_name)
+    except MINIO_ERRORS as e:
+        logger.warning(f"Failed to save checkpoint '{checkpoint.run_key}': {e}")
+    finally:
+        minio_client.close()
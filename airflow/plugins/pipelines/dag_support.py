@@ -0,0 +1,88 @@
+import asyncio
+import os
+from contextlib import contextmanager
+
+from pipelines.run_report import publish_metrics_report
+from pipelines.transformed.elasticsearch_loader import index_prefix_from_pattern
+from utils.metrics import metrics
+
+
+def env_configs() -> dict:
+    """
+    DAG 태스크가 공통으로 사용하는 환경 변수 설정
+    """
+    return {
+        "korea_kr_base_url": os.getenv("KOREA_KR_BASE_URL"),
+        "korea_kr_list_path": os.getenv("KOREA_KR_LIST_PATH"),
+        "http_cache_skip_unchanged": os.getenv(
+            "HTTP_CACHE_SKIP_UNCHANGED", "false"
+        ).lower()
+        == "true",
+        "transform_max_workers": int(
+            os.getenv("TRANSFORM_MAX_WORKERS", str(os.cpu_count() or 1))
+        ),
+        "transform_engine": os.getenv("TRANSFORM_ENGINE", "bs4"),
+        "pipeline_checkpoint": os.getenv("PIPELINE_CHECKPOINT", "true").lower()
+        == "true",
+        "minio_endpoint": os.getenv("MINIO_ENDPOINT", "minio:9000"),
+        "minio_raw_news_bucket": os.getenv("MINIO_RAW_NEWS_BUCKET", "raw-news"),
+        "minio_raw_codec": os.getenv("MINIO_RAW_CODEC", "identity"),
+        "minio_raw_layout": os.getenv("MINIO_RAW_LAYOUT", "object"),
+        "minio_raw_dedup": os.getenv("MINIO_RAW_DEDUP", "false").lower() == "true",
+        "minio_transformed_news_bucket": os.getenv(
+            "MINIO_TRANSFORMED_NEWS_BUCKET", "transformed-news"
+        ),
+        "minio_access_key": os.getenv("MINIO_ACCESS_KEY", "myuser"),
+        "minio_secret_key": os.getenv("MINIO_SECRET_KEY", "mypassword"),
+        "pg_host": os.getenv("POSTGRES_HOST", "postgresql"),
+        "pg_port": os.getenv("POSTGRES_PORT", "5432"),
+        "pg_user": os.getenv("POSTGRES_USER", "myuser"),
+        "pg_password": os.getenv("POSTGRES_PASSWORD", "mypassword"),
+        "pg_dbname": os.getenv("POSTGRES_DBNAME", "mydatabase"),
+        "pg_search_index": os.getenv("POSTGRES_SEARCH_INDEX", "false").lower()
+        == "true",
+        "pg_partitioned": os.getenv("POSTGRES_NEWS_PARTITIONED", "false").lower()
+        == "true",
+        "es_bulk_enabled": os.getenv("ELASTICSEARCH_BULK_ENABLED", "false").lower()
+        == "true",
+        "es_bulk_concurrency": int(os.getenv("ELASTICSEARCH_BULK_CONCURRENCY", "4")),
+        "es_host": os.getenv("ELASTICSEARCH_HOST", "http://elasticsearch:9200"),
+        "es_index_prefix": index_prefix_from_pattern(
+            os.getenv("ELASTICSEARCH_INDEX", "korea-policy-news-*")
+        ),
+    }
+
+
+def sanitize_run_id(run_id: str) -> str:
+    # MinIO 객체 이름에 사용할 수 있도록 run_id의 ':'와 '+'를 치환
+    return run_id.replace(":", "-").replace("+", "_")
+
+
+@contextmanager
+def task_metrics(configs: dict, context: dict):
+    """
+    태스크에서 기록된 metrics를 _reports/{run_id}/{task_id}.json(.prom)으로 저장합니다.
+    (매핑된 태스크는 {task_id}_{map_index})
+    """
+    metrics.reset()
+    try:
+        yield
+    finally:
+        ti = context["ti"]
+        task_name = ti.task_id
+        if (map_index := getattr(ti, "map_index", -1)) >= 0:
+            task_name = f"{task_name}_{map_index}"
+        asyncio.run(
+            publish_metrics_report(
+                minio_endpoint=configs["minio_endpoint"],
+                minio_bucket_name=configs["minio_raw_news_bucket"],
+                minio_access_key=configs["minio_access_key"],
+                minio_secret_key=configs["minio_secret_key"],
+                run_name=f"{sanitize_run_id(context['run_id'])}/{task_name}",
+                extra={
+                    "run_id": context["run_id"],
+                    "task_id": ti.task_id,
+                    "map_index": map_index,
+                },
+            )
+        )
@@ -0,0 +1,127 @@
+import hashlib
+import json
+import logging
+from collections.abc import Collection
+
+from clients.minio_client import MINIO_ERRORS, MinioClient
+from minio import S3Error
+from utils.compression import DECOMPRESS_ERRORS, compress, decompress
+
+logger = logging.getLogger(__name__)
+
+# Raw 버킷 안에 저장되는 해시 인덱스 객체
+CONTENT_INDEX_OBJECT_NAME = "_index/content_sha256.json.gz"
+
+
+def content_sha256(raw_html_content: str) -> str:
+    return hashlib.sha256(raw_html_content.encode("utf-8")).hexdigest()
+
+
+class ContentHashIndex:
+    """
+    news_id → 마지막으로 PostgreSQL에 적재된 Raw HTML의 sha256
+    MinIO에 gzip JSON 객체 하나로 저장되며, 실행 시작 시 읽고 끝날 때 다시 저장합니다.
+    저장만 되고 적재되지 않은 기사의 해시는 기록하지 않으므로 다음 실행에서 다시 처리됩니다.
+    (동시에 실행된 두 작업이 저장하면 나중 것이 남지만, 빠진 해시는 다음 실행에서 한 번 더 업로드될 뿐임)
+    """
+
+    def __init__(self, hashes: dict[int, str] | None = None):
+        self._hashes = hashes or {}
+        self._dirty = False
+
+    def __len__(self) -> int:
+        return len(self._hashes)
+
+    def is_unchanged(self, news_id: int, digest: str) -> bool:
+        return self._hashes.get(news_id) == digest
+
+    def update(self, news_id: int, digest: str) -> None:
+        if self._hashes.get(news_id) != digest:
+            self._hashes[news_id] = digest
+            self._dirty = True
+
+    def update_loaded(
+        self, minio_objects: list[dict], loaded_news_ids: Collection[int]
+    ) -> None:
+        """
+        MinIO 객체 정보 중 PostgreSQL에 적재된 기사의 해시만 기록합니다.
+        """
+        loaded_news_ids = set(loaded_news_ids)
+        for obj in minio_objects:
+            if obj["news_id"] in loaded_news_ids and obj.get("content_sha256"):
+                self.update(obj["news_id"], obj["content_sha256"])
+
+    @classmethod
+    async def load(
+        cls,
+        minio_client: MinioClient,
+        minio_bucket_name: str,
+        object_name: str = CONTENT_INDEX_OBJECT_NAME,
+    ) -> "ContentHashIndex":
+        """
+        MinIO에서 해시 인덱스를 읽어옵니다. (없으면 빈 인덱스)
+        """
+        try:
+            data, metadata = await minio_client.download_file(
+                minio_bucket_name, object_name
+            )
+        except S3Error as e:
+            if e.code in ("NoSuchKey", "NoSuchBucket"):
+                logger.info("No content hash index found. Starting with an empty one.")
+                return cls()
+            raise
+
+        hashes = json.loads(decompress(data, metadata.get("codec")))
+        logger.info(f"Loaded {len(hashes)} content hashes.")
+        return cls({int(news_id): digest for news_id, digest in hashes.items()})
+
+    async def save(
+        self,
+        minio_client: MinioClient,
+        minio_bucket_name: str,
+        object_name: str = CONTENT_INDEX_OBJECT_NAME,
+    ) -> None:
+        """
+        변경된 내용이 있을 때만 해시 인덱스를 MinIO에 저장합니다.
+        """
+        if not self._dirty:
+            return
+        data = json.dumps(self._hashes, separators=(",", ":")).encode("utf-8")
+        await minio_client.upload_file(
+            bucket_name=minio_bucket_name,
+            object_name=object_name,
+            data=compress(data, "gzip"),
+            metadata={"codec": "gzip"},
+            content_type="application/gzip",
+        )
+        self._dirty = False
+        logger.info(f"Saved {len(self._hashes)} content hashes.")
+
+
+async def record_loaded_hashes(
+    minio_endpoint: str,
+    minio_bucket_name: str,
+    minio_access_key: str,
+    minio_secret_key: str,
+    minio_objects: list[dict],
+    loaded_news_ids: Collection[int],
+) -> None:
+    """
+    PostgreSQL에 적재된 기사의 해시를 해시 인덱스에 기록합니다.
+    저장 실패는 파이프라인 실패로 취급하지 않습니다. (다음 실행에서 다시 적재될 뿐임)
+    """
+    minio_client = MinioClient(
+        endpoint=minio_endpoint,
+        access_key=minio_access_key,
+        secret_key=minio_secret_key,
+        secure=False,
+        max_concurrency=2,
+    )
+    try:
+        hash_index = await ContentHashIndex.load(minio_client, minio_bucket_name)
+        hash_index.update_loaded(minio_objects, loaded_news_ids)
+        await hash_index.save(minio_client, minio_bucket_name)
+    except MINIO_ERRORS + DECOMPRESS_ERRORS + (json.JSONDecodeError,) as e:
+        logger.warning(f"Failed to record content hashes: {e}")
+    finally:
+        minio_client.close()
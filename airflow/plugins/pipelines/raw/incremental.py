@@ -0,0 +1,93 @@
+import logging
+from array import array
+from bisect import bisect_left
+from datetime import datetime, timedelta
+from urllib.parse import parse_qs, urlparse
+
+from clients.postgres_client import PostgresClient
+
+logger = logging.getLogger(__name__)
+
+
+def parse_news_id(url: str) -> int | None:
+    """
+    뉴스 URL의 newsId 쿼리 파라미터를 정수로 반환
+    """
+    if news_id_qs := parse_qs(urlparse(url).query).get("newsId"):
+        try:
+            return int(news_id_qs[0])
+        except ValueError:
+            return None
+    return None
+
+
+class SeenNewsIndex:
+    """
+    이미 적재된 뉴스 ID의 정렬된 집합
+    정렬된 int64 배열에 대한 이진 탐색으로 멤버십을 확인합니다.
+    """
+
+    def __init__(self, sorted_news_ids: list[int] | None = None):
+        self._ids = array("q", sorted_news_ids or [])
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, news_id: int | None) -> bool:
+        if news_id is None:
+            return False
+        i = bisect_left(self._ids, news_id)
+        return i < len(self._ids) and self._ids[i] == news_id
+
+    @classmethod
+    async def load_from_postgres(
+        cls,
+        pg_host: str,
+        pg_port: str,
+        pg_user: str,
+        pg_password: str,
+        pg_dbname: str,
+        start_date: str,
+        end_date: str,
+        margin_days: int = 1,
+        search_index: bool = False,
+        partitioned: bool = False,
+    ) -> "SeenNewsIndex":
+        """
+        수집 기간(앞뒤로 margin_days 여유)에 발행된 뉴스 ID를 news 테이블에서 읽어옵니다.
+        news 테이블이 없으면 적재 단계와 같은 설정(search_index, partitioned)으로 만듭니다.
+        """
+        pg_client = PostgresClient(
+            host=pg_host,
+            port=pg_port,
+            user=pg_user,
+            password=pg_password,
+            dbname=pg_dbname,
+        )
+        await pg_client.connect()
+        try:
+            await pg_client.create_news_table(
+                search_index=search_index, partitioned=partitioned
+            )
+            news_ids = await pg_client.fetch_news_ids_published_between(
+                start=datetime.fromisoformat(start_date).astimezone()
+                - timedelta(days=margin_days),
+                end=datetime.fromisoformat(end_date).astimezone()
+                + timedelta(days=1 + margin_days),
+            )
+        finally:
+            await pg_client.close()
+
+        logger.info(f"Loaded {len(news_ids)} already ingested news IDs.")
+        return cls(news_ids)
+
+
+def filter_unseen_urls(urls: list[str], seen_index: SeenNewsIndex) -> list[str]:
+    """
+    이미 적재된 뉴스 ID의 URL을 제외합니다.
+    """
+    unseen_urls = [url for url in urls if parse_news_id(url) not in seen_index]
+    logger.info(
+        f"Skipping {len(urls) - len(unseen_urls)} already ingested news articles."
+    )
+    return unseen_urls
@@ -1,10 +1,170 @@
+import asyncio
 import logging
 from datetime import datetime
 
 from clients.minio_client import MinioClient
+from pipelines.checkpoint import CheckpointManifest, split_urls_by_checkpoint
+from pipelines.raw.content_index import ContentHashIndex, content_sha256
+from pipelines.raw.raw_scraper import scrap_raw_html_batch
+from pipelines.raw.shard_store import DEFAULT_MAX_SHARD_BYTES, ShardWriter
+from utils.compression import (
+    CODEC_CONTENT_TYPES,
+    CODEC_SUFFIXES,
+    IDENTITY,
+    compress,
+    validate_codec,
+)
+from utils.http_cache import HttpCache
+from utils.metrics import metrics
 
 logger = logging.getLogger(__name__)
 
+# object: 기사별 객체 / shard: 샤드 객체 + 인덱스
+RAW_LAYOUTS = ("object", "shard")
+
+
+async def upload_raw_to_minio(
+    minio_client: MinioClient,
+    minio_bucket_name: str,
+    raw_html_content: str,
+    original_url: str,
+    news_id: int,
+    codec: str = IDENTITY,
+    content_hash: str | None = None,
+) -> dict:
+    """
+    Raw HTML 한 건을 MinIO에 업로드하고 업로드된 객체 정보를 반환합니다.
+    codec(gzip | zstd)을 지정하면 압축하여 저장하고 메타데이터에 codec을 기록합니다.
+    메타데이터에는 Raw HTML의 sha256(content_sha256)도 기록합니다.
+    """
+    try:
+        # 현재 날짜 추출
+        now = datetime.now()
+
+        object_name = (
+            f"{now.year}/{now.month:02d}/{now.day:02d}/{news_id}_{now.strftime('%H%M%S')}.html"
+            f"{CODEC_SUFFIXES[codec]}"
+        )
+        metadata = {
+            "crawled_at": now.isoformat(),
+            "content_sha256": content_hash or content_sha256(raw_html_content),
+        }
+        data = raw_html_content.encode("utf-8")
+        if codec != IDENTITY:
+            metadata["codec"] = codec
+            # 압축은 이벤트 루프 밖에서 수행
+            data = await asyncio.to_thread(compress, data, codec)
+        await minio_client.upload_file(
+            bucket_name=minio_bucket_name,
+            object_name=object_name,
+            data=data,
+            metadata=metadata,
+            content_type=CODEC_CONTENT_TYPES.get(codec, "text/html"),
+        )
+    except Exception:
+        logger.error(f"Failed to upload raw HTML for news ID {news_id} to MinIO.")
+        raise Exception(f"MinIO upload failed for news ID {news_id}")
+
+    return {
+        "news_id": news_id,
+        "minio_path": object_name,
+        "original_url": original_url,
+        "crawled_at": metadata["crawled_at"],
+        "content_sha256": metadata["content_sha256"],
+    }
+
+
+async def _store_raws(
+    minio_client: MinioClient,
+    minio_bucket_name: str,
+    scraped_raw_data: list[tuple[str, str, int]],
+    codec: str,
+    shard_writer: ShardWriter | None,
+    hash_index: ContentHashIndex | None = None,
+    checkpoint: CheckpointManifest | None = None,
+) -> list[dict]:
+    """
+    shard_writer가 있으면 샤드에 추가하고, 없으면 기사별 객체로 업로드합니다.
+    hash_index가 있으면 마지막으로 적재된 내용과 같은 기사는 저장하지 않습니다.
+    (해시는 PostgreSQL 적재가 끝난 뒤 record_loaded_hashes로 기록)
+    일부 기사의 저장이 실패해도 나머지 기사는 저장하며, 저장된 기사만 반환합니다.
+    checkpoint가 있으면 저장된 기사를 stored로 기록합니다.
+    """
+    to_store = []
+    for raw_html_content, original_url, news_id in scraped_raw_data:
+        content_hash = content_sha256(raw_html_content)
+        if hash_index is not None and hash_index.is_unchanged(news_id, content_hash):
+            if checkpoint is not None:
+                checkpoint.discard(news_id)
+            continue
+        to_store.append((raw_html_content, original_url, news_id, content_hash))
+    if skipped_count := len(scraped_raw_data) - len(to_store):
+        logger.info(f"Skipping {skipped_count} unchanged raw HTML files.")
+
+    if shard_writer is not None:
+        tasks = [
+            shard_writer.add(
+                raw_html_content=raw_html_content,
+                original_url=original_url,
+                news_id=news_id,
+                content_hash=content_hash,
+            )
+            for raw_html_content, original_url, news_id, content_hash in to_store
+        ]
+    else:
+        tasks = [
+            upload_raw_to_minio(
+                minio_client=minio_client,
+                minio_bucket_name=minio_bucket_name,
+                raw_html_content=raw_html_content,
+                original_url=original_url,
+                news_id=news_id,
+                codec=codec,
+                content_hash=content_hash,
+            )
+            for raw_html_content, original_url, news_id, content_hash in to_store
+        ]
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    minio_uploaded_objects = []
+    for (_, _, news_id, _), result in zip(to_store, results):
+        if isinstance(result, BaseException):
+            metrics.record_error("store", result)
+            logger.error(f"Error storing raw HTML for news ID {news_id}: {result}")
+            continue
+        minio_uploaded_objects.append(result)
+        if checkpoint is not None:
+            checkpoint.mark(news_id, "stored", result)
+    if failed_count := len(to_store) - len(minio_uploaded_objects):
+        logger.warning(f"Failed to store {failed_count} raw HTML files.")
+    return minio_uploaded_objects
+
+
+def create_shard_writer(
+    minio_client: MinioClient,
+    minio_bucket_name: str,
+    layout: str,
+    codec: str,
+    max_shard_bytes: int,
+    max_shard_records: int | None = None,
+) -> ShardWriter | None:
+    """
+    layout이 shard이면 ShardWriter를, object이면 None을 반환합니다.
+    """
+    if layout not in RAW_LAYOUTS:
+        raise ValueError(
+            f"Unknown raw layout: {layout} (available: {', '.join(RAW_LAYOUTS)})"
+        )
+    if layout == "object":
+        return None
+    return ShardWriter(
+        minio_client=minio_client,
+        minio_bucket_name=minio_bucket_name,
+        codec=codec,
+        max_shard_bytes=max_shard_bytes,
+        max_shard_records=max_shard_records,
+    )
+
 
 async def load_raws_to_minio(
     minio_endpoint: str,
@@ -12,56 +172,152 @@ async def load_raws_to_minio(
     minio_access_key: str,
     minio_secret_key: str,
     scraped_raw_data: list[tuple[str, str, int]],
+    max_concurrency: int = 32,
+    codec: str = IDENTITY,
+    layout: str = "object",
+    max_shard_bytes: int = DEFAULT_MAX_SHARD_BYTES,
+    dedup_content: bool = False,
+    checkpoint: CheckpointManifest | None = None,
 ):
     """
     스크랩된 Raw HTML 데이터를 MinIO(Data Lake)에 저장합니다.
+    업로드는 최대 max_concurrency 개까지 동시에 진행됩니다.
+    layout="shard"이면 기사별 객체 대신 샤드 객체에 묶어 저장합니다.
+    dedup_content=True이면 내용(sha256)이 바뀌지 않은 기사는 저장하지 않고 반환값에서도 제외합니다.
+    checkpoint가 있으면 저장된 기사를 기록하고 저장이 끝난 뒤 체크포인트를 저장합니다.
     """
+    codec = validate_codec(codec)
+
     # MinIO 클라이언트 초기화
     minio_client = MinioClient(
         endpoint=minio_endpoint,
         access_key=minio_access_key,
         secret_key=minio_secret_key,
         secure=False,
+        max_concurrency=max_concurrency,
     )
 
     # Raw HTML -> MinIO
-    successfully_uploaded_count = 0
-    minio_uploaded_objects = []
-    for (
-        raw_html_content,
-        original_url,
-        news_id,
-    ) in scraped_raw_data:
-        try:
-            # 현재 날짜 추출
-            now = datetime.now()
-
-            object_name = f"{now.year}/{now.month:02d}/{now.day:02d}/{news_id}_{now.strftime('%H%M%S')}.html"
-            metadata = {
-                "crawled_at": now.isoformat(),
-            }
-            await minio_client.upload_file(
-                bucket_name=minio_bucket_name,
-                object_name=object_name,
-                data=raw_html_content.encode("utf-8"),
-                metadata=metadata,
-                content_type="text/html",
-            )
+    try:
+        shard_writer = create_shard_writer(
+            minio_client, minio_bucket_name, layout, codec, max_shard_bytes
+        )
+        # 버킷 확인은 업로드 전에 한 번만 수행
+        await minio_client.ensure_bucket(minio_bucket_name)
+        hash_index = (
+            await ContentHashIndex.load(minio_client, minio_bucket_name)
+            if dedup_content
+            else None
+        )
 
-            successfully_uploaded_count += 1
-            minio_uploaded_objects.append(
-                {
-                    "news_id": news_id,
-                    "minio_path": object_name,
-                    "original_url": original_url,
-                }
-            )
+        minio_uploaded_objects = await _store_raws(
+            minio_client,
+            minio_bucket_name,
+            scraped_raw_data,
+            codec,
+            shard_writer,
+            hash_index,
+            checkpoint,
+        )
+        if shard_writer is not None:
+            await shard_writer.close()
+        # 체크포인트는 업로드가 끝난 뒤에 저장
+        if checkpoint is not None:
+            await checkpoint.save(minio_client, minio_bucket_name)
+    finally:
+        minio_client.close()
+
+    logger.info(
+        f"Finished processing. Successfully uploaded {len(minio_uploaded_objects)} raw HTML files to MinIO."
+    )
+    return minio_uploaded_objects
+
+
+async def scrap_and_load_raws_to_minio(
+    page_urls: list[str],
+    minio_endpoint: str,
+    minio_bucket_name: str,
+    minio_access_key: str,
+    minio_secret_key: str,
+    chunk_size: int = 100,
+    http_cache: HttpCache | None = None,
+    skip_unchanged: bool = False,
+    codec: str = IDENTITY,
+    layout: str = "object",
+    max_shard_bytes: int = DEFAULT_MAX_SHARD_BYTES,
+    max_concurrency: int = 32,
+    dedup_content: bool = False,
+    checkpoint: CheckpointManifest | None = None,
+) -> list[dict]:
+    """
+    뉴스 URL을 chunk_size 개씩 스크랩하여 곧바로 MinIO에 저장합니다.
+    Raw HTML은 chunk 단위로만 메모리에 유지되며 (layout="shard"이면 샤드 크기까지),
+    반환값에는 업로드된 객체 정보(manifest)만 포함됩니다.
+    dedup_content=True이면 내용(sha256)이 바뀌지 않은 기사는 저장하지 않습니다.
+    checkpoint가 있으면 이전 실행에서 이미 저장된 기사는 다시 스크랩하지 않고
+    저장된 객체 정보를 그대로 반환하며, 완료된 기사는 제외합니다.
+    """
+    codec = validate_codec(codec)
 
-            logger.info(
-                f"Finished processing. Successfully uploaded {successfully_uploaded_count} raw HTML files to MinIO."
+    minio_client = MinioClient(
+        endpoint=minio_endpoint,
+        access_key=minio_access_key,
+        secret_key=minio_secret_key,
+        secure=False,
+        max_concurrency=max_concurrency,
+    )
+
+    minio_uploaded_objects: list[dict] = []
+    if checkpoint is not None:
+        page_urls, minio_uploaded_objects = split_urls_by_checkpoint(
+            page_urls, checkpoint
+        )
+    shard_writer = None
+    try:
+        # 샤드는 chunk 경계와 관계없이 max_shard_bytes까지 채움
+        shard_writer = create_shard_writer(
+            minio_client, minio_bucket_name, layout, codec, max_shard_bytes
+        )
+        await minio_client.ensure_bucket(minio_bucket_name)
+        hash_index = (
+            await ContentHashIndex.load(minio_client, minio_bucket_name)
+            if dedup_content
+            else None
+        )
+
+        for i in range(0, len(page_urls), chunk_size):
+            scraped_raw_data = await scrap_raw_html_batch(
+                page_urls[i : i + chunk_size],
+                http_cache=http_cache,
+                skip_unchanged=skip_unchanged,
             )
-        except Exception:
-            logger.error(f"Failed to upload raw HTML for news ID {news_id} to MinIO.")
-            raise Exception(f"MinIO upload failed for news ID {news_id}")
+            if not scraped_raw_data:
+                continue
+            if checkpoint is not None:
+                for _, _, news_id in scraped_raw_data:
+                    checkpoint.mark(news_id, "fetched")
+            minio_uploaded_objects.extend(
+                await _store_raws(
+                    minio_client,
+                    minio_bucket_name,
+                    scraped_raw_data,
+                    codec,
+                    shard_writer,
+                    hash_index,
+                    checkpoint,
+                )
+            )
+    finally:
+        # 중간에 실패해도 그때까지 저장된 기사는 기록하여 재실행 시 이어서 처리
+        try:
+            if shard_writer is not None:
+                await shard_writer.close()
+            if checkpoint is not None:
+                await checkpoint.save(minio_client, minio_bucket_name)
+        finally:
+            minio_client.close()
 
+    logger.info(
+        f"Finished processing. Successfully uploaded {len(minio_uploaded_objects)} raw HTML files to MinIO."
+    )
     return minio_uploaded_objects
@@ -1,82 +1,207 @@
 import asyncio
 import logging
+import time
 from urllib.parse import parse_qs, urlparse
 
 import httpx
 from utils.headers_generator import get_headers
+from utils.http_cache import HttpCache
+from utils.log_events import get_event_logger
+from utils.metrics import metrics
+from utils.rate_limiter import (
+    BACKOFF_STATUS_CODES,
+    AdaptiveRateLimiter,
+    parse_retry_after,
+)
 
 logger = logging.getLogger(__name__)
+events = get_event_logger(__name__)
 
 
-async def scrap_raw_html(url: str, client: httpx.AsyncClient):
+async def request_with_retries(
+    client: httpx.AsyncClient,
+    method: str,
+    url: str,
+    rate_limiter: AdaptiveRateLimiter | None = None,
+    max_retries: int = 0,
+    **kwargs,
+) -> httpx.Response:
+    """
+    rate_limiter 한도 내에서 요청을 보내고,
+    429/5xx 응답이나 네트워크 오류는 최대 max_retries 번까지 재시도합니다.
+    """
+    rate_limiter = rate_limiter or AdaptiveRateLimiter()
+
+    for attempt in range(max_retries + 1):
+        try:
+            async with rate_limiter.throttle(url) as throttle:
+                # 대기 시간을 제외한 요청 자체의 지연 시간
+                started_at = time.perf_counter()
+                res = await client.request(method, url, **kwargs)
+                elapsed = time.perf_counter() - started_at
+                metrics.observe("http_request", elapsed)
+                metrics.inc("http_request")
+                metrics.add_bytes("http_request", len(res.content))
+                throttle.status_code = res.status_code
+                throttle.retry_after = parse_retry_after(res.headers.get("Retry-After"))
+                # 304는 조건부 요청의 정상 응답
+                if res.status_code != httpx.codes.NOT_MODIFIED:
+                    res.raise_for_status()
+            events.debug(
+                "http_response",
+                method=method,
+                url=url,
+                status=res.status_code,
+                attempt=attempt,
+                elapsed_ms=round(elapsed * 1000, 1),
+            )
+            return res
+        except httpx.HTTPStatusError as e:
+            logger.error(f"{url} - {e.response.status_code}")
+            metrics.record_error("http_request", f"HTTP {e.response.status_code}")
+            if (
+                e.response.status_code not in BACKOFF_STATUS_CODES
+                or attempt == max_retries
+            ):
+                raise
+        except httpx.RequestError as e:
+            logger.error(f"Request failed for {url}: {e}")
+            metrics.record_error("http_request", e)
+            if attempt == max_retries:
+                raise
+        logger.info(f"Retrying {url} ({attempt + 1}/{max_retries})")
+
+    raise RuntimeError("unreachable")
+
+
+async def scrap_raw_html(
+    url: str,
+    client: httpx.AsyncClient,
+    rate_limiter: AdaptiveRateLimiter | None = None,
+    max_retries: int = 0,
+    http_cache: HttpCache | None = None,
+    skip_unchanged: bool = False,
+):
     """
     URL에서 뉴스 페이지의 Raw HTML와 뉴스 ID를 스크랩합니다.
+    rate_limiter가 주어지면 요청 속도를 조절하고,
+    429/5xx 응답이나 네트워크 오류는 최대 max_retries 번까지 재시도합니다.
+    http_cache가 주어지면 조건부 요청을 보내고, 304 응답이면 캐시된 본문을 사용합니다.
+    (skip_unchanged=True이면 변경되지 않은 기사는 None을 반환)
     반환값: tuple(raw_html_content, original_url, news_id)
     """
-    try:
-        res = await client.get(url)
-        res.raise_for_status()
-        logger.info(f"{url} - {res.status_code}")
-    except httpx.HTTPStatusError as e:
-        logger.error(f"{url} - {e.response.status_code}")
-        raise
-    except httpx.RequestError as e:
-        logger.error(f"Request failed for {url}: {e}")
-        raise
-
-    news_id = None
-    if news_id_qs := parse_qs(urlparse(url).query).get("newsId"):
-        try:
-            news_id = int(news_id_qs[0])
-            logger.info(f"News ID: {news_id} - Successfully extracted")
-        except ValueError:
-            logger.error(f"Could not convert newsId '{news_id_qs[0]}' to integer.")
+    # 기사 한 건의 스크랩 시간 (재시도/대기 포함)
+    with metrics.timer("fetch"):
+        conditional_headers = http_cache.validators(url) if http_cache else {}
+        res = await request_with_retries(
+            client,
+            "GET",
+            url,
+            rate_limiter=rate_limiter,
+            max_retries=max_retries,
+            headers=conditional_headers,
+        )
+
+        raw_html_content = None
+        if http_cache:
+            if res.status_code == 304:
+                raw_html_content = http_cache.get_body(url)
+                if raw_html_content is not None:
+                    logger.debug("%s - Not modified, using cached body", url)
+                    metrics.inc("fetch_not_modified")
+                    if skip_unchanged:
+                        return None
+            else:
+                http_cache.store(url, res)
+
+        if raw_html_content is None:
+            if res.status_code == 304:
+                # 검증값을 보낸 사이 캐시 본문이 삭제된 경우 전체 요청으로 다시 받음
+                res = await request_with_retries(
+                    client,
+                    "GET",
+                    url,
+                    rate_limiter=rate_limiter,
+                    max_retries=max_retries,
+                )
+            raw_html_content = res.text
+
+        news_id = None
+        if news_id_qs := parse_qs(urlparse(url).query).get("newsId"):
+            try:
+                news_id = int(news_id_qs[0])
+            except ValueError:
+                logger.error(f"Could not convert newsId '{news_id_qs[0]}' to integer.")
+                raise
+        else:
+            logger.error("News ID not found in URL.")
             raise
-    else:
-        logger.error("News ID not found in URL.")
-        raise
 
-    return res.text, url, news_id
+        metrics.inc("fetch")
+        events.info(
+            "article_fetched",
+            news_id=news_id,
+            status=res.status_code,
+            chars=len(raw_html_content),
+        )
+        return raw_html_content, url, news_id
 
 
 async def scrap_raw_html_batch(
     page_urls: list[str],
-    batch_size: int = 5,
-    delay_between_batches: int = 2,
+    rate_limiter: AdaptiveRateLimiter | None = None,
+    max_retries: int = 2,
+    http_cache: HttpCache | None = None,
+    skip_unchanged: bool = False,
+    transport: httpx.AsyncBaseTransport | None = None,
 ):
     """
-    뉴스 URL 리스트를 받아 배치 단위로 비동기 스크래핑 처리합니다.
-    각 배치는 지정된 시간만큼 지연을 둡니다.
+    뉴스 URL 리스트를 받아 비동기 스크래핑 처리합니다.
+    고정된 배치/대기 시간 대신 AdaptiveRateLimiter가
+    서버 응답 속도와 오류에 맞춰 요청 속도와 동시 요청 수를 조절합니다.
+    URL마다 태스크를 만들지 않고, 동시 요청 상한만큼의 워커가 큐에서 URL을 가져가므로
+    대기 중인 태스크 수가 URL 수와 관계없이 일정합니다.
+    transport를 지정하면 실제 서버 대신 다른 전송 계층으로 요청합니다.
     """
 
-    logger.info(
-        f"Starting batch processing of {len(page_urls)} news articles, {batch_size} per batch."
-    )
-    processed_articles = []
+    logger.info(f"Starting processing of {len(page_urls)} news articles.")
+    rate_limiter = rate_limiter or AdaptiveRateLimiter()
+
+    url_queue: asyncio.Queue = asyncio.Queue()
+    for index, url in enumerate(page_urls):
+        url_queue.put_nowait((index, url))
+    # 결과는 입력 URL 순서대로 반환
+    results: list = [None] * len(page_urls)
 
     async with httpx.AsyncClient(
         headers=get_headers(referer="https://www.korea.kr"),
+        transport=transport,
     ) as client:
-        for i in range(0, len(page_urls), batch_size):
-            batch_urls = page_urls[i : i + batch_size]
-            logger.info(
-                f"Processing batch {i // batch_size + 1}: {len(batch_urls)} articles."
-            )
 
-            tasks = [scrap_raw_html(url, client) for url in batch_urls]
-            batch_results = await asyncio.gather(*tasks, return_exceptions=True)
+        async def worker():
+            while True:
+                try:
+                    index, url = url_queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                try:
+                    results[index] = await scrap_raw_html(
+                        url,
+                        client,
+                        rate_limiter=rate_limiter,
+                        max_retries=max_retries,
+                        http_cache=http_cache,
+                        skip_unchanged=skip_unchanged,
+                    )
+                # newsId가 없는 URL은 RuntimeError
+                except (httpx.HTTPError, ValueError, RuntimeError) as e:
+                    logger.error(f"Error processing news article: {e}")
 
-            for result in batch_results:
-                if isinstance(result, Exception):
-                    logger.error(f"Error processing news article: {result}")
-                else:
-                    processed_articles.append(result)
+        workers = min(rate_limiter.max_concurrency_per_host, len(page_urls))
+        await asyncio.gather(*(worker() for _ in range(workers)))
+
+    processed_articles = [result for result in results if result is not None]
 
-            if i + batch_size < len(page_urls):
-                logger.info(
-                    f"Waiting for {delay_between_batches} seconds until next batch..."
-                )
-                await asyncio.sleep(delay_between_batches)
     logger.info(f"Finished processing {len(processed_articles)} news articles.")
 
     return processed_articles
@@ -0,0 +1,211 @@
+import asyncio
+import json
+import logging
+import uuid
+from collections.abc import AsyncIterator
+from datetime import datetime
+
+from clients.minio_client import MinioClient
+from pipelines.raw.content_index import content_sha256
+from utils.compression import IDENTITY, compress, decompress, validate_codec
+
+logger = logging.getLogger(__name__)
+
+SHARD_PREFIX = "shards"
+SHARD_INDEX_SUFFIX = ".index.json"
+DEFAULT_MAX_SHARD_BYTES = 64 * 1024 * 1024
+
+
+class ShardWriter:
+    """
+    Raw HTML 여러 건을 하나의 append-only 샤드 객체(.pack)로 묶어 MinIO에 저장합니다.
+    각 기사(레코드)는 독립적으로 압축되어 이어 붙여지며,
+    샤드마다 news_id → (offset, length)를 기록한 인덱스 객체(.pack.index.json)를 함께 저장합니다.
+    버퍼가 max_shard_bytes를 넘거나 레코드가 max_shard_records 건이 되면
+    현재 샤드를 업로드하고 다음 샤드를 시작합니다.
+    업로드에 실패한 샤드의 레코드는 버리며 다시 업로드하지 않습니다.
+    """
+
+    def __init__(
+        self,
+        minio_client: MinioClient,
+        minio_bucket_name: str,
+        codec: str = IDENTITY,
+        max_shard_bytes: int = DEFAULT_MAX_SHARD_BYTES,
+        max_shard_records: int | None = None,
+    ):
+        self.minio_client = minio_client
+        self.minio_bucket_name = minio_bucket_name
+        self.codec = validate_codec(codec)
+        self.max_shard_bytes = max_shard_bytes
+        self.max_shard_records = max_shard_records
+
+        now = datetime.now()
+        # 같은 날 여러 번 실행되어도 샤드 이름이 겹치지 않도록 실행마다 고유한 접두사 사용
+        self._name_prefix = (
+            f"{SHARD_PREFIX}/{now.year}/{now.month:02d}/{now.day:02d}/"
+            f"{now.strftime('%H%M%S')}_{uuid.uuid4().hex[:8]}"
+        )
+        self._sequence = 0
+        self._buffer = bytearray()
+        self._records: list[dict] = []
+        self._lock = asyncio.Lock()
+        self.shard_paths: list[str] = []
+        # 업로드에 실패한 샤드와 예외
+        self.failed_shards: dict[str, BaseException] = {}
+        # wait_uploaded로 업로드를 기다리는 샤드
+        self._waiters: dict[str, asyncio.Future] = {}
+
+    @property
+    def _shard_path(self) -> str:
+        return f"{self._name_prefix}_{self._sequence:04d}.pack"
+
+    async def add(
+        self,
+        raw_html_content: str,
+        original_url: str,
+        news_id: int,
+        content_hash: str | None = None,
+    ) -> dict:
+        """
+        기사 한 건을 현재 샤드에 추가하고 객체 정보를 반환합니다.
+        (반환된 객체는 해당 샤드가 업로드된 뒤부터 읽을 수 있음 — wait_uploaded 참고)
+        """
+        crawled_at = datetime.now().isoformat()
+        content_hash = content_hash or content_sha256(raw_html_content)
+        data = raw_html_content.encode("utf-8")
+        if self.codec != IDENTITY:
+            data = await asyncio.to_thread(compress, data, self.codec)
+
+        async with self._lock:
+            obj = {
+                "news_id": news_id,
+                "minio_path": self._shard_path,
+                "offset": len(self._buffer),
+                "length": len(data),
+                "original_url": original_url,
+                "crawled_at": crawled_at,
+                "codec": self.codec,
+                "content_sha256": content_hash,
+            }
+            self._buffer += data
+            self._records.append(obj)
+            if len(self._buffer) >= self.max_shard_bytes or (
+                self.max_shard_records is not None
+                and len(self._records) >= self.max_shard_records
+            ):
+                await self._flush()
+        return obj
+
+    async def wait_uploaded(self, obj: dict) -> None:
+        """
+        add가 반환한 객체의 샤드가 업로드될 때까지 기다립니다.
+        샤드 업로드에 실패했으면 그 예외를 발생시킵니다.
+        (이 writer가 만든 샤드가 아니면 이미 업로드된 것으로 보고 바로 반환)
+        """
+        shard_path = obj["minio_path"]
+        if not shard_path.startswith(self._name_prefix) or (
+            shard_path in self.shard_paths
+        ):
+            return
+        if shard_path in self.failed_shards:
+            raise self.failed_shards[shard_path]
+        if shard_path not in self._waiters:
+            self._waiters[shard_path] = asyncio.get_running_loop().create_future()
+        await asyncio.shield(self._waiters[shard_path])
+
+    async def close(self) -> None:
+        """
+        남은 레코드를 업로드합니다.
+        """
+        async with self._lock:
+            await self._flush()
+
+    async def _flush(self) -> None:
+        if not self._records:
+            return
+
+        shard_path = self._shard_path
+        index = {
+            "shard": shard_path,
+            "codec": self.codec,
+            "records": [
+                {
+                    key: record[key]
+                    for key in (
+                        "news_id",
+                        "offset",
+                        "length",
+                        "original_url",
+                        "crawled_at",
+                        "content_sha256",
+                    )
+                }
+                for record in self._records
+            ],
+        }
+        try:
+            # 샤드를 먼저 올리고 인덱스를 올려, 인덱스가 있는 샤드는 항상 완전함
+            await self.minio_client.upload_file(
+                bucket_name=self.minio_bucket_name,
+                object_name=shard_path,
+                data=bytes(self._buffer),
+                metadata={"codec": self.codec, "records": str(len(self._records))},
+                content_type="application/octet-stream",
+            )
+            await self.minio_client.upload_file(
+                bucket_name=self.minio_bucket_name,
+                object_name=f"{shard_path}{SHARD_INDEX_SUFFIX}",
+                data=json.dumps(index, ensure_ascii=False).encode("utf-8"),
+                metadata={},
+                content_type="application/json",
+            )
+        except Exception as e:
+            # 실패한 레코드가 다음 샤드와 함께 다시 업로드되지 않도록 버퍼를 비움
+            logger.error(
+                f"Failed to upload shard '{shard_path}' ({len(self._records)} records): {e}"
+            )
+            self.failed_shards[shard_path] = e
+            self._start_next_shard(shard_path, e)
+            raise
+
+        logger.info(
+            f"Uploaded shard '{shard_path}' ({len(self._records)} records, {len(self._buffer)} bytes)."
+        )
+        self.shard_paths.append(shard_path)
+        self._start_next_shard(shard_path)
+
+    def _start_next_shard(
+        self, shard_path: str, error: BaseException | None = None
+    ) -> None:
+        self._sequence += 1
+        self._buffer = bytearray()
+        self._records = []
+        if (waiter := self._waiters.pop(shard_path, None)) is not None:
+            if error is None:
+                waiter.set_result(None)
+            else:
+                waiter.set_exception(error)
+
+
+async def iter_shard_records(
+    minio_client: MinioClient,
+    minio_bucket_name: str,
+    shard_path: str,
+) -> AsyncIterator[tuple[str, dict]]:
+    """
+    샤드 전체를 한 번에 내려받아 (raw_html_content, 레코드 정보)를 순서대로 반환합니다.
+    재처리처럼 샤드의 모든 기사를 읽을 때 사용합니다.
+    """
+    index_data, _ = await minio_client.download_file(
+        minio_bucket_name, f"{shard_path}{SHARD_INDEX_SUFFIX}"
+    )
+    index = json.loads(index_data)
+    shard_data, _ = await minio_client.download_file(minio_bucket_name, shard_path)
+
+    for record in index["records"]:
+        data = shard_data[record["offset"] : record["offset"] + record["length"]]
+        yield (
+            decompress(data, index["codec"]).decode("utf-8"),
+            {**record, "minio_path": shard_path, "codec": index["codec"]},
+        )
@@ -1,51 +1,138 @@
+import asyncio
 import logging
-import time
+from collections.abc import AsyncIterator
 
 import httpx
 from bs4 import BeautifulSoup
+from pipelines.raw.raw_scraper import request_with_retries
+from utils.headers_generator import get_headers
+from utils.metrics import metrics
+from utils.rate_limiter import AdaptiveRateLimiter
 
 logger = logging.getLogger(__name__)
 
 
+def _parse_urls_from_list_page(content: bytes) -> list[str]:
+    """
+    뉴스 목록 페이지에서 기사 URL을 추출
+    """
+    soup = BeautifulSoup(content, "lxml")
+    return [
+        f"https://www.korea.kr{a_tag['href']}"
+        for a_tag in soup.select("div.article_wrap div.list_type li > a")
+    ]
+
+
+async def _fetch_list_page(
+    client: httpx.AsyncClient,
+    url: str,
+    page: int,
+    start_date: str,
+    end_date: str,
+    rate_limiter: AdaptiveRateLimiter,
+    max_retries: int,
+) -> list[str]:
+    # form#mainForm
+    form_data = {
+        "pageIndex": page,
+        "startDate": start_date,
+        "endDate": end_date,
+        "period": "direct",
+    }
+    with metrics.timer("list_page"):
+        res = await request_with_retries(
+            client,
+            "POST",
+            url,
+            rate_limiter=rate_limiter,
+            max_retries=max_retries,
+            data=form_data,
+        )
+        page_results = _parse_urls_from_list_page(res.content)
+    metrics.inc("list_page_urls", len(page_results))
+    logger.info(f"Found {len(page_results)} news items on page {page}")
+    return page_results
+
+
+async def iter_urls_from_webpage(
+    url: str,
+    start_date: str,  # 사용 가능한 가장 과거 일자: 1970-01-01
+    end_date: str,
+    client: httpx.AsyncClient | None = None,
+    rate_limiter: AdaptiveRateLimiter | None = None,
+    probe_ahead: int = 5,
+    max_retries: int = 2,
+) -> AsyncIterator[str]:
+    """
+    뉴스 목록 페이지를 probe_ahead 페이지씩 미리 동시에 요청하고,
+    발견한 URL을 페이지 순서대로 즉시 반환(yield)합니다.
+    빈 페이지가 나오면 그 이후 페이지는 버리고 종료합니다.
+    하나의 커넥션 풀(client)과 rate_limiter를 모든 페이지 요청에 재사용합니다.
+    """
+    rate_limiter = rate_limiter or AdaptiveRateLimiter()
+    owns_client = client is None
+    http_client = client or httpx.AsyncClient(
+        headers=get_headers(referer="https://www.korea.kr"),
+    )
+
+    seen_urls: set[str] = set()
+    next_page = 1
+    try:
+        while True:
+            pages = range(next_page, next_page + probe_ahead)
+            tasks = [
+                asyncio.create_task(
+                    _fetch_list_page(
+                        http_client,
+                        url,
+                        page,
+                        start_date,
+                        end_date,
+                        rate_limiter,
+                        max_retries,
+                    )
+                )
+                for page in pages
+            ]
+            try:
+                for task in tasks:
+                    page_results = await task
+                    if not page_results:
+                        logger.info("Finished scraping: No more news found")
+                        return
+                    for page_url in page_results:
+                        # 수집 중 새 기사가 올라와 목록이 밀리면 중복이 생길 수 있음
+                        if page_url not in seen_urls:
+                            seen_urls.add(page_url)
+                            yield page_url
+            finally:
+                # 빈 페이지 이후 미리 요청한 페이지는 취소
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+            next_page += probe_ahead
+    finally:
+        if owns_client:
+            await http_client.aclose()
+
+
+async def scrap_urls_from_webpage_async(
+    url: str,
+    start_date: str,  # 사용 가능한 가장 과거 일자: 1970-01-01
+    end_date: str,
+    **kwargs,
+) -> list[str]:
+    return [
+        page_url
+        async for page_url in iter_urls_from_webpage(
+            url, start_date, end_date, **kwargs
+        )
+    ]
+
+
 def scrap_urls_from_webpage(
     url: str,
     start_date: str,  # 사용 가능한 가장 과거 일자: 1970-01-01
     end_date: str,
 ) -> list[str]:
-    news_list = []
-    page = 1
-    while True:
-        try:
-            # form#mainForm
-            form_data = {
-                "pageIndex": page,
-                "startDate": start_date,
-                "endDate": end_date,
-                "period": "direct",
-            }
-            res = httpx.post(url, data=form_data)
-            res.raise_for_status()
-        except httpx.HTTPStatusError as e:
-            logger.error(f"{url} - {e.response.status_code}")
-            raise
-        except httpx.RequestError as e:
-            logger.error(f"Request failed for {url}: {e}")
-            raise
-
-        soup = BeautifulSoup(res.content, "lxml")
-        page_results = [
-            f"https://www.korea.kr{a_tag['href']}"
-            for a_tag in soup.select("div.article_wrap div.list_type li > a")
-        ]
-
-        if not page_results:
-            logger.info("Finished scraping: No more news found")
-            break
-
-        news_list.extend(page_results)
-        logger.info(f"Found {len(page_results)} news items on page {page}")
-
-        page += 1
-        time.sleep(1)
-
-    return news_list
+    return asyncio.run(scrap_urls_from_webpage_async(url, start_date, end_date))
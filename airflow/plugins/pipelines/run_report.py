@@ -0,0 +1,63 @@
+import logging
+import os
+import tempfile
+
+from clients.minio_client import MINIO_ERRORS, MinioClient
+from utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+# 실행 리포트는 Raw 버킷의 이 경로 아래에 저장
+REPORT_PREFIX = "_reports"
+
+
+def write_prometheus_textfile(path: str) -> None:
+    """
+    node_exporter textfile collector가 읽을 수 있도록 Prometheus 텍스트를 원자적으로 기록합니다.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    with os.fdopen(fd, "w") as f:
+        f.write(metrics.to_prometheus())
+    os.replace(tmp_path, path)
+
+
+async def publish_metrics_report(
+    minio_endpoint: str,
+    minio_bucket_name: str,
+    minio_access_key: str,
+    minio_secret_key: str,
+    run_name: str,
+    extra: dict | None = None,
+) -> str | None:
+    """
+    현재 프로세스의 metrics를 {REPORT_PREFIX}/{run_name}.json(.prom)으로 MinIO에 저장하고,
+    METRICS_TEXTFILE_PATH가 설정되어 있으면 Prometheus 텍스트 파일도 기록합니다.
+    리포트 저장 실패는 파이프라인 실패로 취급하지 않습니다.
+    """
+    report_path = None
+    minio_client = MinioClient(
+        endpoint=minio_endpoint,
+        access_key=minio_access_key,
+        secret_key=minio_secret_key,
+        secure=False,
+        max_concurrency=2,
+    )
+    try:
+        report_path = await metrics.upload_report(
+            minio_client,
+            minio_bucket_name,
+            f"{REPORT_PREFIX}/{run_name}",
+            extra=extra,
+        )
+    except MINIO_ERRORS as e:
+        logger.warning(f"Failed to upload metrics report: {e}")
+    finally:
+        minio_client.close()
+
+    if textfile_path := os.getenv("METRICS_TEXTFILE_PATH"):
+        try:
+            write_prometheus_textfile(textfile_path)
+        except OSError as e:
+            logger.warning(f"Failed to write metrics textfile: {e}")
+    return report_path
@@ -0,0 +1,428 @@
+import asyncio
+import logging
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+import httpx
+from clients.elasticsearch_client import ElasticsearchClient
+from clients.minio_client import MINIO_ERRORS, MinioClient
+from clients.postgres_client import PostgresClient
+from models.news import News
+from pipelines.checkpoint import DONE_STAGE, CheckpointManifest
+from pipelines.raw.content_index import ContentHashIndex, content_sha256
+from pipelines.raw.incremental import SeenNewsIndex, parse_news_id
+from pipelines.raw.minio_loader import create_shard_writer, upload_raw_to_minio
+from pipelines.raw.raw_scraper import scrap_raw_html
+from pipelines.raw.shard_store import DEFAULT_MAX_SHARD_BYTES
+from pipelines.raw.urls_scraper import iter_urls_from_webpage
+from pipelines.transformed.elasticsearch_loader import (
+    ES_INDEX_PREFIX,
+    bulk_index_news,
+)
+from pipelines.transformed.minio_extractor import download_raw
+from pipelines.transformed.raw_transformer import transform_raw
+from utils.compression import IDENTITY, decompress, validate_codec
+from utils.headers_generator import get_headers
+from utils.http_cache import HttpCache
+from utils.metrics import metrics
+from utils.rate_limiter import AdaptiveRateLimiter
+
+logger = logging.getLogger(__name__)
+
+# 각 단계의 워커에게 입력이 끝났음을 알리는 값
+_DONE = object()
+
+
+async def _run_stage(
+    stage_name: str,
+    in_queue: asyncio.Queue,
+    out_queue: asyncio.Queue | None,
+    handler,
+    workers: int,
+    downstream_workers: int,
+    counts: Counter,
+    on_finish=None,
+):
+    """
+    in_queue의 항목을 handler로 처리해 out_queue로 넘기는 워커들을 실행합니다.
+    개별 항목의 실패는 로그만 남기고 다음 항목을 계속 처리합니다.
+    handler가 None을 반환한 항목은 다음 단계로 넘기지 않습니다.
+    on_finish가 주어지면 모든 워커가 끝난 뒤, 다음 단계에 종료를 알리기 전에 실행합니다.
+    """
+
+    async def worker():
+        while True:
+            item = await in_queue.get()
+            if item is _DONE:
+                break
+            try:
+                result = await handler(item)
+            # 한 항목의 실패가 스테이지 전체를 멈추지 않도록 모든 예외를 기록하고 넘어감
+            except Exception as e:  # noqa: BLE001
+                counts[f"{stage_name}_failed"] += 1
+                logger.error(f"[{stage_name}] Error processing item: {e}")
+                continue
+            if result is None:
+                counts[f"{stage_name}_skipped"] += 1
+                continue
+            counts[stage_name] += 1
+            if out_queue is not None:
+                await out_queue.put(result)
+
+    try:
+        try:
+            await asyncio.gather(*(worker() for _ in range(workers)))
+        finally:
+            if on_finish is not None:
+                await on_finish()
+    finally:
+        if out_queue is not None:
+            for _ in range(downstream_workers):
+                await out_queue.put(_DONE)
+
+
+async def run_streaming_pipeline(
+    list_url: str,
+    start_date: str,
+    end_date: str,
+    minio_endpoint: str,
+    minio_bucket_name: str,
+    minio_access_key: str,
+    minio_secret_key: str,
+    pg_host: str,
+    pg_port: str,
+    pg_user: str,
+    pg_password: str,
+    pg_dbname: str,
+    queue_size: int = 100,
+    fetch_concurrency: int = 10,
+    upload_concurrency: int = 16,
+    load_batch_size: int = 100,
+    transform_workers: int = 1,
+    transform_engine: str = "bs4",
+    seen_index: SeenNewsIndex | None = None,
+    http_cache: HttpCache | None = None,
+    skip_unchanged: bool = False,
+    raw_codec: str = IDENTITY,
+    raw_layout: str = "object",
+    dedup_content: bool = False,
+    checkpoint: CheckpointManifest | None = None,
+    es_host: str | None = None,
+    es_index_prefix: str = ES_INDEX_PREFIX,
+    es_concurrency: int = 4,
+    search_index: bool = False,
+    partitioned: bool = False,
+) -> dict:
+    """
+    URL 수집 → Raw HTML 스크랩 → MinIO 적재 → 변환 → PostgreSQL 적재를
+    크기가 제한된 큐로 연결하여 기사 단위로 흘려보냅니다.
+    각 기사는 준비되는 즉시 다음 단계로 넘어가며,
+    메모리 사용량은 수집 기간이 아닌 큐 크기에 비례합니다.
+    seen_index가 주어지면 이미 적재된 기사는 스크랩하지 않습니다.
+    http_cache가 주어지면 조건부 요청을 사용하며,
+    skip_unchanged=True이면 변경되지 않은 기사는 이후 단계로 넘기지 않습니다.
+    raw_codec(gzip | zstd)을 지정하면 Raw HTML을 압축하여 저장합니다.
+    raw_layout="shard"이면 Raw HTML을 샤드 객체에 묶어 저장합니다.
+    dedup_content=True이면 마지막으로 적재된 내용(sha256)과 같은 기사는 저장 이후 단계로 넘기지 않습니다.
+    checkpoint가 주어지면 기사별로 끝난 단계를 기록하고,
+    이전 실행에서 저장된 기사는 스크랩 대신 MinIO에서 읽으며 완료된 기사는 건너뜁니다.
+    es_host가 주어지면 PostgreSQL에 적재된 기사를 Elasticsearch에도 _bulk API로 색인합니다.
+    search_index=True이면 PostgreSQL 전문 검색용 컬럼과 인덱스도 생성합니다.
+    partitioned=True이면 news 테이블을 게시월 단위 파티션 테이블로 만들거나 옮깁니다.
+    반환값: 단계별 처리/실패 건수
+    """
+    raw_codec = validate_codec(raw_codec)
+    counts: Counter = Counter()
+    # fetch 워커 수는 호스트별 동시 요청 상한과 같게 두고, 실제 속도는 rate_limiter가 조절
+    rate_limiter = AdaptiveRateLimiter(max_concurrency_per_host=fetch_concurrency)
+
+    url_queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+    raw_queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+    stored_queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+    transformed_queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+
+    minio_client = MinioClient(
+        endpoint=minio_endpoint,
+        access_key=minio_access_key,
+        secret_key=minio_secret_key,
+        secure=False,
+        max_concurrency=upload_concurrency,
+    )
+    # 변환 단계는 샤드가 업로드된 기사만 처리하므로, 큐가 가득 차기 전에 샤드가 업로드되도록
+    # 샤드당 레코드 수를 큐 크기로 제한
+    shard_writer = create_shard_writer(
+        minio_client,
+        minio_bucket_name,
+        raw_layout,
+        raw_codec,
+        DEFAULT_MAX_SHARD_BYTES,
+        max_shard_records=queue_size,
+    )
+    pg_client = PostgresClient(
+        host=pg_host,
+        port=pg_port,
+        user=pg_user,
+        password=pg_password,
+        dbname=pg_dbname,
+    )
+    es_client = (
+        ElasticsearchClient(host=es_host, max_concurrency=es_concurrency)
+        if es_host
+        else None
+    )
+    hash_index: ContentHashIndex | None = None
+    # 저장된 기사의 해시 (PostgreSQL에 적재된 뒤 hash_index에 기록)
+    stored_hashes: dict[int, str | None] = {}
+    # 4. 변환: CPU 작업이므로 프로세스 풀에서 실행
+    transform_executor = ProcessPoolExecutor(max_workers=transform_workers)
+
+    async def transform(stored):
+        raw_html_content, original_object_info = stored
+        if shard_writer is not None:
+            # Raw HTML이 MinIO에 업로드된 기사만 변환/적재 (업로드 실패 시 예외)
+            await shard_writer.wait_uploaded(original_object_info)
+            if checkpoint is not None:
+                checkpoint.mark(
+                    original_object_info["news_id"], "stored", original_object_info
+                )
+        metadata = {"crawled_at": original_object_info["crawled_at"]}
+        # 스테이지 워커 수와 프로세스 수가 같으므로 풀 대기 시간은 거의 포함되지 않음
+        with metrics.timer("transform"):
+            transformed = await asyncio.get_running_loop().run_in_executor(
+                transform_executor,
+                transform_raw,
+                raw_html_content,
+                metadata,
+                original_object_info,
+                transform_engine,
+            )
+        metrics.inc("transform")
+        if checkpoint is not None:
+            checkpoint.mark(original_object_info["news_id"], "transformed")
+        return transformed
+
+    # 5. PostgreSQL 적재: 큐에 쌓인 만큼 모아서 한 번에 적재
+    async def load_to_postgres():
+        finished = False
+        while not finished:
+            batch: list[str] = []
+            item = await transformed_queue.get()
+            while item is not _DONE:
+                batch.append(item)
+                if len(batch) >= load_batch_size or transformed_queue.empty():
+                    break
+                item = transformed_queue.get_nowait()
+            finished = item is _DONE
+
+            if batch:
+                try:
+                    news_items = [
+                        News.model_validate_json(news_item) for news_item in batch
+                    ]
+                    load_result = await pg_client.bulk_insert_news(news_items)
+                    counts["loaded"] += len(news_items)
+                    counts.update(
+                        {f"loaded_{status}": n for status, n in load_result.items()}
+                    )
+                    for news_item in news_items:
+                        if checkpoint is not None:
+                            checkpoint.mark(news_item.id, DONE_STAGE)
+                        # 적재된 기사의 해시만 기록
+                        if hash_index is not None and (
+                            content_hash := stored_hashes.pop(news_item.id, None)
+                        ):
+                            hash_index.update(news_item.id, content_hash)
+                # 적재 루프가 멈추면 앞 단계가 가득 찬 큐에서 멈추므로 모든 예외를 기록하고 넘어감
+                except Exception as e:  # noqa: BLE001
+                    counts["loaded_failed"] += len(batch)
+                    logger.error(f"[loaded] Error loading {len(batch)} articles: {e}")
+                    continue
+
+                # 6. Elasticsearch 색인: 적재된 기사만 (실패해도 PostgreSQL 적재는 유지)
+                if es_client is not None:
+                    try:
+                        index_result = await bulk_index_news(
+                            es_client,
+                            news_items,
+                            index_prefix=es_index_prefix,
+                            max_concurrency=es_concurrency,
+                        )
+                        counts.update(
+                            {f"indexed_{key}": n for key, n in index_result.items()}
+                        )
+                    # 색인 실패로 적재 루프가 멈추지 않도록 모든 예외를 기록하고 넘어감
+                    except Exception as e:  # noqa: BLE001
+                        counts["indexed_failed"] += len(news_items)
+                        logger.error(
+                            f"[indexed] Error indexing {len(news_items)} articles: {e}"
+                        )
+
+    try:
+        await pg_client.connect()
+        await pg_client.create_news_table(
+            search_index=search_index, partitioned=partitioned
+        )
+        await minio_client.ensure_bucket(minio_bucket_name)
+        hash_index = (
+            await ContentHashIndex.load(minio_client, minio_bucket_name)
+            if dedup_content
+            else None
+        )
+
+        async with httpx.AsyncClient(
+            headers=get_headers(referer="https://www.korea.kr"),
+        ) as http_client:
+            # 1. 뉴스 URL 리스트 크롤링: 발견되는 즉시 다음 단계로 전달
+            async def produce_urls():
+                try:
+                    async for url in iter_urls_from_webpage(
+                        url=list_url,
+                        start_date=start_date,
+                        end_date=end_date,
+                        client=http_client,
+                        rate_limiter=rate_limiter,
+                    ):
+                        counts["urls"] += 1
+                        news_id = parse_news_id(url)
+                        if seen_index and news_id in seen_index:
+                            counts["skipped"] += 1
+                            continue
+                        if checkpoint is not None and checkpoint.reached(
+                            news_id, DONE_STAGE
+                        ):
+                            counts["skipped"] += 1
+                            continue
+                        await url_queue.put(url)
+                except Exception as e:
+                    logger.error(f"[urls] Error scraping news list: {e}")
+                    raise
+                finally:
+                    for _ in range(fetch_concurrency):
+                        await url_queue.put(_DONE)
+
+            # 2. Raw HTML 스크랩
+            async def fetch(url):
+                # 이전 실행에서 저장된 기사는 MinIO에서 읽음
+                if checkpoint is not None and (
+                    obj := checkpoint.stored_object(parse_news_id(url))
+                ):
+                    data, metadata = await download_raw(
+                        minio_client, minio_bucket_name, obj
+                    )
+                    counts["resumed"] += 1
+                    raw_html_content = decompress(data, metadata.get("codec"))
+                    return raw_html_content.decode("utf-8"), url, obj["news_id"]
+
+                scraped = await scrap_raw_html(
+                    url,
+                    http_client,
+                    rate_limiter=rate_limiter,
+                    max_retries=2,
+                    http_cache=http_cache,
+                    skip_unchanged=skip_unchanged,
+                )
+                if checkpoint is not None and scraped is not None:
+                    checkpoint.mark(scraped[2], "fetched")
+                return scraped
+
+            # 3. Raw HTML을 MinIO에 저장
+            async def store(scraped):
+                raw_html_content, original_url, news_id = scraped
+                if checkpoint is not None and (
+                    obj := checkpoint.stored_object(news_id)
+                ):
+                    stored_hashes[news_id] = obj.get("content_sha256")
+                    return raw_html_content, obj
+                content_hash = content_sha256(raw_html_content)
+                if hash_index is not None and hash_index.is_unchanged(
+                    news_id, content_hash
+                ):
+                    if checkpoint is not None:
+                        checkpoint.discard(news_id)
+                    return None
+                if shard_writer is not None:
+                    obj = await shard_writer.add(
+                        raw_html_content=raw_html_content,
+                        original_url=original_url,
+                        news_id=news_id,
+                        content_hash=content_hash,
+                    )
+                else:
+                    obj = await upload_raw_to_minio(
+                        minio_client=minio_client,
+                        minio_bucket_name=minio_bucket_name,
+                        raw_html_content=raw_html_content,
+                        original_url=original_url,
+                        news_id=news_id,
+                        codec=raw_codec,
+                        content_hash=content_hash,
+                    )
+                stored_hashes[news_id] = content_hash
+                # 샤드에 추가된 기사는 샤드가 업로드된 뒤 변환 단계에서 기록
+                if checkpoint is not None and shard_writer is None:
+                    checkpoint.mark(news_id, "stored", obj)
+                return raw_html_content, obj
+
+            async def flush_shards():
+                # 업로드 실패는 해당 샤드의 기사만 변환 단계에서 실패로 처리됨
+                try:
+                    await shard_writer.close()
+                except MINIO_ERRORS as e:
+                    logger.error(f"[stored] Error uploading last shard: {e}")
+
+            results = await asyncio.gather(
+                produce_urls(),
+                _run_stage(
+                    "fetched",
+                    url_queue,
+                    raw_queue,
+                    fetch,
+                    workers=fetch_concurrency,
+                    downstream_workers=upload_concurrency,
+                    counts=counts,
+                ),
+                _run_stage(
+                    "stored",
+                    raw_queue,
+                    stored_queue,
+                    store,
+                    workers=upload_concurrency,
+                    downstream_workers=transform_workers,
+                    counts=counts,
+                    # 입력이 끝나면 마지막 샤드를 업로드하여 기다리는 변환 작업을 깨움
+                    on_finish=flush_shards if shard_writer is not None else None,
+                ),
+                _run_stage(
+                    "transformed",
+                    stored_queue,
+                    transformed_queue,
+                    transform,
+                    workers=transform_workers,
+                    downstream_workers=1,
+                    counts=counts,
+                ),
+                load_to_postgres(),
+                return_exceptions=True,
+            )
+            # 실패한 경우에도 샤드에 추가된 기사는 업로드
+            if shard_writer is not None:
+                await shard_writer.close()
+            # 적재된 기사의 해시만 기록되므로 실패한 경우에도 저장
+            if hash_index is not None:
+                await hash_index.save(minio_client, minio_bucket_name)
+            # 다음 실행이 끝나지 않은 기사부터 이어서 처리할 수 있도록 저장
+            if checkpoint is not None:
+                await checkpoint.save(minio_client, minio_bucket_name)
+            # 모든 단계가 정리된 뒤 첫 번째 예외를 전파
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+    finally:
+        transform_executor.shutdown(wait=True)
+        minio_client.close()
+        await pg_client.close()
+        if es_client is not None:
+            await es_client.close()
+
+    logger.info(f"Finished streaming pipeline: {dict(counts)}")
+    return dict(counts)
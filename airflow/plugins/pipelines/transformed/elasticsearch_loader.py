@@ -0,0 +1,211 @@
+import asyncio
+import json
+import logging
+from collections import Counter
+from collections.abc import Collection
+from datetime import UTC
+
+import httpx
+from clients.elasticsearch_client import ElasticsearchClient
+from models.news import News
+from pydantic import ValidationError
+from utils.metrics import metrics
+from utils.rate_limiter import BACKOFF_STATUS_CODES, parse_retry_after
+
+logger = logging.getLogger(__name__)
+
+# Logstash(elk/config/logstash.conf)와 같은 korea-policy-news-YYYY.MM.dd 인덱스 (UTC 기준 게시일)
+ES_INDEX_PREFIX = "korea-policy-news"
+# _bulk 요청 하나의 최대 크기 (Elasticsearch 권장 범위 5~15MB)
+DEFAULT_MAX_BATCH_BYTES = 5 * 1024 * 1024
+DEFAULT_MAX_BATCH_DOCS = 1000
+
+
+def index_prefix_from_pattern(index_pattern: str) -> str:
+    """
+    인덱스 패턴(korea-policy-news-*)에서 날짜를 제외한 접두사를 반환합니다.
+    """
+    return index_pattern.rstrip("*").rstrip("-") or ES_INDEX_PREFIX
+
+
+def es_index_name(news: News, index_prefix: str = ES_INDEX_PREFIX) -> str:
+    """
+    기사가 저장될 인덱스 이름 (게시일 기준)
+    Logstash가 @timestamp(게시일)로 정하는 인덱스와 같도록 UTC 날짜를 사용하므로,
+    두 경로로 색인해도 같은 기사는 항상 같은 인덱스의 같은 문서를 갱신합니다.
+    """
+    return f"{index_prefix}-{news.published_at.astimezone(UTC):%Y.%m.%d}"
+
+
+def _bulk_entry(news: News, index_prefix: str) -> bytes:
+    """
+    기사 하나의 _bulk 요청 항목 (action 줄 + 문서 줄)
+    update + doc_as_upsert를 사용하므로 내용이 같은 문서는 Elasticsearch가 쓰지 않습니다. (noop)
+    """
+    action = {
+        "update": {"_index": es_index_name(news, index_prefix), "_id": str(news.id)}
+    }
+    document = news.model_dump(mode="json")
+    document["@timestamp"] = document["published_at"]
+    return (
+        json.dumps(action, ensure_ascii=False)
+        + "\n"
+        + json.dumps({"doc": document, "doc_as_upsert": True}, ensure_ascii=False)
+        + "\n"
+    ).encode("utf-8")
+
+
+def split_bulk_batches(
+    entries: list[bytes],
+    max_batch_bytes: int = DEFAULT_MAX_BATCH_BYTES,
+    max_batch_docs: int = DEFAULT_MAX_BATCH_DOCS,
+) -> list[list[bytes]]:
+    """
+    _bulk 항목을 max_batch_bytes 바이트, max_batch_docs 건을 넘지 않는 배치로 나눕니다.
+    (항목 하나가 max_batch_bytes보다 크면 단독 배치)
+    """
+    batches: list[list[bytes]] = []
+    batch: list[bytes] = []
+    batch_bytes = 0
+    for entry in entries:
+        if batch and (
+            batch_bytes + len(entry) > max_batch_bytes or len(batch) >= max_batch_docs
+        ):
+            batches.append(batch)
+            batch, batch_bytes = [], 0
+        batch.append(entry)
+        batch_bytes += len(entry)
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+async def _send_batch(
+    es_client: ElasticsearchClient,
+    batch: list[bytes],
+    counts: Counter,
+    max_retries: int,
+    retry_backoff: float,
+) -> None:
+    """
+    배치를 _bulk API로 전송합니다.
+    거부된 문서(429, 5xx)만 모아 지수 백오프 후 다시 전송하고,
+    매핑 오류 등 재시도해도 성공하지 않는 문서는 실패로 기록합니다.
+    """
+    pending = batch
+    for attempt in range(max_retries + 1):
+        delay = retry_backoff * 2**attempt
+        try:
+            response = await es_client.bulk(b"".join(pending))
+        except httpx.HTTPStatusError as e:
+            metrics.record_error("es_bulk", f"http_{e.response.status_code}")
+            if e.response.status_code not in BACKOFF_STATUS_CODES:
+                logger.error(f"Elasticsearch _bulk request failed: {e}")
+                break
+            delay = parse_retry_after(e.response.headers.get("Retry-After")) or delay
+            retry = pending
+        except httpx.RequestError as e:
+            metrics.record_error("es_bulk", e)
+            retry = pending
+        else:
+            retry = []
+            for entry, item in zip(pending, response["items"]):
+                result = next(iter(item.values()))
+                status = result["status"]
+                if status < 300:
+                    counts[result.get("result", "indexed")] += 1
+                elif status in BACKOFF_STATUS_CODES:
+                    retry.append(entry)
+                else:
+                    counts["failed"] += 1
+                    metrics.record_error("es_bulk", f"http_{status}")
+                    logger.error(
+                        f"Failed to index document {result.get('_id')}: "
+                        f"{result.get('error')}"
+                    )
+            if not retry:
+                return
+            metrics.record_error("es_bulk", "rejected")
+
+        pending = retry
+        if attempt < max_retries:
+            logger.warning(
+                f"Retrying {len(pending)} Elasticsearch documents in {delay:.1f}s "
+                f"(attempt {attempt + 1}/{max_retries})."
+            )
+            await asyncio.sleep(delay)
+
+    counts["failed"] += len(pending)
+
+
+async def bulk_index_news(
+    es_client: ElasticsearchClient,
+    news_items: list[News],
+    index_prefix: str = ES_INDEX_PREFIX,
+    max_batch_bytes: int = DEFAULT_MAX_BATCH_BYTES,
+    max_batch_docs: int = DEFAULT_MAX_BATCH_DOCS,
+    max_concurrency: int = 4,
+    max_retries: int = 3,
+    retry_backoff: float = 0.5,
+) -> dict[str, int]:
+    """
+    News 객체를 크기가 제한된 _bulk 배치로 나누어 최대 max_concurrency 개씩 동시에 전송합니다.
+    반환값: 결과별 문서 수 {"created", "updated", "noop", "failed"}
+    """
+    entries = [_bulk_entry(news_item, index_prefix) for news_item in news_items]
+    batches = split_bulk_batches(entries, max_batch_bytes, max_batch_docs)
+    semaphore = asyncio.Semaphore(max_concurrency)
+    counts: Counter = Counter()
+
+    async def send(batch: list[bytes]) -> None:
+        async with semaphore:
+            await _send_batch(es_client, batch, counts, max_retries, retry_backoff)
+
+    await asyncio.gather(*(send(batch) for batch in batches))
+    metrics.inc("es_indexed", len(entries) - counts["failed"])
+    return dict(counts)
+
+
+async def load_transforms_to_elasticsearch(
+    news_items: list[str],
+    es_host: str,
+    news_ids: Collection[int] | None = None,
+    index_prefix: str = ES_INDEX_PREFIX,
+    max_concurrency: int = 4,
+    max_batch_bytes: int = DEFAULT_MAX_BATCH_BYTES,
+) -> dict[str, int]:
+    """
+    변환된 News 객체를 Elasticsearch에 색인합니다.
+    news_ids가 주어지면 해당 기사(예: PostgreSQL 적재에 성공한 기사)만 색인합니다.
+    반환값: 결과별 문서 수 {"created", "updated", "noop", "failed"}
+    """
+    logger.info("Starting indexing transformed data to Elasticsearch.")
+
+    selected_ids = set(news_ids) if news_ids is not None else None
+    parsed_news_items: list[News] = []
+    for news_item in news_items:
+        try:
+            news = News.model_validate_json(news_item)
+        except ValidationError as e:
+            logger.error(f"Invalid transformed news item, skipping: {e}")
+            continue
+        if selected_ids is None or news.id in selected_ids:
+            parsed_news_items.append(news)
+
+    es_client = ElasticsearchClient(host=es_host, max_concurrency=max_concurrency)
+    try:
+        counts = await bulk_index_news(
+            es_client,
+            parsed_news_items,
+            index_prefix=index_prefix,
+            max_batch_bytes=max_batch_bytes,
+            max_concurrency=max_concurrency,
+        )
+    finally:
+        await es_client.close()
+
+    logger.info(
+        f"Finished indexing {len(parsed_news_items)} news articles to Elasticsearch: "
+        f"{counts}"
+    )
+    return counts
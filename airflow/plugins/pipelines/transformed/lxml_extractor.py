@@ -0,0 +1,285 @@
+import json
+import logging
+from datetime import datetime
+from urllib.parse import parse_qs, urlparse
+
+from lxml import etree
+from models.news import Image, News
+
+logger = logging.getLogger(__name__)
+
+
+def _has_class(name: str) -> str:
+    # CSS 클래스 선택자(.name)와 같은 조건
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# XPath는 프로세스당 한 번만 컴파일
+_TITLE = etree.XPath(f"//div[{_has_class('view_title')}]/h1")
+_SUBTITLES = etree.XPath(f"//div[{_has_class('article_head')}]/h2")
+_INFO_SPANS = etree.XPath(f"//div[{_has_class('info')}]//span")
+_CONTENTS = etree.XPath(f"//div[{_has_class('view_cont')}]")
+_IMAGES = etree.XPath(f"//span[{_has_class('imageSpan')}]/img")
+_LD_JSON = etree.XPath('//script[@type="application/ld+json"]')
+_CHILD_NODES = etree.XPath("node()")
+
+# BeautifulSoup의 get_text()와 같이 하위 script/style/template 내부 텍스트와 주석은 제외
+# ($depth: 기준 요소의 조상 수 → 기준 요소 내부의 태그만 제외 대상으로 봄)
+_TEXT = etree.XPath(
+    "descendant::text()[not(ancestor::*"
+    "[self::script or self::style or self::template]"
+    "[count(ancestor::*) > $depth])]"
+)
+# publisher: <i> 태그를 제거(decompose)한 뒤의 텍스트
+_TEXT_WITHOUT_I = etree.XPath(
+    "descendant::text()[not(ancestor::*"
+    "[self::script or self::style or self::template or self::i]"
+    "[count(ancestor::*) > $depth])]"
+)
+
+_PARSER = etree.HTMLParser(encoding="utf-8")
+
+
+# BeautifulSoup은 공백 문자로만 이루어진 문자열을 "\n" 또는 " "로 줄임 (pre/textarea 제외)
+_ASCII_SPACES = "\x20\x0a\x09\x0c\x0d"
+_PRESERVE_WHITESPACE_TAGS = {"pre", "textarea"}
+
+
+def _normalize(text) -> str:
+    if text.strip(_ASCII_SPACES):
+        return text
+    parent = text.getparent()
+    if text.is_tail:
+        parent = parent.getparent()
+    while parent is not None:
+        if parent.tag in _PRESERVE_WHITESPACE_TAGS:
+            return text
+        parent = parent.getparent()
+    return "\n" if "\n" in text else " "
+
+
+def _text(element, xpath=_TEXT) -> str:
+    depth = sum(1 for _ in element.iterancestors())
+    return "".join(_normalize(text) for text in xpath(element, depth=depth))
+
+
+def parse_html_tree(raw_html_content: bytes):
+    return etree.fromstring(raw_html_content, parser=_PARSER)
+
+
+# extract_news가 사용하는 영역
+_REGION_DIV_CLASSES = {"view_title", "article_head", "info", "view_cont"}
+
+
+def _is_region(tag: str, attrib) -> bool:
+    if tag == "div":
+        return not _REGION_DIV_CLASSES.isdisjoint(attrib.get("class", "").split())
+    if tag == "span":
+        return "imageSpan" in attrib.get("class", "").split()
+    if tag == "script":
+        return attrib.get("type") == "application/ld+json"
+    return False
+
+
+class _RegionTarget:
+    """
+    HTML 파서 이벤트 중 기사 영역(_is_region) 안의 이벤트만 트리로 만드는 parser target
+    그 밖의 메뉴/푸터/스크립트 등은 토큰화만 하고 요소로 만들지 않습니다.
+    """
+
+    def __init__(self):
+        self.regions = []
+        self._builder = None
+        self._depth = 0
+
+    def start(self, tag, attrib):
+        if self._builder is None:
+            if not _is_region(tag, attrib):
+                return
+            self._builder = etree.TreeBuilder()
+        self._builder.start(tag, attrib)
+        self._depth += 1
+
+    def end(self, tag):
+        if self._builder is None:
+            return
+        self._builder.end(tag)
+        self._depth -= 1
+        if self._depth == 0:
+            self.regions.append(self._builder.close())
+            self._builder = None
+
+    def data(self, data):
+        if self._builder is not None:
+            self._builder.data(data)
+
+    def comment(self, text):
+        # 주석 앞뒤 텍스트가 하나로 합쳐지지 않도록 주석도 유지
+        if self._builder is not None:
+            self._builder.comment(text)
+
+    def close(self):
+        root = etree.Element("html")
+        root.extend(self.regions)
+        return root
+
+
+def parse_article_regions(raw_html_content: bytes):
+    """
+    기사 영역만 담은 트리를 반환합니다. (영역은 문서 순서대로 루트의 자식이 됨)
+    """
+    parser = etree.HTMLParser(target=_RegionTarget(), encoding="utf-8")
+    return etree.fromstring(raw_html_content, parser=parser)
+
+
+def extract_news(
+    root,
+    original_url: str,
+    crawled_at: datetime,
+) -> News:
+    """
+    lxml 트리에서 News 객체를 추출
+    (raw_transformer._parse_raw_html과 같은 결과를 반환)
+    """
+    # news id
+    if news_id_qs := parse_qs(urlparse(original_url).query).get("newsId"):
+        news_id = int(news_id_qs[0])
+        logger.debug("News ID: %s - Successfully extracted.", news_id)
+    else:
+        logger.error("News ID not found in URL.")
+        raise ValueError("News ID not found in URL.")
+
+    # title
+    if title_tags := _TITLE(root):
+        title = _text(title_tags[0]).strip()
+        logger.debug("Title: '%s' - Successfully extracted.", title)
+    else:
+        logger.error("Title not found.")
+        raise ValueError("Title not found.")
+
+    # subtitles
+    subtitles = []
+    if subtitles_tags := _SUBTITLES(root):
+        # h2의 직계 자식 노드(텍스트/태그)를 문서 순서대로 순회
+        for node in _CHILD_NODES(subtitles_tags[0]):
+            if isinstance(node, str):
+                node_text = _normalize(node)
+            elif isinstance(node.tag, str):
+                node_text = _text(node)
+            else:
+                # 주석 등 태그가 아닌 노드는 텍스트가 없는 것으로 취급
+                continue
+            if node_text != "":
+                subtitles.append(node_text)
+        logger.debug("Subtitles: %s - Successfully extracted.", subtitles)
+    else:
+        logger.debug("No subtitles found.")
+
+    # publisher
+    publisher = ""
+    # lxml 요소의 bool 값은 자식 유무이므로 None 여부로 확인
+    if (publisher_tag := _INFO_SPANS(root)[1]) is not None:
+        publisher = _text(publisher_tag, _TEXT_WITHOUT_I).strip()
+        logger.debug("Publisher: '%s' - Successfully extracted.", publisher)
+    else:
+        logger.warning("No publisher found.")
+
+    # contents
+    if contents_tags := _CONTENTS(root):
+        contents: str = _text(contents_tags[0]).replace("\xa0", "").strip()
+        logger.debug(
+            "Contents: '%s...%s' - Successfully extracted.",
+            contents[:15],
+            contents[-15:],
+        )
+    else:
+        logger.error("Contents not found.")
+        raise ValueError("Contents not found.")
+
+    # images
+    images: list[Image] = []
+    if image_tags := _IMAGES(root):
+        for tag in image_tags:
+            image_url = str(tag.attrib["src"])
+            image_comments = str(tag.attrib["alt"])
+            image = Image(url=image_url, comments=image_comments)
+            images.append(image)
+        logger.debug("Images: %s - Successfully extracted.", images)
+    else:
+        logger.debug("No images found.")
+
+    # __get json data
+    json_data = {}
+    if json_tags := _LD_JSON(root):
+        try:
+            json_data = json.loads(json_tags[0].text or "")
+            # 전체 JSON 문서 출력은 DEBUG 레벨에서만 포맷
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "JSON data: %s - Successfully extracted.",
+                    json.dumps(json_data, indent=2, ensure_ascii=False),
+                )
+        except json.JSONDecodeError as e:
+            logger.error(f"Error decoding JSON data: {e}")
+            raise ValueError(f"Error decoding JSON data: {e}")
+    else:
+        logger.warning("No JSON data found.")
+
+    # tags
+    tags = []
+    if json_data.get("keyword"):
+        tags = json_data["keyword"].split(",")
+        logger.debug("Tags: %s - Successfully extracted.", tags)
+    else:
+        logger.debug("No tags found in JSON data.")
+
+    # published_at
+    published_at = None
+    if json_data.get("datePublished"):
+        try:
+            published_at = datetime.fromisoformat(json_data["datePublished"])
+            logger.debug("Published at: %s - Successfully extracted.", published_at)
+        except ValueError as e:
+            logger.error(f"Error parsing published_at date: {e}")
+            raise ValueError(f"Error parsing published_at date: {e}")
+    else:
+        logger.error("Published date not found in JSON data.")
+        raise ValueError("Published date not found in JSON data.")
+
+    news = News(
+        id=news_id,
+        title=title,
+        subtitles=subtitles,
+        publisher=publisher,
+        contents=contents,
+        images=images,
+        url=original_url,
+        published_at=published_at,
+        crawled_at=crawled_at,
+    )
+
+    return news
+
+
+def _parse_raw_html_lxml(
+    raw_html_content: bytes,
+    original_url: str,
+    crawled_at: datetime,
+) -> News:
+    """
+    Raw HTML을 lxml 트리로 파싱하여 News 객체로 변환
+    """
+    return extract_news(parse_html_tree(raw_html_content), original_url, crawled_at)
+
+
+def _parse_raw_html_partial(
+    raw_html_content: bytes,
+    original_url: str,
+    crawled_at: datetime,
+) -> News:
+    """
+    기사 영역만 트리로 만들어 News 객체로 변환
+    """
+    return extract_news(
+        parse_article_regions(raw_html_content), original_url, crawled_at
+    )
@@ -2,9 +2,73 @@ import asyncio
 import logging
 
 from clients.minio_client import MinioClient
+from utils.compression import DECOMPRESS_ERRORS, decompress
 
 logger = logging.getLogger(__name__)
 
+# 요청한 레코드가 구간(span)의 이 비율 이상을 차지하면 구간 전체를 한 번에 요청
+SHARD_SPAN_MIN_DENSITY = 0.5
+
+
+def _plan_shard_spans(
+    minio_client: MinioClient,
+    minio_bucket_name: str,
+    minio_objects: list[dict],
+) -> dict[str, tuple[int, asyncio.Task]]:
+    """
+    샤드별로 요청할 레코드가 촘촘하면 첫 레코드부터 마지막 레코드까지를
+    하나의 ranged GET으로 내려받도록 예약합니다. (shard_path → (구간 시작 offset, 다운로드 task))
+    """
+    records_by_shard: dict[str, list[dict]] = {}
+    for obj in minio_objects:
+        if "offset" in obj:
+            records_by_shard.setdefault(obj["minio_path"], []).append(obj)
+
+    spans = {}
+    for shard_path, records in records_by_shard.items():
+        if len(records) < 2:
+            continue
+        start = min(record["offset"] for record in records)
+        end = max(record["offset"] + record["length"] for record in records)
+        requested = sum(record["length"] for record in records)
+        if requested >= (end - start) * SHARD_SPAN_MIN_DENSITY:
+            spans[shard_path] = (
+                start,
+                asyncio.create_task(
+                    minio_client.download_file(
+                        minio_bucket_name, shard_path, offset=start, length=end - start
+                    )
+                ),
+            )
+    return spans
+
+
+async def download_raw(
+    minio_client: MinioClient,
+    minio_bucket_name: str,
+    obj: dict,
+    spans: dict[str, tuple[int, asyncio.Task]] | None = None,
+) -> tuple[bytes, dict]:
+    """
+    객체 정보(기사별 객체 또는 샤드 레코드)의 Raw HTML을 내려받습니다. (압축 해제 전)
+    """
+    # 기사별 객체
+    if "offset" not in obj:
+        return await minio_client.download_file(minio_bucket_name, obj["minio_path"])
+
+    # 샤드 레코드: 메타데이터는 객체 정보(manifest)에 기록된 값을 사용
+    metadata = {"crawled_at": obj["crawled_at"], "codec": obj.get("codec")}
+    if spans and (span := spans.get(obj["minio_path"])):
+        span_start, span_task = span
+        span_data, _ = await span_task
+        begin = obj["offset"] - span_start
+        return span_data[begin : begin + obj["length"]], metadata
+
+    data, _ = await minio_client.download_file(
+        minio_bucket_name, obj["minio_path"], offset=obj["offset"], length=obj["length"]
+    )
+    return data, metadata
+
 
 async def extract_raws_from_minio(
     minio_endpoint: str,
@@ -12,11 +76,13 @@ async def extract_raws_from_minio(
     minio_access_key: str,
     minio_secret_key: str,
     minio_objects_to_extract: list[dict],
-    batch_size: int = 5,
-    delay_between_batches: int = 1,
+    max_concurrency: int = 32,
 ) -> list[tuple[str, dict, dict]]:  # (raw_html_content, metadata, original_object_info)
     """
     MinIO에 저장된 Raw HTML 파일을 다운로드합니다.
+    샤드에 저장된 기사(offset/length가 있는 객체)는 ranged GET으로 해당 구간만 요청합니다.
+    압축된 객체는 메타데이터의 codec에 따라 압축을 해제합니다.
+    다운로드는 최대 max_concurrency 개까지 동시에 진행됩니다.
     """
     logger.info("Starting extraction of raw HTML from MinIO.")
 
@@ -26,45 +92,45 @@ async def extract_raws_from_minio(
         access_key=minio_access_key,
         secret_key=minio_secret_key,
         secure=False,
+        max_concurrency=max_concurrency,
     )
 
     extracted_raw_data = []
 
-    for i in range(0, len(minio_objects_to_extract), batch_size):
-        batch_objects = minio_objects_to_extract[i : i + batch_size]
-        logger.info(
-            f"Processing extraction batch {i // batch_size + 1}: {len(batch_objects)} objects."
+    try:
+        spans = _plan_shard_spans(
+            minio_client, minio_bucket_name, minio_objects_to_extract
         )
-
-        tasks = []
-        for obj in batch_objects:
-            object_name = obj["minio_path"]
-            tasks.append(minio_client.download_file(minio_bucket_name, object_name))
-
+        tasks = [
+            download_raw(minio_client, minio_bucket_name, obj, spans)
+            for obj in minio_objects_to_extract
+        ]
         downloaded_results: list[
             tuple[bytes, dict] | BaseException
         ] = await asyncio.gather(*tasks, return_exceptions=True)
+    finally:
+        minio_client.close()
 
-        for j, result in enumerate(downloaded_results):
-            obj = batch_objects[j]  # original_object_info
-            news_id = obj["news_id"]
+    for obj, result in zip(minio_objects_to_extract, downloaded_results):
+        news_id = obj["news_id"]
 
-            if isinstance(result, BaseException):
+        if isinstance(result, BaseException):
+            logger.error(
+                f"Error downloading raw HTML for news ID {news_id} from MinIO: {result}"
+            )
+        else:
+            raw_html_content, metadata = result
+            try:
+                raw_html_content = decompress(raw_html_content, metadata.get("codec"))
+            except DECOMPRESS_ERRORS as e:
                 logger.error(
-                    f"Error downloading raw HTML for news ID {news_id} from MinIO: {result}"
+                    f"Error decompressing raw HTML for news ID {news_id} from MinIO: {e}"
                 )
-            else:
-                raw_html_content, metadata = result
+                continue
 
-                extracted_raw_data.append(
-                    (raw_html_content.decode("utf-8"), metadata, obj)
-                )  # 원본 객체 정보도 함께 반환
-
-        if i + batch_size < len(minio_objects_to_extract):
-            logger.info(
-                f"Waiting for {delay_between_batches} seconds until next extraction batch..."
-            )
-            await asyncio.sleep(delay_between_batches)
+            extracted_raw_data.append(
+                (raw_html_content.decode("utf-8"), metadata, obj)
+            )  # 원본 객체 정보도 함께 반환
 
     logger.info(
         f"Finished extraction of {len(extracted_raw_data)} raw HTML files from MinIO."
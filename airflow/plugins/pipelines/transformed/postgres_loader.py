@@ -1,8 +1,10 @@
-import asyncio
 import logging
+from collections import Counter
 
+import asyncpg
 from clients.postgres_client import PostgresClient
 from models.news import News
+from pydantic import ValidationError
 
 logger = logging.getLogger(__name__)
 
@@ -14,14 +16,27 @@ async def load_transforms_to_postgres(
     pg_user: str,
     pg_password: str,
     pg_dbname: str,
-    batch_size: int = 5,
-    delay_between_batches: int = 1,
-):
+    batch_size: int = 1000,
+    search_index: bool = False,
+    partitioned: bool = False,
+) -> list[int]:
     """
     변환된 News 객체를 PostgreSQL(DW)에 저장합니다.
+    batch_size 행 단위로 COPY + INSERT ... ON CONFLICT 병합을 수행합니다.
+    내용이 바뀌지 않은 기사는 갱신하지 않으며, 추가/갱신/유지 건수를 로그로 남깁니다.
+    search_index=True이면 전문 검색용 컬럼과 인덱스도 생성합니다.
+    partitioned=True이면 news 테이블을 게시월 단위 파티션 테이블로 만들거나 옮깁니다.
+    반환값: 적재에 성공한 뉴스 ID 목록 (실패한 배치는 제외)
     """
     logger.info("Starting loading transformed data to Data Warehouse.")
 
+    parsed_news_items: list[News] = []
+    for news_item in news_items:
+        try:
+            parsed_news_items.append(News.model_validate_json(news_item))
+        except ValidationError as e:
+            logger.error(f"Invalid transformed news item, skipping: {e}")
+
     pg_client = PostgresClient(
         host=pg_host,
         port=pg_port,
@@ -30,40 +45,33 @@ async def load_transforms_to_postgres(
         dbname=pg_dbname,
     )
     await pg_client.connect()
-    await pg_client.create_news_table()
-
-    successfully_loaded_count = 0
+    await pg_client.create_news_table(
+        search_index=search_index, partitioned=partitioned
+    )
 
-    for i in range(0, len(news_items), batch_size):
-        batch_news_items = news_items[i : i + batch_size]
-        logger.info(
-            f"Processing DW loading batch {i // batch_size + 1}: {len(batch_news_items)} articles."
-        )
+    loaded_news_ids: list[int] = []
+    load_counts: Counter = Counter()
 
-        tasks = []
-        for news_item in batch_news_items:
-            tasks.append(
-                pg_client.insert_news(news_item=News.model_validate_json(news_item))
+    try:
+        for i in range(0, len(parsed_news_items), batch_size):
+            batch_news_items = parsed_news_items[i : i + batch_size]
+            logger.info(
+                f"Processing DW loading batch {i // batch_size + 1}: {len(batch_news_items)} articles."
             )
 
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        for j, result in enumerate(results):
-            news_item = batch_news_items[j]
-            if isinstance(result, Exception):
+            news_ids = [news_item.id for news_item in batch_news_items]
+            try:
+                load_counts.update(await pg_client.bulk_insert_news(batch_news_items))
+                loaded_news_ids.extend(news_ids)
+            except (asyncpg.PostgresError, asyncpg.InterfaceError, OSError) as e:
                 logger.error(
-                    f"Error inserting news ID {News.model_validate_json(news_item).id} into PostgreSQL: {result}"
+                    f"Error bulk inserting news IDs {news_ids[0]}..{news_ids[-1]} into PostgreSQL: {e}"
                 )
-            else:
-                successfully_loaded_count += 1
-
-        if i + batch_size < len(news_items):
-            logger.info(
-                f"Waiting for {delay_between_batches} seconds until next DW loading batch..."
-            )
-            await asyncio.sleep(delay_between_batches)
+    finally:
+        await pg_client.close()
 
-    await pg_client.close()
     logger.info(
-        f"Finished loading {successfully_loaded_count} news articles to Data Warehouse."
+        f"Finished loading {len(loaded_news_ids)} news articles to Data Warehouse: "
+        f"{dict(load_counts)}"
     )
+    return loaded_news_ids
@@ -1,12 +1,21 @@
+import asyncio
 import json
 import logging
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from urllib.parse import parse_qs, urlparse
 
 from bs4 import BeautifulSoup
 from models.news import Image, News
+from pipelines.transformed.lxml_extractor import (
+    _parse_raw_html_lxml,
+    _parse_raw_html_partial,
+)
+from utils.log_events import get_event_logger
+from utils.metrics import PipelineMetrics, metrics
 
 logger = logging.getLogger(__name__)
+events = get_event_logger(__name__)
 
 
 def _parse_raw_html(
@@ -22,7 +31,7 @@ def _parse_raw_html(
     # news id
     if news_id_qs := parse_qs(urlparse(original_url).query).get("newsId"):
         news_id = int(news_id_qs[0])
-        logger.info(f"News ID: {news_id} - Successfully extracted.")
+        logger.debug("News ID: %s - Successfully extracted.", news_id)
     else:
         logger.error("News ID not found in URL.")
         raise
@@ -30,7 +39,7 @@ def _parse_raw_html(
     # title
     if title_tag := soup.select_one("div.view_title > h1"):
         title = title_tag.get_text().strip()
-        logger.info(f"Title: '{title}' - Successfully extracted.")
+        logger.debug("Title: '%s' - Successfully extracted.", title)
     else:
         logger.error("Title not found.")
         raise
@@ -41,9 +50,9 @@ def _parse_raw_html(
         subtitles = [
             el.get_text() for el in subtitles_tag.contents if el.get_text() != ""
         ]
-        logger.info(f"Subtitles: {subtitles} - Successfully extracted.")
+        logger.debug("Subtitles: %s - Successfully extracted.", subtitles)
     else:
-        logger.warning("No subtitles found.")
+        logger.debug("No subtitles found.")
 
     # publisher
     publisher = ""
@@ -51,15 +60,17 @@ def _parse_raw_html(
         for i in publisher_tag.select("i"):
             i.decompose()
         publisher = publisher_tag.get_text().strip()
-        logger.info(f"Publisher: '{publisher}' - Successfully extracted.")
+        logger.debug("Publisher: '%s' - Successfully extracted.", publisher)
     else:
         logger.warning("No publisher found.")
 
     # contents
     if contents_tag := soup.select_one("div.view_cont"):
         contents: str = contents_tag.get_text().replace("\xa0", "").strip()
-        logger.info(
-            f"Contents: '{contents[:15]}...{contents[-15:]}' - Successfully extracted."
+        logger.debug(
+            "Contents: '%s...%s' - Successfully extracted.",
+            contents[:15],
+            contents[-15:],
         )
     else:
         logger.error("Contents not found.")
@@ -73,18 +84,21 @@ def _parse_raw_html(
             image_comments = str(tag["alt"])
             image = Image(url=image_url, comments=image_comments)
             images.append(image)
-        logger.info(f"Images: {images} - Successfully extracted.")
+        logger.debug("Images: %s - Successfully extracted.", images)
     else:
-        logger.warning("No images found.")
+        logger.debug("No images found.")
 
     # __get json data
     json_data = {}
     if json_tag := soup.select_one('script[type="application/ld+json"]'):
         try:
             json_data = json.loads(json_tag.get_text())
-            logger.info(
-                f"JSON data: {json.dumps(json_data, indent=2, ensure_ascii=False)} - Successfully extracted."
-            )
+            # 전체 JSON 문서 출력은 DEBUG 레벨에서만 포맷
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "JSON data: %s - Successfully extracted.",
+                    json.dumps(json_data, indent=2, ensure_ascii=False),
+                )
         except json.JSONDecodeError as e:
             logger.error(f"Error decoding JSON data: {e}")
             raise ValueError(f"Error decoding JSON data: {e}")
@@ -95,16 +109,16 @@ def _parse_raw_html(
     tags = []
     if "keyword" in json_data and json_data["keyword"]:
         tags = json_data["keyword"].split(",")
-        logger.info(f"Tags: {tags} - Successfully extracted.")
+        logger.debug("Tags: %s - Successfully extracted.", tags)
     else:
-        logger.warning("No tags found in JSON data.")
+        logger.debug("No tags found in JSON data.")
 
     # published_at
     published_at = None
     if "datePublished" in json_data and json_data["datePublished"]:
         try:
             published_at = datetime.fromisoformat(json_data["datePublished"])
-            logger.info(f"Published at: {published_at} - Successfully extracted.")
+            logger.debug("Published at: %s - Successfully extracted.", published_at)
         except ValueError as e:
             logger.error(f"Error parsing published_at date: {e}")
             raise ValueError(f"Error parsing published_at date: {e}")
@@ -127,47 +141,126 @@ def _parse_raw_html(
     return news
 
 
+# 파싱 엔진
+# - bs4: BeautifulSoup + CSS 선택자
+# - lxml: lxml 트리 + 컴파일된 XPath
+# - partial: 기사 영역만 lxml 트리로 만든 뒤 lxml과 같은 XPath로 추출
+PARSE_ENGINES = {
+    "bs4": _parse_raw_html,
+    "lxml": _parse_raw_html_lxml,
+    "partial": _parse_raw_html_partial,
+}
+
+
+def transform_raw(
+    raw_html_content: str,
+    metadata: dict,
+    original_object_info: dict,
+    engine: str = "bs4",
+) -> str:
+    """
+    다운로드된 Raw HTML 한 건을 News JSON 문자열로 변환합니다.
+    """
+    news_id = original_object_info["news_id"]
+    original_url = original_object_info.get("original_url", "")
+    crawled_at_str = metadata.get("crawled_at")
+
+    crawled_at_from_minio = None
+    if crawled_at_str:
+        try:
+            crawled_at_from_minio = datetime.fromisoformat(crawled_at_str)
+        except ValueError:
+            logger.warning(
+                f"Invalid crawled_at metadata for news ID {news_id}. Using current time."
+            )
+            crawled_at_from_minio = datetime.now()
+    else:
+        logger.warning(
+            f"crawled_at metadata not found for news ID {news_id}. Using current time."
+        )
+        crawled_at_from_minio = datetime.now()  # FALLBACK
+
+    parsed_data: News = PARSE_ENGINES[engine](
+        raw_html_content=raw_html_content.encode("utf-8"),
+        original_url=original_url,
+        crawled_at=crawled_at_from_minio,
+    )
+    events.info(
+        "article_transformed",
+        news_id=parsed_data.id,
+        engine=engine,
+        subtitles=len(parsed_data.subtitles),
+        images=len(parsed_data.images),
+        contents_chars=len(parsed_data.contents),
+        published_at=parsed_data.published_at.isoformat(),
+    )
+    return parsed_data.model_dump_json()
+
+
+def _transform_chunk(
+    chunk: list[tuple[str, dict, dict]],
+    engine: str = "bs4",
+) -> tuple[list[str | None], dict]:
+    """
+    여러 건을 변환합니다. 실패한 기사는 None으로 남겨 다른 기사에 영향을 주지 않습니다.
+    (프로세스 풀의 작업 단위로도 사용되므로 모듈 최상위 함수로 둠)
+    반환값: (변환 결과, 기사별 변환 시간/오류 metrics 상태)
+    """
+    chunk_metrics = PipelineMetrics()
+    results: list[str | None] = []
+    for raw_html_content, metadata, original_object_info in chunk:
+        try:
+            with chunk_metrics.timer("transform"):
+                results.append(
+                    transform_raw(
+                        raw_html_content, metadata, original_object_info, engine
+                    )
+                )
+            chunk_metrics.inc("transform")
+        except Exception as e:
+            logger.error(
+                f"Error transforming news ID {original_object_info['news_id']}: {e}"
+            )
+            results.append(None)
+    return results, chunk_metrics.to_state()
+
+
 async def transform_raws(
     raw_data: list[
         tuple[str, dict, dict]
     ],  # (raw_html_content, metadata, original_object_info)
+    max_workers: int | None = None,
+    chunk_size: int = 50,
+    engine: str = "bs4",
 ) -> list[str]:
     """
     다운로드된 Raw HTML 데이터를 News 객체로 변환합니다.
+    max_workers가 2 이상이면 chunk_size 건씩 나누어 프로세스 풀에서 병렬로 파싱하며,
+    결과는 입력 순서를 유지합니다.
     """
     logger.info("Starting transformation of downloaded HTML.")
 
-    transforms: list[str] = []
-
-    for raw_html_content, metadata, original_object_info in raw_data:
-        news_id = original_object_info["news_id"]
-        original_url = original_object_info.get("original_url", "")
-        crawled_at_str = metadata.get("crawled_at")
-
-        crawled_at_from_minio = None
-        if crawled_at_str:
-            try:
-                crawled_at_from_minio = datetime.fromisoformat(crawled_at_str)
-            except ValueError:
-                logger.warning(
-                    f"Invalid crawled_at metadata for news ID {news_id}. Using current time."
+    if max_workers and max_workers > 1 and len(raw_data) > chunk_size:
+        chunks = [
+            raw_data[i : i + chunk_size] for i in range(0, len(raw_data), chunk_size)
+        ]
+        loop = asyncio.get_running_loop()
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            chunk_results = await asyncio.gather(
+                *(
+                    loop.run_in_executor(executor, _transform_chunk, chunk, engine)
+                    for chunk in chunks
                 )
-                crawled_at_from_minio = datetime.now()
-        else:
-            logger.warning(
-                f"crawled_at metadata not found for news ID {news_id}. Using current time."
             )
-            crawled_at_from_minio = datetime.now()  # FALLBACK
+    else:
+        chunk_results = [_transform_chunk(raw_data, engine)]
 
-        try:
-            parsed_data: News = _parse_raw_html(
-                raw_html_content=raw_html_content.encode("utf-8"),
-                original_url=original_url,
-                crawled_at=crawled_at_from_minio,
-            )
-            transforms.append(parsed_data.model_dump_json())
-        except Exception as e:
-            logger.error(f"Error transforming news ID {news_id}: {e}")
+    results = []
+    for chunk, chunk_metrics_state in chunk_results:
+        results.extend(chunk)
+        metrics.merge_state(chunk_metrics_state)
+
+    transforms: list[str] = [result for result in results if result is not None]
 
     logger.info(f"Finished transformation of {len(transforms)} news articles.")
     return transforms
@@ -0,0 +1,100 @@
+import json
+import logging
+
+from clients.minio_client import MinioClient
+from pipelines.transformed.minio_extractor import extract_raws_from_minio
+from pipelines.transformed.raw_transformer import transform_raws
+
+logger = logging.getLogger(__name__)
+
+
+async def transform_raws_in_minio(
+    minio_endpoint: str,
+    minio_raw_bucket_name: str,
+    minio_transformed_bucket_name: str,
+    minio_access_key: str,
+    minio_secret_key: str,
+    minio_objects_to_transform: list[dict],
+    transformed_object_name: str,
+    chunk_size: int = 500,
+    transform_max_workers: int | None = None,
+    transform_engine: str = "bs4",
+) -> dict:
+    """
+    MinIO의 Raw HTML을 chunk_size 개씩 내려받아 변환하고,
+    변환 결과를 NDJSON 객체 하나로 MinIO에 저장합니다.
+    반환값: 변환 결과 객체의 위치와 뉴스 ID 목록만 담은 manifest
+    """
+    lines: list[str] = []
+
+    for i in range(0, len(minio_objects_to_transform), chunk_size):
+        raw_data = await extract_raws_from_minio(
+            minio_endpoint=minio_endpoint,
+            minio_bucket_name=minio_raw_bucket_name,
+            minio_access_key=minio_access_key,
+            minio_secret_key=minio_secret_key,
+            minio_objects_to_extract=minio_objects_to_transform[i : i + chunk_size],
+        )
+        transforms = await transform_raws(
+            raw_data, max_workers=transform_max_workers, engine=transform_engine
+        )
+        lines.extend(transforms)
+        # 원본 HTML은 다음 chunk 전에 해제
+        del raw_data
+
+    news_ids = [json.loads(line)["id"] for line in lines]
+
+    minio_client = MinioClient(
+        endpoint=minio_endpoint,
+        access_key=minio_access_key,
+        secret_key=minio_secret_key,
+        secure=False,
+    )
+    try:
+        await minio_client.upload_file(
+            bucket_name=minio_transformed_bucket_name,
+            object_name=transformed_object_name,
+            data="\n".join(lines).encode("utf-8"),
+            metadata={"count": str(len(lines))},
+            content_type="application/x-ndjson",
+        )
+    finally:
+        minio_client.close()
+
+    logger.info(
+        f"Stored {len(lines)} transformed news articles to MinIO '{transformed_object_name}'."
+    )
+    return {
+        "minio_path": transformed_object_name,
+        "news_ids": news_ids,
+        "count": len(lines),
+    }
+
+
+async def extract_transforms_from_minio(
+    minio_endpoint: str,
+    minio_transformed_bucket_name: str,
+    minio_access_key: str,
+    minio_secret_key: str,
+    transformed_manifest: dict,
+) -> list[str]:
+    """
+    transform_raws_in_minio가 저장한 NDJSON 객체를 읽어 News JSON 문자열 목록으로 반환합니다.
+    """
+    if not transformed_manifest.get("count"):
+        return []
+
+    minio_client = MinioClient(
+        endpoint=minio_endpoint,
+        access_key=minio_access_key,
+        secret_key=minio_secret_key,
+        secure=False,
+    )
+    try:
+        content, _ = await minio_client.download_file(
+            minio_transformed_bucket_name, transformed_manifest["minio_path"]
+        )
+    finally:
+        minio_client.close()
+
+    return [line for line in content.decode("utf-8").split("\n") if line]
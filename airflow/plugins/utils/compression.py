@@ -0,0 +1,71 @@
+import gzip
+import zlib
+
+try:
+    import zstandard
+except ImportError:  # zstd는 zstandard 패키지가 설치된 경우에만 사용 가능
+    zstandard = None
+
+# 압축하지 않은 객체 (codec 메타데이터가 없는 기존 객체 포함)
+IDENTITY = "identity"
+
+# codec별 객체 이름 접미사와 Content-Type
+# (Content-Encoding을 지정하면 HTTP 클라이언트가 자동으로 압축을 풀 수 있으므로 사용하지 않음)
+CODEC_SUFFIXES = {IDENTITY: "", "gzip": ".gz", "zstd": ".zst"}
+CODEC_CONTENT_TYPES = {"gzip": "application/gzip", "zstd": "application/zstd"}
+
+GZIP_LEVEL = 6
+ZSTD_LEVEL = 3
+
+# 손상되거나 잘린 객체를 decompress할 때 발생하는 예외
+# (gzip.BadGzipFile은 OSError, 잘린 gzip은 EOFError, 알 수 없는 codec은 ValueError)
+DECOMPRESS_ERRORS: tuple[type[Exception], ...] = (
+    OSError,
+    EOFError,
+    ValueError,
+    zlib.error,
+)
+if zstandard is not None:
+    DECOMPRESS_ERRORS += (zstandard.ZstdError,)
+
+
+def validate_codec(codec: str | None) -> str:
+    """
+    설정값을 codec 이름으로 변환하고 사용 가능한지 확인합니다.
+    """
+    codec = (codec or IDENTITY).lower()
+    if codec == "none":
+        codec = IDENTITY
+    if codec not in CODEC_SUFFIXES:
+        raise ValueError(
+            f"Unknown codec: {codec} (available: {', '.join(CODEC_SUFFIXES)})"
+        )
+    if codec == "zstd" and zstandard is None:
+        raise ValueError("zstd codec requires the 'zstandard' package.")
+    return codec
+
+
+def compress(data: bytes, codec: str) -> bytes:
+    if codec == "gzip":
+        # mtime=0: 같은 입력이면 같은 출력
+        return gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+    if codec == "zstd":
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+    return data
+
+
+def decompress(data: bytes, codec: str | None) -> bytes:
+    """
+    codec 메타데이터에 따라 압축을 해제합니다. (codec이 없으면 그대로 반환)
+    """
+    codec = (codec or IDENTITY).lower()
+    if codec == "gzip":
+        return gzip.decompress(data)
+    if codec == "zstd":
+        if zstandard is None:
+            raise ValueError("zstd codec requires the 'zstandard' package.")
+        # 스트리밍 압축으로 만들어진 프레임도 처리
+        return zstandard.ZstdDecompressor().decompressobj().decompress(data)
+    if codec != IDENTITY:
+        raise ValueError(f"Unknown codec: {codec}")
+    return data
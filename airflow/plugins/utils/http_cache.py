@@ -0,0 +1,126 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+class HttpCache:
+    """
+    URL 단위의 디스크 HTTP 캐시
+    ETag/Last-Modified 검증값과 응답 본문을 저장하고,
+    다음 요청에 If-None-Match/If-Modified-Since 헤더를 붙일 수 있게 합니다.
+    전체 크기가 max_bytes를 넘으면 가장 오래 사용되지 않은 항목부터 삭제합니다.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int = 1024 * 1024 * 1024):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.total_bytes = sum(
+            path.stat().st_size for path in self.cache_dir.glob("*.body")
+        )
+
+    @classmethod
+    def from_env(cls) -> "HttpCache | None":
+        """
+        HTTP_CACHE_DIR이 설정된 경우에만 캐시를 생성합니다.
+        """
+        if not (cache_dir := os.getenv("HTTP_CACHE_DIR")):
+            return None
+        return cls(
+            cache_dir=cache_dir,
+            max_bytes=int(os.getenv("HTTP_CACHE_MAX_BYTES", str(1024 * 1024 * 1024))),
+        )
+
+    def _paths(self, url: str) -> tuple[Path, Path]:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{key}.json", self.cache_dir / f"{key}.body"
+
+    def validators(self, url: str) -> dict[str, str]:
+        """
+        조건부 요청에 사용할 헤더를 반환합니다.
+        """
+        meta_path, body_path = self._paths(url)
+        if not meta_path.exists() or not body_path.exists():
+            return {}
+        try:
+            meta = json.loads(meta_path.read_text())
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return headers
+
+    def get_body(self, url: str) -> str | None:
+        """
+        캐시된 본문을 반환하고 사용 시각을 갱신합니다.
+        """
+        _, body_path = self._paths(url)
+        try:
+            body = body_path.read_text(encoding="utf-8")
+        except OSError:
+            return None
+        body_path.touch()
+        return body
+
+    def store(self, url: str, res: httpx.Response) -> None:
+        """
+        검증값(ETag/Last-Modified)이 있는 200 응답만 저장합니다.
+        """
+        etag = res.headers.get("ETag")
+        last_modified = res.headers.get("Last-Modified")
+        if res.status_code != 200 or not (etag or last_modified):
+            return
+
+        meta_path, body_path = self._paths(url)
+        previous_size = body_path.stat().st_size if body_path.exists() else 0
+        body = res.text.encode("utf-8")
+
+        self._write_atomic(body_path, body)
+        self._write_atomic(
+            meta_path,
+            json.dumps(
+                {"url": url, "etag": etag, "last_modified": last_modified}
+            ).encode("utf-8"),
+        )
+        self.total_bytes += len(body) - previous_size
+
+        if self.total_bytes > self.max_bytes:
+            self._evict()
+
+    def _write_atomic(self, path: Path, data: bytes) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def _evict(self) -> None:
+        """
+        전체 크기가 max_bytes의 90% 이하가 될 때까지 오래된 항목을 삭제합니다.
+        """
+        body_paths = sorted(
+            self.cache_dir.glob("*.body"), key=lambda path: path.stat().st_mtime
+        )
+        target_bytes = int(self.max_bytes * 0.9)
+        evicted_count = 0
+        for body_path in body_paths:
+            if self.total_bytes <= target_bytes:
+                break
+            size = body_path.stat().st_size
+            body_path.unlink(missing_ok=True)
+            body_path.with_suffix(".json").unlink(missing_ok=True)
+            self.total_bytes -= size
+            evicted_count += 1
+        logger.info(
+            f"Evicted {evicted_count} entries from HTTP cache ({self.total_bytes} bytes left)."
+        )
@@ -0,0 +1,113 @@
+import logging
+import os
+import random
+import threading
+import time
+
+# 기사/요청 단위 이벤트 샘플링 비율 (0~1)과 이벤트 이름별 초당 최대 출력 수 (0: 제한 없음)
+DEFAULT_SAMPLE_RATE = float(os.getenv("LOG_SAMPLE_RATE", "1.0"))
+DEFAULT_MAX_EVENTS_PER_SECOND = float(os.getenv("LOG_MAX_EVENTS_PER_SECOND", "0"))
+
+
+def _format_value(value) -> str:
+    text = str(value)
+    if text == "" or any(c in text for c in ' ="\n'):
+        escaped = text.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        return f'"{escaped}"'
+    return text
+
+
+class _LogfmtMessage:
+    """
+    핸들러가 실제로 출력할 때만 key=value 문자열로 변환되는 메시지
+    """
+
+    __slots__ = ("event", "fields")
+
+    def __init__(self, event: str, fields: dict):
+        self.event = event
+        self.fields = fields
+
+    def __str__(self) -> str:
+        return " ".join(
+            [f"event={self.event}"]
+            + [f"{key}={_format_value(value)}" for key, value in self.fields.items()]
+        )
+
+
+class EventLogger:
+    """
+    구조화된 이벤트 로그 (event=이름 key=value ...)
+    - 로그 레벨이 꺼져 있으면 필드를 포맷하지 않음
+    - WARNING 미만의 이벤트는 sample_rate 비율만 출력하고,
+      이벤트 이름별로 초당 max_per_second 건까지만 출력 (생략된 건수는 다음 출력에 suppressed로 표시)
+    - 필드는 LogRecord의 event/fields 속성으로도 전달되어 JSON 포매터에서 사용할 수 있음
+    """
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        sample_rate: float = DEFAULT_SAMPLE_RATE,
+        max_per_second: float = DEFAULT_MAX_EVENTS_PER_SECOND,
+    ):
+        self.logger = logger
+        self.sample_rate = sample_rate
+        self.max_per_second = max_per_second
+        self._lock = threading.Lock()
+        # 이벤트 이름 → [현재 1초 구간 시작 시각, 구간 내 출력 수, 생략된 수]
+        self._windows: dict[str, list] = {}
+
+    def _admit(self, event: str) -> tuple[bool, int]:
+        if self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+            return False, 0
+        if self.max_per_second <= 0:
+            return True, 0
+
+        now = time.monotonic()
+        with self._lock:
+            window = self._windows.setdefault(event, [now, 0, 0])
+            if now - window[0] >= 1.0:
+                window[0], window[1] = now, 0
+            if window[1] >= self.max_per_second:
+                window[2] += 1
+                return False, 0
+            window[1] += 1
+            suppressed, window[2] = window[2], 0
+            return True, suppressed
+
+    def log(self, level: int, event: str, **fields) -> None:
+        self._emit(level, event, fields)
+
+    def _emit(self, level: int, event: str, fields: dict) -> None:
+        if not self.logger.isEnabledFor(level):
+            return
+        if level < logging.WARNING:
+            admitted, suppressed = self._admit(event)
+            if not admitted:
+                return
+            if suppressed:
+                fields["suppressed"] = suppressed
+        self.logger.log(
+            level,
+            "%s",
+            _LogfmtMessage(event, fields),
+            extra={"event": event, "fields": fields},
+            # 호출 위치(파일/줄)가 이 모듈이 아닌 호출한 쪽으로 기록되도록 함
+            stacklevel=3,
+        )
+
+    def debug(self, event: str, **fields) -> None:
+        self._emit(logging.DEBUG, event, fields)
+
+    def info(self, event: str, **fields) -> None:
+        self._emit(logging.INFO, event, fields)
+
+    def warning(self, event: str, **fields) -> None:
+        self._emit(logging.WARNING, event, fields)
+
+    def error(self, event: str, **fields) -> None:
+        self._emit(logging.ERROR, event, fields)
+
+
+def get_event_logger(name: str) -> EventLogger:
+    return EventLogger(logging.getLogger(name))
@@ -0,0 +1,280 @@
+import json
+import logging
+import threading
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+# 지연 시간 히스토그램 버킷 상한(초)
+DEFAULT_BUCKETS = (
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+METRIC_PREFIX = "crawler_stage"
+
+
+class Histogram:
+    """
+    Prometheus 방식의 고정 버킷 히스토그램 (버킷별 개수, 합계, 개수)
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.bucket_counts = [0] * (len(buckets) + 1)  # 마지막 칸: +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.bucket_counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q: float) -> float | None:
+        """
+        버킷 안에서 선형 보간한 근사 분위수 (Prometheus histogram_quantile과 같은 방식)
+        """
+        if self.count == 0:
+            return None
+        rank = q * self.count
+        cumulative = 0
+        for i, bucket_count in enumerate(self.bucket_counts):
+            if cumulative + bucket_count >= rank and bucket_count:
+                if i == len(self.buckets):
+                    return self.buckets[-1]
+                lower = self.buckets[i - 1] if i > 0 else 0.0
+                return lower + (self.buckets[i] - lower) * (
+                    (rank - cumulative) / bucket_count
+                )
+            cumulative += bucket_count
+        return self.buckets[-1]
+
+
+class PipelineMetrics:
+    """
+    단계(stage)별 처리 건수, 전송 바이트, 오류 유형별 건수, 지연 시간 히스토그램
+    이벤트 루프와 MinIO 스레드 풀에서 함께 기록할 수 있도록 lock으로 보호합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.started_at = datetime.now()
+            self.items: defaultdict[str, int] = defaultdict(int)
+            self.bytes: defaultdict[str, int] = defaultdict(int)
+            self.errors: defaultdict[tuple[str, str], int] = defaultdict(int)
+            self.durations: defaultdict[str, Histogram] = defaultdict(Histogram)
+
+    def inc(self, stage: str, count: int = 1) -> None:
+        with self._lock:
+            self.items[stage] += count
+
+    def add_bytes(self, stage: str, size: int) -> None:
+        with self._lock:
+            self.bytes[stage] += size
+
+    def record_error(self, stage: str, error: BaseException | str) -> None:
+        error_type = error if isinstance(error, str) else type(error).__name__
+        with self._lock:
+            self.errors[(stage, error_type)] += 1
+
+    def observe(self, stage: str, seconds: float) -> None:
+        with self._lock:
+            self.durations[stage].observe(seconds)
+
+    def to_state(self) -> dict:
+        """
+        다른 프로세스로 전달할 수 있는 dict로 변환 (merge_state로 합침)
+        """
+        with self._lock:
+            return {
+                "items": dict(self.items),
+                "bytes": dict(self.bytes),
+                "errors": [[*key, count] for key, count in self.errors.items()],
+                "durations": {
+                    stage: [histogram.bucket_counts, histogram.sum, histogram.count]
+                    for stage, histogram in self.durations.items()
+                },
+            }
+
+    def merge_state(self, state: dict) -> None:
+        """
+        프로세스 풀 작업자가 기록한 값(to_state)을 합칩니다.
+        """
+        with self._lock:
+            for stage, count in state["items"].items():
+                self.items[stage] += count
+            for stage, size in state["bytes"].items():
+                self.bytes[stage] += size
+            for stage, error_type, count in state["errors"]:
+                self.errors[(stage, error_type)] += count
+            for stage, (bucket_counts, total, count) in state["durations"].items():
+                histogram = self.durations[stage]
+                for i, bucket_count in enumerate(bucket_counts):
+                    histogram.bucket_counts[i] += bucket_count
+                histogram.sum += total
+                histogram.count += count
+
+    @contextmanager
+    def timer(self, stage: str):
+        """
+        with 블록의 소요 시간을 기록하고, 예외가 발생하면 오류 유형별로 집계한 뒤 다시 발생시킵니다.
+        (취소(CancelledError)는 오류로 집계하지 않음)
+        """
+        started_at = time.perf_counter()
+        try:
+            yield
+        except Exception as e:
+            self.record_error(stage, e)
+            raise
+        finally:
+            self.observe(stage, time.perf_counter() - started_at)
+
+    def to_prometheus(self) -> str:
+        """
+        Prometheus text exposition 형식으로 변환
+        """
+        with self._lock:
+            lines = [
+                f"# HELP {METRIC_PREFIX}_items_total Items processed per stage.",
+                f"# TYPE {METRIC_PREFIX}_items_total counter",
+            ]
+            for stage, count in sorted(self.items.items()):
+                lines.append(f'{METRIC_PREFIX}_items_total{{stage="{stage}"}} {count}')
+
+            lines += [
+                f"# HELP {METRIC_PREFIX}_bytes_total Bytes moved per stage.",
+                f"# TYPE {METRIC_PREFIX}_bytes_total counter",
+            ]
+            for stage, size in sorted(self.bytes.items()):
+                lines.append(f'{METRIC_PREFIX}_bytes_total{{stage="{stage}"}} {size}')
+
+            lines += [
+                f"# HELP {METRIC_PREFIX}_errors_total Errors per stage and error type.",
+                f"# TYPE {METRIC_PREFIX}_errors_total counter",
+            ]
+            for (stage, error_type), count in sorted(self.errors.items()):
+                lines.append(
+                    f'{METRIC_PREFIX}_errors_total{{stage="{stage}",error_type="{error_type}"}} {count}'
+                )
+
+            lines += [
+                f"# HELP {METRIC_PREFIX}_duration_seconds Latency per stage.",
+                f"# TYPE {METRIC_PREFIX}_duration_seconds histogram",
+            ]
+            for stage, histogram in sorted(self.durations.items()):
+                cumulative = 0
+                for upper, bucket_count in zip(
+                    (*histogram.buckets, "+Inf"), histogram.bucket_counts
+                ):
+                    cumulative += bucket_count
+                    lines.append(
+                        f'{METRIC_PREFIX}_duration_seconds_bucket{{stage="{stage}",le="{upper}"}} {cumulative}'
+                    )
+                lines.append(
+                    f'{METRIC_PREFIX}_duration_seconds_sum{{stage="{stage}"}} {histogram.sum:.6f}'
+                )
+                lines.append(
+                    f'{METRIC_PREFIX}_duration_seconds_count{{stage="{stage}"}} {histogram.count}'
+                )
+        return "\n".join(lines) + "\n"
+
+    def to_report(self) -> dict:
+        """
+        실행 단위 JSON 리포트 (단계별 요약)
+        """
+        with self._lock:
+            finished_at = datetime.now()
+            stage_names = sorted(
+                set(self.items)
+                | set(self.bytes)
+                | set(self.durations)
+                | {stage for stage, _ in self.errors}
+            )
+            stages: dict[str, dict] = {}
+            for stage in stage_names:
+                histogram = self.durations.get(stage)
+                summary = {
+                    "items": self.items.get(stage, 0),
+                    "bytes": self.bytes.get(stage, 0),
+                    "errors": {
+                        error_type: count
+                        for (error_stage, error_type), count in self.errors.items()
+                        if error_stage == stage
+                    },
+                }
+                if histogram and histogram.count:
+                    quantiles = {
+                        f"p{int(q * 100)}": histogram.quantile(q)
+                        for q in (0.5, 0.95, 0.99)
+                    }
+                    summary["duration_seconds"] = {
+                        "count": histogram.count,
+                        "sum": round(histogram.sum, 6),
+                        "mean": round(histogram.sum / histogram.count, 6),
+                        **{
+                            name: round(value, 6)
+                            for name, value in quantiles.items()
+                            if value is not None
+                        },
+                    }
+                stages[stage] = summary
+        return {
+            "started_at": self.started_at.isoformat(),
+            "finished_at": finished_at.isoformat(),
+            "elapsed_seconds": round(
+                (finished_at - self.started_at).total_seconds(), 3
+            ),
+            "stages": stages,
+        }
+
+    async def upload_report(
+        self,
+        minio_client,
+        minio_bucket_name: str,
+        object_prefix: str,
+        extra: dict | None = None,
+    ) -> str:
+        """
+        JSON 리포트({prefix}.json)와 Prometheus 텍스트({prefix}.prom)를 MinIO에 저장합니다.
+        """
+        report = {**self.to_report(), **(extra or {})}
+        await minio_client.upload_file(
+            bucket_name=minio_bucket_name,
+            object_name=f"{object_prefix}.json",
+            data=json.dumps(report, ensure_ascii=False, indent=2).encode("utf-8"),
+            metadata={},
+            content_type="application/json",
+        )
+        await minio_client.upload_file(
+            bucket_name=minio_bucket_name,
+            object_name=f"{object_prefix}.prom",
+            data=self.to_prometheus().encode("utf-8"),
+            metadata={},
+            content_type="text/plain; version=0.0.4",
+        )
+        logger.info(f"Uploaded metrics report to '{object_prefix}.json'.")
+        return f"{object_prefix}.json"
+
+
+# 프로세스 단위 기본 레지스트리 (실행 시작 시 reset)
+metrics = PipelineMetrics()
@@ -0,0 +1,179 @@
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+# 서버 과부하로 판단하는 응답 코드
+BACKOFF_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """
+    Retry-After 헤더(초 또는 HTTP 날짜)를 대기 시간(초)으로 변환
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class _HostLimiter:
+    """
+    한 호스트에 대한 token bucket + 동시 요청 window
+    """
+
+    def __init__(
+        self,
+        initial_rate: float,
+        initial_concurrency: int,
+    ):
+        self.rate = initial_rate
+        self.window = float(initial_concurrency)
+        self.tokens = 1.0
+        self.in_flight = 0
+        self.last_refill = time.monotonic()
+        self.last_decrease = 0.0
+        self.paused_until = 0.0
+        self.condition = asyncio.Condition()
+
+    def refill(self, now: float) -> None:
+        # burst는 현재 window 크기까지만 허용
+        self.tokens = min(
+            max(1.0, self.window), self.tokens + (now - self.last_refill) * self.rate
+        )
+        self.last_refill = now
+
+
+class Throttle:
+    """
+    AdaptiveRateLimiter.throttle()이 반환하는 요청 단위 기록 객체
+    """
+
+    def __init__(self):
+        self.status_code: int | None = None
+        self.retry_after: float | None = None
+
+
+class AdaptiveRateLimiter:
+    """
+    호스트별 token bucket과 동시 요청 window를 AIMD 방식으로 조절합니다.
+    - 응답이 빠르고 성공하면 rate/window를 조금씩(additive) 늘리고
+    - 429/5xx, 네트워크 오류, 목표 지연 초과 시 절반으로(multiplicative) 줄입니다.
+    - rate와 window는 호스트별 상한(max_rate_per_host, max_concurrency_per_host)을 넘지 않습니다.
+    """
+
+    def __init__(
+        self,
+        initial_rate: float = 2.0,
+        initial_concurrency: int = 2,
+        max_rate_per_host: float = 10.0,
+        max_concurrency_per_host: int = 10,
+        min_rate: float = 0.2,
+        target_latency: float = 2.0,
+        rate_increase: float = 1.0,
+        backoff_factor: float = 0.5,
+    ):
+        self.initial_rate = min(initial_rate, max_rate_per_host)
+        self.initial_concurrency = min(initial_concurrency, max_concurrency_per_host)
+        self.max_rate_per_host = max_rate_per_host
+        self.max_concurrency_per_host = max_concurrency_per_host
+        self.min_rate = min_rate
+        self.target_latency = target_latency
+        self.rate_increase = rate_increase
+        self.backoff_factor = backoff_factor
+        self._hosts: dict[str, _HostLimiter] = {}
+
+    def _host(self, url: str) -> _HostLimiter:
+        host = urlparse(url).netloc
+        if host not in self._hosts:
+            self._hosts[host] = _HostLimiter(
+                initial_rate=self.initial_rate,
+                initial_concurrency=self.initial_concurrency,
+            )
+        return self._hosts[host]
+
+    async def _acquire(self, state: _HostLimiter) -> None:
+        async with state.condition:
+            while True:
+                now = time.monotonic()
+                state.refill(now)
+                if now < state.paused_until:
+                    wait = state.paused_until - now
+                elif state.in_flight >= int(state.window):
+                    wait = None
+                elif state.tokens >= 1.0:
+                    state.tokens -= 1.0
+                    state.in_flight += 1
+                    return
+                else:
+                    wait = (1.0 - state.tokens) / state.rate
+
+                # 토큰이 찰 때까지 또는 다른 요청이 끝날 때까지 대기
+                try:
+                    await asyncio.wait_for(state.condition.wait(), timeout=wait)
+                except TimeoutError:
+                    pass
+
+    async def _release(
+        self, state: _HostLimiter, latency: float, throttle: Throttle, failed: bool
+    ) -> None:
+        async with state.condition:
+            state.in_flight -= 1
+            now = time.monotonic()
+            overloaded = failed or throttle.status_code in BACKOFF_STATUS_CODES
+
+            if overloaded or latency > self.target_latency:
+                # 한 번의 혼잡에 연속으로 줄어들지 않도록 최소 간격을 둠
+                if now - state.last_decrease > self.target_latency:
+                    state.rate = max(self.min_rate, state.rate * self.backoff_factor)
+                    state.window = max(1.0, state.window * self.backoff_factor)
+                    state.last_decrease = now
+                    logger.warning(
+                        f"Backing off: rate={state.rate:.2f}/s, window={int(state.window)} "
+                        f"(status={throttle.status_code}, latency={latency:.2f}s)"
+                    )
+                if throttle.retry_after is not None:
+                    state.paused_until = max(
+                        state.paused_until, now + throttle.retry_after
+                    )
+            else:
+                state.rate = min(
+                    self.max_rate_per_host,
+                    state.rate + self.rate_increase / max(1.0, state.rate),
+                )
+                state.window = min(
+                    float(self.max_concurrency_per_host),
+                    state.window + 1.0 / state.window,
+                )
+
+            state.condition.notify_all()
+
+    @asynccontextmanager
+    async def throttle(self, url: str):
+        """
+        요청 한 건을 rate/window 한도 내에서 실행합니다.
+        블록 안에서 Throttle.status_code(및 retry_after)를 기록하면
+        결과에 따라 다음 요청의 속도가 조절됩니다.
+        """
+        state = self._host(url)
+        await self._acquire(state)
+        throttle = Throttle()
+        started_at = time.monotonic()
+        failed = False
+        try:
+            yield throttle
+        except Exception:
+            failed = throttle.status_code is None
+            raise
+        finally:
+            await self._release(state, time.monotonic() - started_at, throttle, failed)
@@ -0,0 +1,112 @@
+import asyncio
+import json
+from datetime import datetime, timedelta, timezone
+
+import httpx
+from clients.elasticsearch_client import ElasticsearchClient
+from models.news import News
+from pipelines.transformed.elasticsearch_loader import bulk_index_news, es_index_name
+
+KST = timezone(timedelta(hours=9))
+
+
+def make_news(news_id: int, published_at: datetime | None = None) -> News:
+    return News(
+        id=news_id,
+        title=f"제목 {news_id}",
+        subtitles=[],
+        publisher="문화체육관광부",
+        contents="본문",
+        images=[],
+        url=f"https://www.korea.kr/news/policyNewsView.do?newsId={news_id}",
+        published_at=published_at or datetime(2025, 7, 14, 10, tzinfo=KST),
+        crawled_at=datetime(2025, 7, 14, 12, tzinfo=KST),
+    )
+
+
+def bulk_ids(request: httpx.Request) -> list[str]:
+    """
+    _bulk 요청 본문의 action 줄에서 문서 ID 목록을 가져옵니다.
+    """
+    lines = request.content.decode("utf-8").splitlines()
+    return [json.loads(line)["update"]["_id"] for line in lines[::2]]
+
+
+def bulk_response(results: dict[str, tuple[int, dict]]) -> httpx.Response:
+    """
+    문서 ID별 (status, 추가 필드)로 _bulk 응답을 만듭니다.
+    """
+    items = [
+        {"update": {"_id": doc_id, "status": status, **fields}}
+        for doc_id, (status, fields) in results.items()
+    ]
+    errors = any(status >= 300 for status, _ in results.values())
+    return httpx.Response(200, json={"errors": errors, "items": items})
+
+
+def run_bulk_index(handler, news_items: list[News]) -> dict[str, int]:
+    async def run():
+        es_client = ElasticsearchClient(
+            host="http://elasticsearch:9200",
+            transport=httpx.MockTransport(handler),
+        )
+        try:
+            return await bulk_index_news(es_client, news_items, retry_backoff=0)
+        finally:
+            await es_client.close()
+
+    return asyncio.run(run())
+
+
+def test_bulk_index_retries_only_rejected_documents():
+    requests: list[list[str]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        ids = bulk_ids(request)
+        requests.append(ids)
+        if len(requests) == 1:
+            return bulk_response(
+                {
+                    "1": (201, {"result": "created"}),
+                    "2": (429, {"error": {"type": "es_rejected_execution_exception"}}),
+                }
+            )
+        return bulk_response({doc_id: (200, {"result": "updated"}) for doc_id in ids})
+
+    counts = run_bulk_index(handler, [make_news(1), make_news(2)])
+
+    assert requests == [["1", "2"], ["2"]]
+    assert counts == {"created": 1, "updated": 1}
+
+
+def test_bulk_index_does_not_retry_mapping_failure():
+    requests: list[list[str]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(bulk_ids(request))
+        return bulk_response(
+            {
+                "1": (201, {"result": "created"}),
+                "2": (
+                    400,
+                    {
+                        "error": {
+                            "type": "document_parsing_exception",
+                            "reason": "failed to parse field [published_at]",
+                        }
+                    },
+                ),
+            }
+        )
+
+    counts = run_bulk_index(handler, [make_news(1), make_news(2)])
+
+    assert requests == [["1", "2"]]
+    assert counts == {"created": 1, "failed": 1}
+
+
+def test_es_index_name_uses_utc_publish_date():
+    # Logstash는 @timestamp(게시일)의 UTC 날짜로 인덱스를 정함
+    news = make_news(1, published_at=datetime(2025, 8, 1, 1, tzinfo=KST))
+
+    assert es_index_name(news) == "korea-policy-news-2025.07.31"
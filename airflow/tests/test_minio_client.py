@@ -0,0 +1,126 @@
+import asyncio
+import socket
+
+import pytest
+from clients.minio_client import MinioClient
+from moto.server import ThreadedMotoServer
+
+
+@pytest.fixture
+def s3_endpoint():
+    """
+    로컬 S3 stand-in(moto 서버)을 띄우고 host:port를 반환합니다.
+    """
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    server = ThreadedMotoServer(ip_address="127.0.0.1", port=port, verbose=False)
+    server.start()
+    try:
+        yield f"127.0.0.1:{port}"
+    finally:
+        server.stop()
+
+
+def make_client(endpoint: str, max_concurrency: int = 4) -> MinioClient:
+    return MinioClient(
+        endpoint=endpoint,
+        access_key="testing",
+        secret_key="testing",
+        secure=False,
+        max_concurrency=max_concurrency,
+    )
+
+
+def test_ensure_bucket_creates_bucket_once(s3_endpoint):
+    minio_client = make_client(s3_endpoint)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("bucket check should be cached")
+
+    async def run():
+        await minio_client.ensure_bucket("raw-news")
+        assert minio_client.client.bucket_exists("raw-news")
+        minio_client.client.bucket_exists = fail
+        await minio_client.ensure_bucket("raw-news")
+
+    try:
+        asyncio.run(run())
+    finally:
+        minio_client.close()
+
+
+def test_upload_and_download_round_trip(s3_endpoint):
+    minio_client = make_client(s3_endpoint)
+
+    async def run():
+        await minio_client.upload_file(
+            bucket_name="raw-news",
+            object_name="2025/07/14/1_120000.html",
+            data="<html>본문</html>".encode(),
+            metadata={"Codec": "gzip", "Publisher": "korea.kr"},
+            content_type="text/html",
+        )
+        return await minio_client.download_file("raw-news", "2025/07/14/1_120000.html")
+
+    try:
+        data, metadata = asyncio.run(run())
+    finally:
+        minio_client.close()
+
+    assert data.decode("utf-8") == "<html>본문</html>"
+    # 메타데이터 키는 소문자로 통일
+    assert metadata == {"codec": "gzip", "publisher": "korea.kr"}
+
+
+def test_download_file_requests_byte_range(s3_endpoint):
+    minio_client = make_client(s3_endpoint)
+
+    async def run():
+        await minio_client.upload_file(
+            bucket_name="raw-news",
+            object_name="shards/0001.pack",
+            data=b"aaaabbbbbbcc",
+            metadata={},
+        )
+        return await minio_client.download_file(
+            "raw-news", "shards/0001.pack", offset=4, length=6
+        )
+
+    try:
+        data, _ = asyncio.run(run())
+    finally:
+        minio_client.close()
+
+    assert data == b"bbbbbb"
+
+
+def test_concurrent_uploads_run_on_executor(s3_endpoint):
+    minio_client = make_client(s3_endpoint, max_concurrency=4)
+    object_names = [f"2025/07/14/{news_id}.html" for news_id in range(20)]
+
+    async def run():
+        await asyncio.gather(
+            *(
+                minio_client.upload_file(
+                    bucket_name="raw-news",
+                    object_name=object_name,
+                    data=object_name.encode("utf-8"),
+                    metadata={},
+                )
+                for object_name in object_names
+            )
+        )
+        return await asyncio.gather(
+            *(
+                minio_client.download_file("raw-news", object_name)
+                for object_name in object_names
+            )
+        )
+
+    try:
+        results = asyncio.run(run())
+    finally:
+        minio_client.close()
+
+    assert [data.decode("utf-8") for data, _ in results] == object_names
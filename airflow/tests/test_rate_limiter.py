@@ -0,0 +1,107 @@
+import asyncio
+import time
+from itertools import pairwise
+
+import httpx
+from pipelines.raw.raw_scraper import request_with_retries
+from utils.rate_limiter import AdaptiveRateLimiter
+
+URL = "https://www.korea.kr/news/policyNewsView.do?newsId=148900000"
+
+
+def run_requests(handler, rate_limiter: AdaptiveRateLimiter, count: int = 1, **kwargs):
+    """
+    MockTransport로 같은 URL에 count번 요청하고 응답 상태 코드 목록을 반환합니다.
+    """
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            responses = [
+                await request_with_retries(
+                    client, "GET", URL, rate_limiter=rate_limiter, **kwargs
+                )
+                for _ in range(count)
+            ]
+        return [res.status_code for res in responses]
+
+    return asyncio.run(run())
+
+
+def test_retry_after_pauses_host_and_halves_rate():
+    rate_limiter = AdaptiveRateLimiter(initial_rate=4.0, initial_concurrency=4)
+    requested_at: list[float] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested_at.append(time.monotonic())
+        if len(requested_at) == 1:
+            return httpx.Response(429, headers={"Retry-After": "0.3"})
+        return httpx.Response(200, text="ok")
+
+    assert run_requests(handler, rate_limiter, max_retries=1) == [200]
+
+    # 재시도는 Retry-After 동안 보내지 않음
+    assert requested_at[1] - requested_at[0] >= 0.3
+    state = rate_limiter._host(URL)
+    assert state.rate < 4.0
+    assert state.window < 4.0
+
+
+def test_successful_responses_recover_additively():
+    rate_limiter = AdaptiveRateLimiter(
+        initial_rate=80.0,
+        initial_concurrency=8,
+        max_rate_per_host=100.0,
+        max_concurrency_per_host=10,
+    )
+    statuses = iter([503] + [200] * 20)
+    # 각 요청 직전의 (rate, window)
+    history: list[tuple[float, float]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        state = rate_limiter._host(URL)
+        history.append((state.rate, state.window))
+        return httpx.Response(next(statuses))
+
+    run_requests(handler, rate_limiter, count=20, max_retries=1)
+    state = rate_limiter._host(URL)
+    history.append((state.rate, state.window))
+
+    # 503 한 번에 절반으로 줄어든 뒤
+    assert history[:2] == [(80.0, 8.0), (40.0, 4.0)]
+    # 성공할 때마다 조금씩(1 / 현재 값) 늘어나고 상한을 넘지 않음
+    for (rate, window), (next_rate, next_window) in pairwise(history[1:]):
+        assert rate < next_rate <= min(100.0, rate + 1.0 / rate)
+        assert window < next_window <= min(10.0, window + 1.0 / window)
+
+
+def test_concurrency_is_capped_per_host():
+    rate_limiter = AdaptiveRateLimiter(
+        initial_rate=1000.0,
+        initial_concurrency=3,
+        max_rate_per_host=1000.0,
+        max_concurrency_per_host=3,
+    )
+    in_flight = 0
+    max_in_flight = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, text="ok")
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            await asyncio.gather(
+                *(
+                    request_with_retries(client, "GET", URL, rate_limiter=rate_limiter)
+                    for _ in range(30)
+                )
+            )
+
+    asyncio.run(run())
+
+    assert max_in_flight == 3
+    assert rate_limiter._host(URL).in_flight == 0
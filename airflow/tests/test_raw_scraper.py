@@ -0,0 +1,71 @@
+import asyncio
+
+import httpx
+from pipelines.raw.raw_scraper import scrap_raw_html_batch
+from utils.rate_limiter import AdaptiveRateLimiter
+
+BASE_URL = "https://www.korea.kr/news/policyNewsView.do?newsId="
+
+
+def test_batch_returns_articles_in_input_order_and_skips_failures():
+    page_urls = [f"{BASE_URL}{news_id}" for news_id in range(1, 11)]
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        news_id = int(request.url.params["newsId"])
+        # 앞의 URL일수록 늦게 응답
+        await asyncio.sleep(0.001 * (10 - news_id))
+        if news_id == 4:
+            return httpx.Response(404)
+        return httpx.Response(200, text=f"<html>{news_id}</html>")
+
+    rate_limiter = AdaptiveRateLimiter(initial_rate=1000.0, max_rate_per_host=1000.0)
+    articles = asyncio.run(
+        scrap_raw_html_batch(
+            page_urls,
+            rate_limiter=rate_limiter,
+            max_retries=0,
+            transport=httpx.MockTransport(handler),
+        )
+    )
+
+    assert [news_id for _, _, news_id in articles] == [1, 2, 3, 5, 6, 7, 8, 9, 10]
+    assert articles[0] == ("<html>1</html>", page_urls[0], 1)
+
+
+def test_batch_runs_a_fixed_worker_pool():
+    page_urls = [f"{BASE_URL}{news_id}" for news_id in range(1, 41)]
+    in_flight = 0
+    max_in_flight = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.005)
+        in_flight -= 1
+        return httpx.Response(200, text="<html></html>")
+
+    async def run():
+        tasks_before = len(asyncio.all_tasks())
+        scraping = asyncio.create_task(
+            scrap_raw_html_batch(
+                page_urls,
+                rate_limiter=AdaptiveRateLimiter(
+                    initial_rate=1000.0,
+                    initial_concurrency=4,
+                    max_rate_per_host=1000.0,
+                    max_concurrency_per_host=4,
+                ),
+                transport=httpx.MockTransport(handler),
+            )
+        )
+        await asyncio.sleep(0.01)
+        # URL 수와 관계없이 워커 수(동시 요청 상한)만큼의 태스크만 생성
+        pending_tasks = len(asyncio.all_tasks()) - tasks_before - 1
+        return pending_tasks, await scraping
+
+    pending_tasks, articles = asyncio.run(run())
+
+    assert pending_tasks == 4
+    assert len(articles) == 40
+    assert max_in_flight <= 4